@@ -4,6 +4,11 @@ import os
 from fastapi import FastAPI
 
 from services.database import create_db_and_tables
+from services.export_executor import EXPORT_EXECUTOR
+from services.image_cache import IMAGE_CACHE
+from services.libreoffice_pool import LIBREOFFICE_POOL
+from services.pdf_rasterizer import PDF_RASTERIZER
+from services.presentation_job_worker import get_presentation_job_worker_pool
 from utils.get_env import get_app_data_directory_env
 from utils.model_availability import (
     check_llm_and_image_provider_api_or_model_availability,
@@ -25,4 +30,14 @@ async def app_lifespan(_: FastAPI):
     # Initialize built-in PPTX templates for Smart Templates
     init_builtin_templates_if_needed()
 
+    # Picks up queued jobs, including the ones interrupted by a restart
+    job_worker_pool = get_presentation_job_worker_pool()
+    job_worker_pool.start()
+
     yield
+
+    await job_worker_pool.stop()
+    EXPORT_EXECUTOR.shutdown()
+    PDF_RASTERIZER.shutdown()
+    await IMAGE_CACHE.close()
+    await LIBREOFFICE_POOL.close()
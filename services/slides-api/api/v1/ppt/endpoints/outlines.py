@@ -19,6 +19,7 @@ from models.sse_response import (
 from services.temp_file_service import TEMP_FILE_SERVICE
 from services.database import get_async_session
 from services.documents_loader import DocumentsLoader
+from services.llm_rate_limiter import set_llm_request_owner
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from utils.ppt_utils import get_presentation_title_from_outlines
 
@@ -37,6 +38,8 @@ async def stream_outlines(
     temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
 
     async def inner():
+        set_llm_request_owner(str(id))
+
         yield SSEStatusResponse(
             status="Generating presentation outlines..."
         ).to_string()
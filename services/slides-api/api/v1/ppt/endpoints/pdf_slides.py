@@ -1,15 +1,21 @@
 import os
 import shutil
 import tempfile
-import subprocess
 from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from models.sse_response import (
+    SSECompleteResponse,
+    SSEErrorResponse,
+    SSESlideReadyResponse,
+)
 from services.documents_loader import DocumentsLoader
-from utils.asset_directory_utils import get_images_directory
+from services.pdf_rasterizer import PDF_RASTERIZER
+from utils.slide_screenshot_utils import save_slide_screenshot
 import uuid
-from constants.documents import PDF_MIME_TYPES
+from constants.documents import PDF_MIME_TYPES, SLIDE_SCREENSHOT_SIZE
 
 
 PDF_SLIDES_ROUTER = APIRouter(prefix="/pdf-slides", tags=["PDF Slides"])
@@ -26,22 +32,7 @@ class PdfSlidesResponse(BaseModel):
     total_slides: int
 
 
-@PDF_SLIDES_ROUTER.post("/process", response_model=PdfSlidesResponse)
-async def process_pdf_slides(
-    pdf_file: UploadFile = File(..., description="PDF file to process")
-):
-    """
-    Process a PDF file to extract slide screenshots.
-
-    This endpoint:
-    1. Validates the uploaded PDF file
-    2. Uses ImageMagick to convert PDF pages to PNG images
-    3. Returns screenshot URLs for each slide/page
-
-    Note: Font installation is not needed since PDFs already have fonts embedded.
-    """
-
-    # Validate PDF file
+def _validate_pdf_file(pdf_file: UploadFile):
     if pdf_file.content_type not in PDF_MIME_TYPES:
         raise HTTPException(
             status_code=400,
@@ -58,52 +49,57 @@ async def process_pdf_slides(
             detail="PDF file exceeded max upload size of 100 MB",
         )
 
+
+async def _save_pdf_file(pdf_file: UploadFile, temp_dir: str) -> str:
+    pdf_path = os.path.join(temp_dir, "presentation.pdf")
+    with open(pdf_path, "wb") as f:
+        pdf_content = await pdf_file.read()
+        f.write(pdf_content)
+    return pdf_path
+
+
+@PDF_SLIDES_ROUTER.post("/process", response_model=PdfSlidesResponse)
+async def process_pdf_slides(
+    pdf_file: UploadFile = File(..., description="PDF file to process")
+):
+    """
+    Process a PDF file to extract slide screenshots.
+
+    This endpoint:
+    1. Validates the uploaded PDF file
+    2. Renders the PDF pages to PNG images
+    3. Returns screenshot URLs for each slide/page
+
+    Note: Font installation is not needed since PDFs already have fonts embedded.
+    """
+    _validate_pdf_file(pdf_file)
+
     # Create temporary directory for processing
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
             # Save uploaded PDF file
-            pdf_path = os.path.join(temp_dir, "presentation.pdf")
-            with open(pdf_path, "wb") as f:
-                pdf_content = await pdf_file.read()
-                f.write(pdf_content)
+            pdf_path = await _save_pdf_file(pdf_file, temp_dir)
 
-            # Generate screenshots from PDF using ImageMagick
+            # Generate screenshots from PDF
             screenshot_paths = await DocumentsLoader.get_page_images_from_pdf_async(
-                pdf_path, temp_dir
+                pdf_path,
+                temp_dir,
+                width=SLIDE_SCREENSHOT_SIZE,
+                height=SLIDE_SCREENSHOT_SIZE,
             )
             print(f"Generated {len(screenshot_paths)} PDF screenshots")
 
             # Move screenshots to images directory and generate URLs
-            images_dir = get_images_directory()
             presentation_id = uuid.uuid4()
-            presentation_images_dir = os.path.join(images_dir, str(presentation_id))
-            os.makedirs(presentation_images_dir, exist_ok=True)
-
-            slides_data = []
-
-            for i, screenshot_path in enumerate(screenshot_paths, 1):
-                # Move screenshot to permanent location
-                screenshot_filename = f"slide_{i}.png"
-                permanent_screenshot_path = os.path.join(
-                    presentation_images_dir, screenshot_filename
-                )
-
-                if (
-                    os.path.exists(screenshot_path)
-                    and os.path.getsize(screenshot_path) > 0
-                ):
-                    # Use shutil.copy2 instead of os.rename to handle cross-device moves
-                    shutil.copy2(screenshot_path, permanent_screenshot_path)
-                    screenshot_url = (
-                        f"/app_data/images/{presentation_id}/{screenshot_filename}"
-                    )
-                else:
-                    # Fallback if screenshot generation failed or file is empty placeholder
-                    screenshot_url = "/static/images/placeholder.jpg"
-
-                slides_data.append(
-                    PdfSlideData(slide_number=i, screenshot_url=screenshot_url)
+            slides_data = [
+                PdfSlideData(
+                    slide_number=i,
+                    screenshot_url=save_slide_screenshot(
+                        screenshot_path, presentation_id, i
+                    ),
                 )
+                for i, screenshot_path in enumerate(screenshot_paths, 1)
+            ]
 
             return PdfSlidesResponse(
                 success=True, slides=slides_data, total_slides=len(slides_data)
@@ -114,3 +110,58 @@ async def process_pdf_slides(
             raise HTTPException(
                 status_code=500, detail=f"Failed to process PDF: {str(e)}"
             )
+
+
+@PDF_SLIDES_ROUTER.post("/process/stream")
+async def stream_process_pdf_slides(
+    pdf_file: UploadFile = File(..., description="PDF file to process")
+):
+    """
+    Streaming variant of /process, as server-sent events.
+
+    Emits a slide_ready event with the slide data of every page as soon as
+    its screenshot is rendered (not necessarily in page order), then a
+    complete event with the total slide count.
+    """
+    _validate_pdf_file(pdf_file)
+
+    # Uploaded files are only readable while the request is handled
+    temp_dir = tempfile.mkdtemp()
+    try:
+        pdf_path = await _save_pdf_file(pdf_file, temp_dir)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    async def inner():
+        try:
+            presentation_id = uuid.uuid4()
+            total_slides = 0
+            async for index, screenshot_path in PDF_RASTERIZER.iter_rasterize(
+                pdf_path,
+                os.path.join(temp_dir, "pages"),
+                width=SLIDE_SCREENSHOT_SIZE,
+                height=SLIDE_SCREENSHOT_SIZE,
+                range_size=1,
+            ):
+                slide_data = PdfSlideData(
+                    slide_number=index + 1,
+                    screenshot_url=save_slide_screenshot(
+                        screenshot_path, presentation_id, index + 1
+                    ),
+                )
+                total_slides += 1
+                yield SSESlideReadyResponse(
+                    index=index, slide=slide_data.model_dump(mode="json")
+                ).to_string()
+
+            yield SSECompleteResponse(
+                key="result", value={"success": True, "total_slides": total_slides}
+            ).to_string()
+        except Exception as e:
+            print(f"Error processing PDF slides: {str(e)}")
+            yield SSEErrorResponse(detail=f"Failed to process PDF: {str(e)}").to_string()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return StreamingResponse(inner(), media_type="text/event-stream")
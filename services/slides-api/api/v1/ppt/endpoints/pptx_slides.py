@@ -2,20 +2,29 @@ import os
 import shutil
 import zipfile
 import tempfile
-import subprocess
 import uuid
-from typing import List, Optional, Dict
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import Awaitable, Callable, List, Optional, Dict
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import aiohttp
 import asyncio
 import xml.etree.ElementTree as ET
 import re
 
+from models.sse_response import (
+    SSECompleteResponse,
+    SSEErrorResponse,
+    SSESlideReadyResponse,
+    SSEStatusResponse,
+)
 from services.documents_loader import DocumentsLoader
-from utils.asset_directory_utils import get_images_directory
+from services.libreoffice_pool import LIBREOFFICE_POOL
+from services.pdf_rasterizer import PDF_RASTERIZER
+from services.process_runner import PROCESS_RUNNER, ProcessError
+from utils.slide_screenshot_utils import save_slide_screenshot
 import uuid
-from constants.documents import POWERPOINT_TYPES
+from constants.documents import POWERPOINT_TYPES, SLIDE_SCREENSHOT_SIZE
 
 
 PPTX_SLIDES_ROUTER = APIRouter(prefix="/pptx-slides", tags=["PPTX Slides"])
@@ -286,23 +295,7 @@ async def analyze_fonts_in_all_slides(slide_xmls: List[str]) -> FontAnalysisResu
     )
 
 
-@PPTX_SLIDES_ROUTER.post("/process", response_model=PptxSlidesResponse)
-async def process_pptx_slides(
-    pptx_file: UploadFile = File(..., description="PPTX file to process"),
-    fonts: Optional[List[UploadFile]] = File(None, description="Optional font files"),
-):
-    """
-    Process a PPTX file to extract slide screenshots and XML content.
-
-    This endpoint:
-    1. Validates the uploaded PPTX file
-    2. Installs any provided font files
-    3. Unzips the PPTX to extract slide XMLs
-    4. Uses LibreOffice to generate slide screenshots
-    5. Returns both screenshot URLs and XML content for each slide
-    """
-
-    # Validate PPTX file
+def _validate_pptx_file(pptx_file: UploadFile):
     if pptx_file.content_type not in POWERPOINT_TYPES:
         raise HTTPException(
             status_code=400,
@@ -319,89 +312,186 @@ async def process_pptx_slides(
             detail="PPTX file exceeded max upload size of 100 MB",
         )
 
+
+async def _save_pptx_file(pptx_file: UploadFile, temp_dir: str) -> str:
+    pptx_path = os.path.join(temp_dir, "presentation.pptx")
+    with open(pptx_path, "wb") as f:
+        pptx_content = await pptx_file.read()
+        f.write(pptx_content)
+    return pptx_path
+
+
+def _get_slide_data(
+    slide_number: int, screenshot_url: str, xml_content: str
+) -> SlideData:
+    # Compute normalized fonts for this slide
+    raw_slide_fonts = extract_fonts_from_oxml(xml_content)
+    normalized_fonts = sorted(
+        {normalize_font_family_name(f) for f in raw_slide_fonts if f}
+    )
+    return SlideData(
+        slide_number=slide_number,
+        screenshot_url=screenshot_url,
+        xml_content=xml_content,
+        normalized_fonts=normalized_fonts,
+    )
+
+
+@PPTX_SLIDES_ROUTER.post("/process", response_model=PptxSlidesResponse)
+async def process_pptx_slides(
+    request: Request,
+    pptx_file: UploadFile = File(..., description="PPTX file to process"),
+    fonts: Optional[List[UploadFile]] = File(None, description="Optional font files"),
+):
+    """
+    Process a PPTX file to extract slide screenshots and XML content.
+
+    This endpoint:
+    1. Validates the uploaded PPTX file
+    2. Installs any provided font files
+    3. Unzips the PPTX to extract slide XMLs
+    4. Uses LibreOffice to generate slide screenshots
+    5. Returns both screenshot URLs and XML content for each slide
+    """
+    _validate_pptx_file(pptx_file)
+
     # Create temporary directory for processing
     with tempfile.TemporaryDirectory() as temp_dir:
-        if True:
-            # Save uploaded PPTX file
-            pptx_path = os.path.join(temp_dir, "presentation.pptx")
-            with open(pptx_path, "wb") as f:
-                pptx_content = await pptx_file.read()
-                f.write(pptx_content)
-
-            # Install fonts if provided
-            if fonts:
-                await _install_fonts(fonts, temp_dir)
-
-            # Extract slide XMLs from PPTX
-            slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
+        # Save uploaded PPTX file
+        pptx_path = await _save_pptx_file(pptx_file, temp_dir)
+
+        # Install fonts if provided
+        if fonts:
+            await _install_fonts(await _save_fonts(fonts, temp_dir))
 
+        # Extract slide XMLs from PPTX
+        slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
+
+        # Analyze fonts across all slides while the slides are rendered
+        font_analysis_task = asyncio.create_task(
+            analyze_fonts_in_all_slides(slide_xmls)
+        )
+        try:
             # Convert PPTX to PDF
-            pdf_path = await _convert_pptx_to_pdf(pptx_path, temp_dir)
+            pdf_path = await _convert_pptx_to_pdf(
+                pptx_path, temp_dir, request.is_disconnected
+            )
 
-            # Generate screenshots using LibreOffice
+            # Generate screenshots from the PDF
             screenshot_paths = await DocumentsLoader.get_page_images_from_pdf_async(
-                pdf_path, temp_dir
+                pdf_path,
+                temp_dir,
+                width=SLIDE_SCREENSHOT_SIZE,
+                height=SLIDE_SCREENSHOT_SIZE,
             )
             print(f"Screenshot paths: {screenshot_paths}")
 
-            # Analyze fonts across all slides
-            font_analysis = await analyze_fonts_in_all_slides(slide_xmls)
-            print(
-                f"Font analysis completed: {len(font_analysis.internally_supported_fonts)} supported, {len(font_analysis.not_supported_fonts)} not supported"
-            )
+            font_analysis = await font_analysis_task
+        finally:
+            font_analysis_task.cancel()
+        print(
+            f"Font analysis completed: {len(font_analysis.internally_supported_fonts)} supported, {len(font_analysis.not_supported_fonts)} not supported"
+        )
 
-            # Move screenshots to images directory and generate URLs
-            images_dir = get_images_directory()
-            presentation_id = uuid.uuid4()
-            presentation_images_dir = os.path.join(images_dir, str(presentation_id))
-            os.makedirs(presentation_images_dir, exist_ok=True)
+        # Move screenshots to images directory and generate URLs
+        presentation_id = uuid.uuid4()
+        slides_data = []
 
-            slides_data = []
+        for i, (xml_content, screenshot_path) in enumerate(
+            zip(slide_xmls, screenshot_paths), 1
+        ):
+            screenshot_url = save_slide_screenshot(screenshot_path, presentation_id, i)
+            slides_data.append(_get_slide_data(i, screenshot_url, xml_content))
 
-            for i, (xml_content, screenshot_path) in enumerate(
-                zip(slide_xmls, screenshot_paths), 1
-            ):
-                # Move screenshot to permanent location
-                screenshot_filename = f"slide_{i}.png"
-                permanent_screenshot_path = os.path.join(
-                    presentation_images_dir, screenshot_filename
-                )
+        return PptxSlidesResponse(
+            success=True,
+            slides=slides_data,
+            total_slides=len(slides_data),
+            fonts=font_analysis,
+        )
 
-                if (
-                    os.path.exists(screenshot_path)
-                    and os.path.getsize(screenshot_path) > 0
-                ):
-                    # Use shutil.copy2 instead of os.rename to handle cross-device moves
-                    shutil.copy2(screenshot_path, permanent_screenshot_path)
-                    screenshot_url = (
-                        f"/app_data/images/{presentation_id}/{screenshot_filename}"
-                    )
-                else:
-                    # Fallback if screenshot generation failed or file is empty placeholder
-                    screenshot_url = "/static/images/placeholder.jpg"
-
-                # Compute normalized fonts for this slide
-                raw_slide_fonts = extract_fonts_from_oxml(xml_content)
-                normalized_fonts = sorted(
-                    {normalize_font_family_name(f) for f in raw_slide_fonts if f}
-                )
 
-                slides_data.append(
-                    SlideData(
-                        slide_number=i,
-                        screenshot_url=screenshot_url,
-                        xml_content=xml_content,
-                        normalized_fonts=normalized_fonts,
-                    )
-                )
+@PPTX_SLIDES_ROUTER.post("/process/stream")
+async def stream_process_pptx_slides(
+    request: Request,
+    pptx_file: UploadFile = File(..., description="PPTX file to process"),
+    fonts: Optional[List[UploadFile]] = File(None, description="Optional font files"),
+):
+    """
+    Streaming variant of /process, as server-sent events.
+
+    Emits a slide_ready event with the slide data of every slide as soon as
+    its screenshot is rendered (not necessarily in slide order), then a
+    complete event with the total slide count and the font analysis.
+    """
+    _validate_pptx_file(pptx_file)
+
+    # Uploaded files are only readable while the request is handled
+    temp_dir = tempfile.mkdtemp()
+    try:
+        pptx_path = await _save_pptx_file(pptx_file, temp_dir)
+        font_paths = await _save_fonts(fonts, temp_dir) if fonts else []
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    async def inner():
+        font_analysis_task = None
+        try:
+            if font_paths:
+                yield SSEStatusResponse(status="Installing fonts").to_string()
+                await _install_fonts(font_paths)
 
-            return PptxSlidesResponse(
-                success=True,
-                slides=slides_data,
-                total_slides=len(slides_data),
-                fonts=font_analysis,
+            slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
+            font_analysis_task = asyncio.create_task(
+                analyze_fonts_in_all_slides(slide_xmls)
             )
 
+            yield SSEStatusResponse(status="Converting slides").to_string()
+            pdf_path = await _convert_pptx_to_pdf(
+                pptx_path, temp_dir, request.is_disconnected
+            )
+
+            yield SSEStatusResponse(status="Rendering slides").to_string()
+            presentation_id = uuid.uuid4()
+            async for index, screenshot_path in PDF_RASTERIZER.iter_rasterize(
+                pdf_path,
+                os.path.join(temp_dir, "pages"),
+                width=SLIDE_SCREENSHOT_SIZE,
+                height=SLIDE_SCREENSHOT_SIZE,
+                range_size=1,
+            ):
+                if index >= len(slide_xmls):
+                    continue
+                screenshot_url = save_slide_screenshot(
+                    screenshot_path, presentation_id, index + 1
+                )
+                slide_data = _get_slide_data(
+                    index + 1, screenshot_url, slide_xmls[index]
+                )
+                yield SSESlideReadyResponse(
+                    index=index, slide=slide_data.model_dump(mode="json")
+                ).to_string()
+
+            font_analysis = await font_analysis_task
+            yield SSECompleteResponse(
+                key="result",
+                value={
+                    "success": True,
+                    "total_slides": len(slide_xmls),
+                    "fonts": font_analysis.model_dump(mode="json"),
+                },
+            ).to_string()
+        except Exception as e:
+            print(f"Error processing PPTX slides: {str(e)}")
+            yield SSEErrorResponse(detail=f"Failed to process PPTX: {str(e)}").to_string()
+        finally:
+            if font_analysis_task:
+                font_analysis_task.cancel()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return StreamingResponse(inner(), media_type="text/event-stream")
+
 
 # NEW: Fonts-only endpoint leveraging the same font extraction/analysis
 @PPTX_FONTS_ROUTER.post("/process", response_model=PptxFontsResponse)
@@ -440,72 +530,53 @@ async def process_pptx_fonts(
         )
 
 
-def _create_font_alias_config(raw_fonts: List[str]) -> str:
-    """Create a temporary fontconfig configuration that aliases variant family names to normalized root families.
-    Returns the path to the config file.
-    """
-    # Build mapping from raw -> normalized where different
+def _get_font_aliases(raw_fonts: List[str]) -> Dict[str, str]:
+    """Map variant family names to their normalized root families."""
     mappings: Dict[str, str] = {}
     for f in raw_fonts:
         normalized = normalize_font_family_name(f)
         if normalized and normalized != f:
             mappings[f] = normalized
-    # Create config only if we have mappings
-    fd, fonts_conf_path = tempfile.mkstemp(prefix="fonts_alias_", suffix=".conf")
-    os.close(fd)
-    with open(fonts_conf_path, "w", encoding="utf-8") as cfg:
-        cfg.write(
-            """<?xml version='1.0'?>
-<!DOCTYPE fontconfig SYSTEM "urn:fontconfig:fonts.dtd">
-<fontconfig>
-  <include>/etc/fonts/fonts.conf</include>
-"""
-        )
-        for src, dst in mappings.items():
-            cfg.write(
-                f"""
-  <match target="pattern">
-    <test name="family" compare="eq">
-      <string>{src}</string>
-    </test>
-    <edit name="family" mode="assign" binding="strong">
-      <string>{dst}</string>
-    </edit>
-  </match>
-"""
-            )
-        cfg.write("\n</fontconfig>\n")
-    return fonts_conf_path
+    return mappings
 
 
-async def _install_fonts(fonts: List[UploadFile], temp_dir: str) -> None:
-    """Install provided font files to the system."""
+async def _save_fonts(fonts: List[UploadFile], temp_dir: str) -> List[str]:
+    """Save the provided font files, returns their paths."""
     fonts_dir = os.path.join(temp_dir, "fonts")
     os.makedirs(fonts_dir, exist_ok=True)
 
+    font_paths = []
     for font_file in fonts:
-        # Save font file
         font_path = os.path.join(fonts_dir, font_file.filename)
         with open(font_path, "wb") as f:
             font_content = await font_file.read()
             f.write(font_content)
+        font_paths.append(font_path)
+    return font_paths
+
 
+async def _install_fonts(font_paths: List[str]) -> None:
+    """Install saved font files to the system."""
+    for font_path in font_paths:
         # Install font (copy to system fonts directory)
         try:
-            subprocess.run(
-                ["cp", font_path, "/usr/share/fonts/truetype/"],
-                check=True,
-                capture_output=True,
+            await PROCESS_RUNNER.run(
+                ["cp", font_path, "/usr/share/fonts/truetype/"], timeout=30
+            )
+        except ProcessError as e:
+            print(
+                f"Warning: Failed to install font {os.path.basename(font_path)}: {e}"
             )
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Failed to install font {font_file.filename}: {e}")
 
     # Refresh font cache
     try:
-        subprocess.run(["fc-cache", "-f", "-v"], check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
+        await PROCESS_RUNNER.run(["fc-cache", "-f", "-v"], timeout=120)
+    except ProcessError as e:
         print(f"Warning: Failed to refresh font cache: {e}")
 
+    # Running LibreOffice instances only see the new fonts after a restart
+    LIBREOFFICE_POOL.recycle()
+
 
 def _extract_slide_xmls(pptx_path: str, temp_dir: str) -> List[str]:
     """Extract slide XML content from PPTX file."""
@@ -543,7 +614,11 @@ def _extract_slide_xmls(pptx_path: str, temp_dir: str) -> List[str]:
         raise Exception(f"Failed to extract slide XMLs: {str(e)}")
 
 
-async def _convert_pptx_to_pdf(pptx_path: str, temp_dir: str) -> str:
+async def _convert_pptx_to_pdf(
+    pptx_path: str,
+    temp_dir: str,
+    is_cancelled: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> str:
     """Generate PNG screenshots of PPTX slides using LibreOffice + ImageMagick."""
     screenshots_dir = os.path.join(temp_dir, "screenshots")
     os.makedirs(screenshots_dir, exist_ok=True)
@@ -553,59 +628,23 @@ async def _convert_pptx_to_pdf(pptx_path: str, temp_dir: str) -> str:
         slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
         slide_count = len(slide_xmls)
 
-        # Build font alias config to force variant families to resolve to normalized root families
+        # Build font aliases to force variant families to resolve to normalized root families
         raw_fonts: List[str] = []
         for xml in slide_xmls:
             raw_fonts.extend(extract_fonts_from_oxml(xml))
-        raw_fonts = list({f for f in raw_fonts if f})
-        fonts_conf_path = _create_font_alias_config(raw_fonts)
-        env = os.environ.copy()
-        env["FONTCONFIG_FILE"] = fonts_conf_path
+        font_aliases = _get_font_aliases(list({f for f in raw_fonts if f}))
 
         print(f"Found {slide_count} slides in presentation")
 
-        # Step 1: Convert PPTX to PDF using LibreOffice
+        # Step 1: Convert PPTX to PDF using a warm LibreOffice instance
         print("Starting LibreOffice PDF conversion...")
-        pdf_filename = "temp_presentation.pdf"
-        pdf_path = os.path.join(screenshots_dir, pdf_filename)
-
-        try:
-            # Use 'soffice' on macOS, 'libreoffice' on Linux
-            import shutil
-            libreoffice_cmd = shutil.which("soffice") or shutil.which("libreoffice") or "libreoffice"
-
-            result = subprocess.run(
-                [
-                    libreoffice_cmd,
-                    "--headless",
-                    "--convert-to",
-                    "pdf",
-                    "--outdir",
-                    screenshots_dir,
-                    pptx_path,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=500,
-                env=env,
-            )
-
-            print(f"LibreOffice PDF conversion output: {result.stdout}")
-            if result.stderr:
-                print(f"LibreOffice PDF conversion warnings: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            raise Exception("LibreOffice PDF conversion timed out after 120 seconds")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            raise Exception(f"LibreOffice PDF conversion failed: {error_msg}")
-
-        # Find the generated PDF file (LibreOffice uses original filename)
-        pdf_files = [f for f in os.listdir(screenshots_dir) if f.endswith(".pdf")]
-        if not pdf_files:
-            raise Exception("LibreOffice failed to generate PDF file")
-
-        actual_pdf_path = os.path.join(screenshots_dir, pdf_files[0])
+        actual_pdf_path = await LIBREOFFICE_POOL.convert(
+            pptx_path,
+            screenshots_dir,
+            "pdf",
+            font_aliases=font_aliases,
+            is_cancelled=is_cancelled,
+        )
         print(f"Generated PDF: {actual_pdf_path}")
         return actual_pdf_path
 
@@ -20,7 +20,9 @@ from sqlmodel import Session, select
 
 from services.database import engine
 from models.sql.template import PptxTemplateModel
+from services.design_system_cache import DESIGN_SYSTEM_CACHE
 from services.pptx_template_service import PPTX_TEMPLATE_SERVICE
+from services.slide_thumbnail_generator import THUMBNAIL_GENERATOR
 from utils.datetime_utils import get_current_utc_datetime
 
 
@@ -153,6 +155,10 @@ async def upload_pptx_template(
             session.add(template)
             session.commit()
 
+            DESIGN_SYSTEM_CACHE.refresh(template)
+
+        THUMBNAIL_GENERATOR.schedule(result["file_path"], result["id"])
+
         return TemplateUploadResponse(
             id=result["id"],
             name=name,
@@ -330,7 +336,9 @@ async def delete_template(template_id: str):
         session.add(template)
         session.commit()
 
-        return {"message": "Template deleted successfully"}
+    THUMBNAIL_GENERATOR.cleanup(template_id)
+
+    return {"message": "Template deleted successfully"}
 
 
 @router.post("/{template_id}/analyze")
@@ -357,6 +365,8 @@ async def reanalyze_template(template_id: str):
         session.add(template)
         session.commit()
 
+        DESIGN_SYSTEM_CACHE.refresh(template)
+
         return {
             "message": "Template re-analyzed successfully",
             "placeholder_count": len(analysis["placeholder_mapping"]),
@@ -1,22 +1,28 @@
 import asyncio
 from datetime import datetime
-import json
 import math
 import os
 import random
 import traceback
 from typing import Annotated, List, Literal, Optional, Tuple
 import dirtyjson
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Path
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from constants.presentation import DEFAULT_TEMPLATES
+from constants.presentation import (
+    DEFAULT_TEMPLATES,
+    MAX_CONCURRENT_SLIDE_GENERATIONS,
+    OUTLINES_PER_LAYOUT_SELECTION,
+)
 from enums.webhook_event import WebhookEvent
 from models.api_error_model import APIErrorModel
 from models.generate_presentation_request import GeneratePresentationRequest
-from models.presentation_and_path import PresentationPathAndEditPath
+from models.presentation_and_path import (
+    PresentationAndPath,
+    PresentationPathAndEditPath,
+)
 from models.presentation_from_template import EditPresentationRequest
 from models.presentation_outline_model import (
     PresentationOutlineModel,
@@ -25,7 +31,7 @@ from models.presentation_outline_model import (
 from enums.tone import Tone
 from enums.verbosity import Verbosity
 from models.pptx_models import PptxPresentationModel
-from models.presentation_layout import PresentationLayoutModel
+from models.presentation_layout import PresentationLayoutModel, SlideLayoutModel
 from models.presentation_structure_model import PresentationStructureModel
 from models.presentation_with_slides import (
     PresentationWithSlides,
@@ -37,16 +43,40 @@ from services.webhook_service import WebhookService
 from utils.get_layout_by_name import get_layout_by_name
 from services.image_generation_service import ImageGenerationService
 from utils.dict_utils import deep_update
-from utils.export_utils import export_presentation
+from utils.outline_stream_parser import SlideOutlineStreamParser
+from utils.presentation_utils import get_presentation_with_slides
+from utils.export_utils import export_pptx, export_presentation, get_pptx_export_path
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
+from models.sql.image_asset import ImageAsset
 from models.sql.slide import SlideModel
-from models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
+from models.sse_response import (
+    SSECompleteResponse,
+    SSEErrorResponse,
+    SSESlideReadyResponse,
+)
 
 from services.database import get_async_session
 from services.temp_file_service import TEMP_FILE_SERVICE
 from services.concurrent_service import CONCURRENT_SERVICE
+from services.llm_rate_limiter import set_llm_request_owner
+from services.presentation_checkpoint_service import (
+    EXPORT_STAGE,
+    OUTLINES_STAGE,
+    SAVED_STAGE,
+    STRUCTURE_STAGE,
+    PresentationCheckpointService,
+    get_slide_assets_stage,
+    get_slide_content_stage,
+)
+from services.presentation_job_queue import PRESENTATION_JOB_QUEUE
+from services.presentation_job_worker import (
+    get_presentation_job_max_attempts,
+    get_presentation_job_worker_pool,
+)
+from models.sql.presentation_generation_job import PresentationGenerationJobModel
 from models.sql.presentation import PresentationModel
 from services.pptx_presentation_creator import PptxPresentationCreator
+from services.export_stream import create_export_streaming_response
 from models.sql.async_presentation_generation_status import (
     AsyncPresentationGenerationTaskModel,
 )
@@ -63,6 +93,7 @@ from utils.ppt_utils import (
 )
 from utils.process_slides import (
     process_slide_add_placeholder_assets,
+    PresentationAssetPlanner,
     process_slide_and_fetch_assets,
 )
 import uuid
@@ -100,18 +131,7 @@ async def get_all_presentations(sql_session: AsyncSession = Depends(get_async_se
 async def get_presentation(
     id: uuid.UUID, sql_session: AsyncSession = Depends(get_async_session)
 ):
-    presentation = await sql_session.get(PresentationModel, id)
-    if not presentation:
-        raise HTTPException(404, "Presentation not found")
-    slides = await sql_session.scalars(
-        select(SlideModel)
-        .where(SlideModel.presentation == id)
-        .order_by(SlideModel.index)
-    )
-    return PresentationWithSlides(
-        **presentation.model_dump(),
-        slides=slides,
-    )
+    return await get_presentation_with_slides(id, sql_session)
 
 
 @PRESENTATION_ROUTER.delete("/{id}", status_code=204)
@@ -274,8 +294,11 @@ async def stream_presentation(
         )
 
     image_generation_service = ImageGenerationService(get_images_directory())
+    asset_planner = PresentationAssetPlanner(image_generation_service)
 
     async def inner():
+        set_llm_request_owner(str(id))
+
         structure = presentation.get_structure()
         layout = presentation.get_layout()
         outline = presentation.get_presentation_outline()
@@ -283,56 +306,75 @@ async def stream_presentation(
         # These tasks will be gathered and awaited after all slides are generated
         async_assets_generation_tasks = []
 
-        slides: List[SlideModel] = []
-        yield SSEResponse(
-            event="response",
-            data=json.dumps({"type": "chunk", "chunk": '{ "slides": [ '}),
-        ).to_string()
-        for i, slide_layout_index in enumerate(structure.slides):
-            slide_layout = layout.slides[slide_layout_index]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLIDE_GENERATIONS)
 
-            try:
+        async def generate_slide_content(index: int, slide_layout_index: int):
+            async with semaphore:
                 slide_content = await get_slide_content_from_type_and_outline(
-                    slide_layout,
-                    outline.slides[i],
+                    layout.slides[slide_layout_index],
+                    outline.slides[index],
                     presentation.language,
                     presentation.tone,
                     presentation.verbosity,
                     presentation.instructions,
                 )
-            except HTTPException as e:
-                yield SSEErrorResponse(detail=e.detail).to_string()
-                return
-
-            slide = SlideModel(
-                presentation=id,
-                layout_group=layout.name,
-                layout=slide_layout.id,
-                index=i,
-                speaker_note=slide_content.get("__speaker_note__", ""),
-                content=slide_content,
-            )
-            slides.append(slide)
+                return index, slide_content
 
-            # This will mutate slide and add placeholder assets
-            process_slide_add_placeholder_assets(slide)
+        content_tasks = [
+            asyncio.create_task(generate_slide_content(i, slide_layout_index))
+            for i, slide_layout_index in enumerate(structure.slides)
+        ]
 
-            # This will mutate slide
-            async_assets_generation_tasks.append(
-                process_slide_and_fetch_assets(image_generation_service, slide)
-            )
+        # Slides are generated concurrently and each one is sent as soon as it
+        # is ready, with its index since they arrive out of order
+        generated_slides: dict[int, SlideModel] = {}
+        try:
+            for content_task in asyncio.as_completed(content_tasks):
+                try:
+                    i, slide_content = await content_task
+                except HTTPException as e:
+                    yield SSEErrorResponse(detail=e.detail).to_string()
+                    return
+
+                slide_layout = layout.slides[structure.slides[i]]
+                slide = SlideModel(
+                    presentation=id,
+                    layout_group=layout.name,
+                    layout=slide_layout.id,
+                    index=i,
+                    speaker_note=slide_content.get("__speaker_note__", ""),
+                    content=slide_content,
+                )
+                generated_slides[i] = slide
 
-            yield SSEResponse(
-                event="response",
-                data=json.dumps({"type": "chunk", "chunk": slide.model_dump_json()}),
-            ).to_string()
+                # This will mutate slide and add placeholder assets
+                process_slide_add_placeholder_assets(slide)
 
-        yield SSEResponse(
-            event="response",
-            data=json.dumps({"type": "chunk", "chunk": " ] }"}),
-        ).to_string()
+                # This will mutate slide
+                async_assets_generation_tasks.append(
+                    process_slide_and_fetch_assets(
+                        image_generation_service, slide, asset_planner
+                    )
+                )
+
+                yield SSESlideReadyResponse(
+                    index=i, slide=slide.model_dump(mode="json")
+                ).to_string()
+        finally:
+            # Stops remaining generations on error or client disconnect
+            for content_task in content_tasks:
+                content_task.cancel()
+
+        slides: List[SlideModel] = [
+            generated_slides[i] for i in range(len(structure.slides))
+        ]
 
-        generated_assets_lists = await asyncio.gather(*async_assets_generation_tasks)
+        try:
+            generated_assets_lists = await asyncio.gather(
+                *async_assets_generation_tasks
+            )
+        finally:
+            asset_planner.cancel()
         generated_assets = []
         for assets_list in generated_assets_lists:
             generated_assets.extend(assets_list)
@@ -408,17 +450,35 @@ async def export_presentation_as_pptx(
     temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
 
     pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
-    await pptx_creator.create_ppt()
 
     export_directory = get_exports_directory()
     pptx_path = os.path.join(
         export_directory, f"{pptx_model.name or uuid.uuid4()}.pptx"
     )
-    pptx_creator.save(pptx_path)
+    await pptx_creator.create_and_save(pptx_path)
 
     return pptx_path
 
 
+@PRESENTATION_ROUTER.post("/export/pptx/stream")
+async def stream_presentation_as_pptx(
+    pptx_model: Annotated[PptxPresentationModel, Body()],
+    save: Annotated[
+        bool, Query(description="Also save the file in the exports directory")
+    ] = False,
+):
+    temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
+
+    pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
+
+    filename = f"{pptx_model.name or uuid.uuid4()}.pptx"
+    return await create_export_streaming_response(
+        pptx_creator.create_and_save,
+        filename,
+        os.path.join(get_exports_directory(), filename) if save else None,
+    )
+
+
 @PRESENTATION_ROUTER.post("/export", response_model=PresentationPathAndEditPath)
 async def export_presentation_as_pptx_or_pdf(
     id: Annotated[uuid.UUID, Body(description="Presentation ID to export")],
@@ -444,6 +504,30 @@ async def export_presentation_as_pptx_or_pdf(
     )
 
 
+@PRESENTATION_ROUTER.post("/export/stream")
+async def stream_presentation_export(
+    id: Annotated[
+        uuid.UUID, Body(embed=True, description="Presentation ID to export")
+    ],
+    save: Annotated[
+        bool, Query(description="Also save the file in the exports directory")
+    ] = False,
+    sql_session: AsyncSession = Depends(get_async_session),
+):
+    presentation = await sql_session.get(PresentationModel, id)
+
+    if not presentation:
+        raise HTTPException(status_code=404, detail="Presentation not found")
+
+    title = presentation.title or str(uuid.uuid4())
+    save_path = get_pptx_export_path(title)
+    return await create_export_streaming_response(
+        lambda path: export_pptx(id, title, output_path=path),
+        os.path.basename(save_path),
+        save_path if save else None,
+    )
+
+
 async def check_if_api_request_is_valid(
     request: GeneratePresentationRequest,
     sql_session: AsyncSession = Depends(get_async_session),
@@ -492,15 +576,103 @@ async def generate_presentation_handler(
     presentation_id: uuid.UUID,
     async_status: Optional[AsyncPresentationGenerationTaskModel],
     sql_session: AsyncSession = Depends(get_async_session),
+    trigger_failure_webhook: bool = True,
 ):
+    """
+    Generates the outlines, structure, slide contents and assets of a
+    presentation, resuming from the checkpoints of previous attempts.
+
+    Slide contents are generated while the outlines are still streaming.
+    Layouts of unordered templates, which include the built-in ones, are
+    selected for a few streamed outlines at a time.
+    """
+    set_llm_request_owner(str(presentation_id))
+
+    # Slide contents started while outlines are still being streamed
+    pipelined_content_tasks: dict[int, asyncio.Task] = {}
+    layout_selection_tasks: List[asyncio.Task] = []
+    asset_planner: Optional[PresentationAssetPlanner] = None
+
+    # Queued jobs resume from the stages completed by previous attempts
+    checkpoints = PresentationCheckpointService(
+        presentation_id, enabled=async_status is not None
+    )
+
     try:
+        await checkpoints.load()
+
         using_slides_markdown = False
 
         if request.slides_markdown:
             using_slides_markdown = True
             request.n_slides = len(request.slides_markdown)
 
-        if not using_slides_markdown:
+        # Parse Layouts
+        layout_model = await get_layout_by_name(request.template)
+        total_slide_layouts = len(layout_model.slides)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLIDE_GENERATIONS)
+
+        async def generate_slide_content(
+            index: int,
+            slide_layout: SlideLayoutModel,
+            slide_outline: SlideOutlineModel,
+        ):
+            stage = get_slide_content_stage(index)
+            checkpoint = checkpoints.get(stage)
+            if checkpoint and checkpoint["layout"] == slide_layout.id:
+                return checkpoint["content"]
+
+            async with semaphore:
+                slide_content = await get_slide_content_from_type_and_outline(
+                    slide_layout,
+                    slide_outline,
+                    request.language,
+                    request.tone.value,
+                    request.verbosity.value,
+                    request.instructions,
+                )
+            await checkpoints.save(
+                stage, {"layout": slide_layout.id, "content": slide_content}
+            )
+            return slide_content
+
+        async def select_slide_layouts(
+            first_outline_index: int, slide_outlines: List[SlideOutlineModel]
+        ) -> List[int]:
+            if layout_model.ordered:
+                layout_indices = [
+                    first_outline_index + offset
+                    for offset in range(len(slide_outlines))
+                ]
+            else:
+                layout_indices = (
+                    await generate_presentation_structure(
+                        PresentationOutlineModel(slides=slide_outlines),
+                        layout_model,
+                        request.instructions,
+                    )
+                ).slides
+            return [
+                (
+                    layout_indices[offset]
+                    if offset < len(layout_indices)
+                    and 0 <= layout_indices[offset] < total_slide_layouts
+                    else random.randint(0, total_slide_layouts - 1)
+                )
+                for offset in range(len(slide_outlines))
+            ]
+
+        pipelined_structure: Optional[PresentationStructureModel] = None
+
+        outlines_checkpoint = checkpoints.get(OUTLINES_STAGE)
+        if outlines_checkpoint:
+            presentation_outlines = PresentationOutlineModel(
+                **outlines_checkpoint["outlines"]
+            )
+            total_outlines = outlines_checkpoint["total_outlines"]
+
+        elif not using_slides_markdown:
             additional_context = ""
 
             # Updating async status
@@ -532,6 +704,44 @@ async def generate_presentation_handler(
                     (request.n_slides - needed_toc_count) / 10
                 )
 
+            # Contents are generated as soon as the layouts of their outlines are
+            # selected, while the rest of the outlines is streaming. Unordered
+            # layouts are selected for a few outlines at a time
+            outline_parser = SlideOutlineStreamParser()
+            outlines_per_layout_selection = (
+                1 if layout_model.ordered else OUTLINES_PER_LAYOUT_SELECTION
+            )
+            streamed_outlines: List[SlideOutlineModel] = []
+            n_selected_outlines = 0
+
+            # Table of contents slides are inserted after the title slide
+            n_toc_slides = 0
+            if (
+                request.include_table_of_contents
+                and select_toc_or_list_slide_layout_index(layout_model) != -1
+            ):
+                n_toc_slides = request.n_slides - n_slides_to_generate
+            first_toc_slide_index = 1 if request.include_title_slide else 0
+
+            async def pipeline_slide_contents(
+                first_outline_index: int, slide_outlines: List[SlideOutlineModel]
+            ) -> List[int]:
+                layout_indices = await select_slide_layouts(
+                    first_outline_index, slide_outlines
+                )
+                for offset, slide_outline in enumerate(slide_outlines):
+                    index = first_outline_index + offset
+                    if index >= first_toc_slide_index:
+                        index += n_toc_slides
+                    pipelined_content_tasks[index] = asyncio.create_task(
+                        generate_slide_content(
+                            index,
+                            layout_model.slides[layout_indices[offset]],
+                            slide_outline,
+                        )
+                    )
+                return layout_indices
+
             presentation_outlines_text = ""
             async for chunk in generate_ppt_outline(
                 request.content,
@@ -550,6 +760,34 @@ async def generate_presentation_handler(
 
                 presentation_outlines_text += chunk
 
+                if not outline_parser:
+                    continue
+                try:
+                    parsed_outlines = outline_parser.feed(chunk)
+                except Exception:
+                    # Remaining layouts are selected once outlines are complete
+                    traceback.print_exc()
+                    outline_parser = None
+                    continue
+
+                for slide_outline in parsed_outlines:
+                    if len(streamed_outlines) >= n_slides_to_generate:
+                        break
+                    streamed_outlines.append(slide_outline)
+                    if (
+                        len(streamed_outlines) - n_selected_outlines
+                        == outlines_per_layout_selection
+                    ):
+                        layout_selection_tasks.append(
+                            asyncio.create_task(
+                                pipeline_slide_contents(
+                                    n_selected_outlines,
+                                    streamed_outlines[n_selected_outlines:],
+                                )
+                            )
+                        )
+                        n_selected_outlines = len(streamed_outlines)
+
             try:
                 presentation_outlines_json = dict(
                     dirtyjson.loads(presentation_outlines_text)
@@ -565,6 +803,28 @@ async def generate_presentation_handler(
             )
             total_outlines = n_slides_to_generate
 
+            pipelined_layouts: List[int] = []
+            for layout_selection_task in layout_selection_tasks:
+                pipelined_layouts.extend(await layout_selection_task)
+            remaining_outlines = presentation_outlines.slides[
+                len(pipelined_layouts) : total_outlines
+            ]
+            if remaining_outlines:
+                pipelined_layouts.extend(
+                    await pipeline_slide_contents(
+                        len(pipelined_layouts), remaining_outlines
+                    )
+                )
+            pipelined_structure = PresentationStructureModel(slides=pipelined_layouts)
+
+            await checkpoints.save(
+                OUTLINES_STAGE,
+                {
+                    "outlines": presentation_outlines.model_dump(),
+                    "total_outlines": total_outlines,
+                },
+            )
+
         else:
             # Setting outlines to slides markdown
             presentation_outlines = PresentationOutlineModel(
@@ -585,12 +845,13 @@ async def generate_presentation_handler(
         print("-" * 40)
         print(f"Generated {total_outlines} outlines for the presentation")
 
-        # Parse Layouts
-        layout_model = await get_layout_by_name(request.template)
-        total_slide_layouts = len(layout_model.slides)
-
         # Generate Structure
-        if layout_model.ordered:
+        structure_checkpoint = checkpoints.get(STRUCTURE_STAGE)
+        if structure_checkpoint:
+            presentation_structure = PresentationStructureModel(**structure_checkpoint)
+        elif pipelined_structure:
+            presentation_structure = pipelined_structure
+        elif layout_model.ordered:
             presentation_structure = layout_model.to_presentation_structure()
         else:
             presentation_structure: PresentationStructureModel = (
@@ -605,12 +866,15 @@ async def generate_presentation_handler(
         presentation_structure.slides = presentation_structure.slides[:total_outlines]
         for index in range(total_outlines):
             random_slide_index = random.randint(0, total_slide_layouts - 1)
-            if index >= total_outlines:
+            if index >= len(presentation_structure.slides):
                 presentation_structure.slides.append(random_slide_index)
                 continue
             if presentation_structure.slides[index] >= total_slide_layouts:
                 presentation_structure.slides[index] = random_slide_index
 
+        if not structure_checkpoint:
+            await checkpoints.save(STRUCTURE_STAGE, presentation_structure.model_dump())
+
         # Injecting table of contents to the presentation structure and outlines
         if request.include_table_of_contents and not using_slides_markdown:
             n_toc_slides = request.n_slides - total_outlines
@@ -671,8 +935,45 @@ async def generate_presentation_handler(
             await sql_session.commit()
 
         image_generation_service = ImageGenerationService(get_images_directory())
+        asset_planner = PresentationAssetPlanner(image_generation_service)
         async_assets_generation_tasks = []
 
+        async def fetch_slide_assets(slide: SlideModel) -> List[ImageAsset]:
+            stage = get_slide_assets_stage(slide.index)
+            checkpoint = checkpoints.get(stage)
+            if checkpoint and checkpoint["layout"] == slide.layout:
+                slide.content = checkpoint["content"]
+                return [
+                    ImageAsset(
+                        id=uuid.UUID(asset["id"]),
+                        path=asset["path"],
+                        is_uploaded=asset["is_uploaded"],
+                        extras=asset["extras"],
+                    )
+                    for asset in checkpoint["assets"]
+                ]
+
+            assets = await process_slide_and_fetch_assets(
+                image_generation_service, slide, asset_planner
+            )
+            await checkpoints.save(
+                stage,
+                {
+                    "layout": slide.layout,
+                    "content": slide.content,
+                    "assets": [
+                        {
+                            "id": str(asset.id),
+                            "path": asset.path,
+                            "is_uploaded": asset.is_uploaded,
+                            "extras": asset.extras,
+                        }
+                        for asset in assets
+                    ],
+                },
+            )
+            return assets
+
         # 7. Generate slide content concurrently (batched), then build slides and fetch assets
         slides: List[SlideModel] = []
 
@@ -686,15 +987,12 @@ async def generate_presentation_handler(
 
             print(f"Generating slides from {start} to {end}")
 
-            # Generate contents for this batch concurrently
+            # Generate contents for this batch concurrently, reusing the ones
+            # already started while outlines were streaming
             content_tasks = [
-                get_slide_content_from_type_and_outline(
-                    slide_layouts[i],
-                    presentation_outlines.slides[i],
-                    request.language,
-                    request.tone.value,
-                    request.verbosity.value,
-                    request.instructions,
+                pipelined_content_tasks.get(i)
+                or generate_slide_content(
+                    i, slide_layouts[i], presentation_outlines.slides[i]
                 )
                 for i in range(start, end)
             ]
@@ -717,10 +1015,7 @@ async def generate_presentation_handler(
                 batch_slides.append(slide)
 
             # Start asset fetch tasks for just-generated slides so they run while next batch is processed
-            asset_tasks = [
-                process_slide_and_fetch_assets(image_generation_service, slide)
-                for slide in batch_slides
-            ]
+            asset_tasks = [fetch_slide_assets(slide) for slide in batch_slides]
             async_assets_generation_tasks.extend(asset_tasks)
 
         if async_status:
@@ -736,10 +1031,12 @@ async def generate_presentation_handler(
             generated_assets.extend(assets_list)
 
         # 8. Save PresentationModel and Slides
-        sql_session.add(presentation)
-        sql_session.add_all(slides)
-        sql_session.add_all(generated_assets)
-        await sql_session.commit()
+        if not checkpoints.get(SAVED_STAGE):
+            sql_session.add(presentation)
+            sql_session.add_all(slides)
+            sql_session.add_all(generated_assets)
+            await sql_session.commit()
+            await checkpoints.save(SAVED_STAGE, {"title": presentation.title})
 
         if async_status:
             async_status.message = "Exporting presentation"
@@ -747,9 +1044,18 @@ async def generate_presentation_handler(
             sql_session.add(async_status)
 
         # 9. Export
-        presentation_and_path = await export_presentation(
-            presentation_id, presentation.title or str(uuid.uuid4()), request.export_as
-        )
+        export_checkpoint = checkpoints.get(EXPORT_STAGE)
+        if export_checkpoint and os.path.exists(export_checkpoint["path"]):
+            presentation_and_path = PresentationAndPath(**export_checkpoint)
+        else:
+            presentation_and_path = await export_presentation(
+                presentation_id,
+                presentation.title or str(uuid.uuid4()),
+                request.export_as,
+            )
+            await checkpoints.save(
+                EXPORT_STAGE, presentation_and_path.model_dump(mode="json")
+            )
 
         response = PresentationPathAndEditPath(
             **presentation_and_path.model_dump(),
@@ -764,6 +1070,8 @@ async def generate_presentation_handler(
             sql_session.add(async_status)
             await sql_session.commit()
 
+        await checkpoints.clear()
+
         # Triggering webhook on success
         CONCURRENT_SERVICE.run_task(
             None,
@@ -775,19 +1083,27 @@ async def generate_presentation_handler(
         return response
 
     except Exception as e:
+        for layout_selection_task in layout_selection_tasks:
+            layout_selection_task.cancel()
+        for content_task in pipelined_content_tasks.values():
+            content_task.cancel()
+        if asset_planner:
+            asset_planner.cancel()
+
         if not isinstance(e, HTTPException):
             traceback.print_exc()
             e = HTTPException(status_code=500, detail="Presentation generation failed")
 
         api_error_model = APIErrorModel.from_exception(e)
 
-        # Triggering webhook on failure
-        CONCURRENT_SERVICE.run_task(
-            None,
-            WebhookService.send_webhook,
-            WebhookEvent.PRESENTATION_GENERATION_FAILED,
-            api_error_model.model_dump(mode="json"),
-        )
+        # Triggering webhook on failure, unless the job will be retried
+        if trigger_failure_webhook:
+            CONCURRENT_SERVICE.run_task(
+                None,
+                WebhookService.send_webhook,
+                WebhookEvent.PRESENTATION_GENERATION_FAILED,
+                api_error_model.model_dump(mode="json"),
+            )
 
         if async_status:
             async_status.status = "error"
@@ -821,7 +1137,6 @@ async def generate_presentation_sync(
 )
 async def generate_presentation_async(
     request: GeneratePresentationRequest,
-    background_tasks: BackgroundTasks,
     sql_session: AsyncSession = Depends(get_async_session),
 ):
     try:
@@ -835,13 +1150,15 @@ async def generate_presentation_async(
         sql_session.add(async_status)
         await sql_session.commit()
 
-        background_tasks.add_task(
-            generate_presentation_handler,
-            request,
-            presentation_id,
-            async_status=async_status,
-            sql_session=sql_session,
+        await PRESENTATION_JOB_QUEUE.enqueue(
+            PresentationGenerationJobModel(
+                id=async_status.id,
+                presentation_id=presentation_id,
+                request=request.model_dump(mode="json"),
+                max_attempts=get_presentation_job_max_attempts(),
+            )
         )
+        get_presentation_job_worker_pool().notify()
         return async_status
 
     except Exception as e:
@@ -7,22 +7,24 @@ This is the new generation system that:
 3. Reconstructs PPTX with 99% fidelity to original template
 """
 
+import hashlib
 import os
 import uuid
 from typing import Optional, List
 from datetime import datetime
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Request
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 from sqlmodel import Session, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.database import engine, get_async_session
+from services.design_system_cache import DESIGN_SYSTEM_CACHE
 from services.design_system_extractor import DESIGN_SYSTEM_EXTRACTOR, DesignSystem
 from services.pptx_builder import build_pptx_from_design_system, SlideContent
 from services.ai_slide_generator import generate_slides_with_ai, AISlideGenerator
-from services.slide_thumbnail_generator import THUMBNAIL_GENERATOR
+from services.slide_thumbnail_generator import THUMBNAIL_GENERATOR, THUMBNAIL_SIZES
 from models.sql.template import PptxTemplateModel
 from utils.datetime_utils import get_current_utc_datetime
 from utils.asset_directory_utils import get_exports_directory
@@ -31,6 +33,25 @@ from utils.asset_directory_utils import get_exports_directory
 router = APIRouter(prefix="/smart-templates", tags=["Smart Templates"])
 
 
+def _get_thumbnail_info(template_id: str, slide_index: int, size: str) -> Optional[dict]:
+    """
+    URL and ETag of a slide thumbnail. The URL carries the ETag as version,
+    so browsers can cache it for good.
+    """
+    thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, slide_index, size)
+    if not thumb_path:
+        return None
+    etag = THUMBNAIL_GENERATOR.get_thumbnail_etag(thumb_path)
+    version = etag.strip('"')
+    return {
+        "url": (
+            f"/api/v1/ppt/smart-templates/templates/{template_id}/thumbnails/"
+            f"{slide_index}?size={size}&v={version}"
+        ),
+        "etag": etag,
+    }
+
+
 # ==================== PYDANTIC MODELS ====================
 
 class DesignSystemResponse(BaseModel):
@@ -145,6 +166,14 @@ async def analyze_template(
             session.add(template)
             session.commit()
 
+        THUMBNAIL_GENERATOR.schedule(template_path, template_id)
+
+        DESIGN_SYSTEM_CACHE.store(
+            uuid.UUID(template_id),
+            design_system,
+            hashlib.sha256(content).hexdigest(),
+        )
+
         # Build response
         design_response = DesignSystemResponse(
             id=design_system.id,
@@ -210,8 +239,7 @@ async def generate_from_template(request: GenerateRequest):
         template_path = template.file_path
 
     try:
-        # Extract design system
-        design_system = DESIGN_SYSTEM_EXTRACTOR.extract(template_path, template.name)
+        design_system = DESIGN_SYSTEM_CACHE.get(template)
 
         # Generate content with AI
         slides_content = await generate_slides_with_ai(
@@ -281,8 +309,7 @@ async def generate_from_content(
         if not isinstance(content, list):
             content = [content]
 
-        # Extract design system
-        design_system = DESIGN_SYSTEM_EXTRACTOR.extract(template_path, template.name)
+        design_system = DESIGN_SYSTEM_CACHE.get(template)
 
         # Build PPTX
         presentation_id = str(uuid.uuid4())
@@ -328,7 +355,12 @@ async def download_presentation(filename: str):
 
 @router.get("/templates")
 async def list_smart_templates():
-    """List all available smart templates"""
+    """
+    List all available smart templates.
+
+    Thumbnails are returned as URLs of the first slide at list size. Missing
+    thumbnails are generated in the background, their URL is null meanwhile.
+    """
     with Session(engine) as session:
         templates = session.exec(
             select(PptxTemplateModel).where(PptxTemplateModel.is_active == True)
@@ -344,22 +376,16 @@ async def list_smart_templates():
                 "slide_count": t.slide_count,
                 "fonts": t.fonts,
                 "created_at": t.created_at,
-                "thumbnail_url": None
+                "thumbnail_url": None,
+                "thumbnail_etag": None,
             }
 
-            # Get first slide thumbnail if available
-            thumb_base64 = THUMBNAIL_GENERATOR.get_thumbnail_base64(str(t.id), 0)
-            if thumb_base64:
-                template_data["thumbnail_url"] = f"data:image/png;base64,{thumb_base64}"
+            thumbnail = _get_thumbnail_info(str(t.id), 0, "list")
+            if thumbnail:
+                template_data["thumbnail_url"] = thumbnail["url"]
+                template_data["thumbnail_etag"] = thumbnail["etag"]
             elif t.file_path and os.path.exists(t.file_path):
-                # Generate thumbnails if they don't exist
-                try:
-                    THUMBNAIL_GENERATOR.generate_thumbnails(t.file_path, str(t.id), width=1920, height=1080)
-                    thumb_base64 = THUMBNAIL_GENERATOR.get_thumbnail_base64(str(t.id), 0)
-                    if thumb_base64:
-                        template_data["thumbnail_url"] = f"data:image/png;base64,{thumb_base64}"
-                except Exception as e:
-                    print(f"Error generating thumbnail for template {t.id}: {e}")
+                THUMBNAIL_GENERATOR.schedule(t.file_path, str(t.id))
 
             result.append(template_data)
 
@@ -375,7 +401,7 @@ async def get_template_design_system(template_id: str):
             raise HTTPException(status_code=404, detail="Template not found")
 
     try:
-        design_system = DESIGN_SYSTEM_EXTRACTOR.extract(template.file_path, template.name)
+        design_system = DESIGN_SYSTEM_CACHE.get(template)
 
         return {
             "id": design_system.id,
@@ -443,6 +469,8 @@ async def delete_smart_template(template_id: str):
         session.add(template)
         session.commit()
 
+    THUMBNAIL_GENERATOR.cleanup(template_id)
+
     return {"message": "Template deleted successfully"}
 
 
@@ -492,7 +520,7 @@ async def get_template_thumbnails(template_id: str):
     """
     Get thumbnail images for all slides in a template.
 
-    Returns base64 encoded PNG images for each slide.
+    Returns the URL and ETag of each slide thumbnail, in every size.
     """
     with Session(engine) as session:
         template = session.get(PptxTemplateModel, uuid.UUID(template_id))
@@ -500,31 +528,20 @@ async def get_template_thumbnails(template_id: str):
             raise HTTPException(status_code=404, detail="Template not found")
 
     try:
-        # Check if thumbnails already exist
-        thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, 0)
-
-        # Generate thumbnails if they don't exist
-        if not thumb_path:
-            THUMBNAIL_GENERATOR.generate_thumbnails(
-                template.file_path,
-                template_id,
-                width=1920,
-                height=1080
-            )
+        await THUMBNAIL_GENERATOR.ensure_thumbnails(template.file_path, template_id)
 
-        # Get all thumbnails as base64
         thumbnails = []
-        idx = 0
-        while True:
-            thumb_base64 = THUMBNAIL_GENERATOR.get_thumbnail_base64(template_id, idx)
-            if thumb_base64:
-                thumbnails.append({
-                    "index": idx,
-                    "image": f"data:image/png;base64,{thumb_base64}"
-                })
-                idx += 1
-            else:
-                break
+        for idx in range(THUMBNAIL_GENERATOR.get_thumbnail_count(template_id)):
+            sizes = {
+                size: _get_thumbnail_info(template_id, idx, size)
+                for size in THUMBNAIL_SIZES
+            }
+            thumbnails.append({
+                "index": idx,
+                "image": sizes["full"]["url"],
+                "etag": sizes["full"]["etag"],
+                "sizes": sizes,
+            })
 
         return {
             "template_id": template_id,
@@ -537,35 +554,50 @@ async def get_template_thumbnails(template_id: str):
 
 
 @router.get("/templates/{template_id}/thumbnails/{slide_index}")
-async def get_slide_thumbnail(template_id: str, slide_index: int):
+async def get_slide_thumbnail(
+    request: Request, template_id: str, slide_index: int, size: str = "full"
+):
     """
     Get thumbnail image for a specific slide.
 
-    Returns the PNG image file directly.
+    Returns the WebP image file directly, at list, grid or full size.
     """
+    if size not in THUMBNAIL_SIZES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid size, expected one of: {', '.join(THUMBNAIL_SIZES)}"
+        )
+
     with Session(engine) as session:
         template = session.get(PptxTemplateModel, uuid.UUID(template_id))
         if not template:
             raise HTTPException(status_code=404, detail="Template not found")
 
-    # Check if thumbnail exists, generate if not
-    thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, slide_index)
-
+    thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, slide_index, size)
     if not thumb_path:
-        # Generate all thumbnails
-        THUMBNAIL_GENERATOR.generate_thumbnails(
-            template.file_path,
-            template_id,
-            width=1920,
-            height=1080
-        )
-        thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, slide_index)
+        await THUMBNAIL_GENERATOR.ensure_thumbnails(template.file_path, template_id)
+        thumb_path = THUMBNAIL_GENERATOR.get_thumbnail_path(template_id, slide_index, size)
 
     if not thumb_path:
         raise HTTPException(status_code=404, detail="Slide thumbnail not found")
 
+    etag = THUMBNAIL_GENERATOR.get_thumbnail_etag(thumb_path)
+    headers = {
+        "ETag": etag,
+        # Versioned URLs never change, the others are revalidated with the ETag
+        "Cache-Control": (
+            "public, max-age=31536000, immutable"
+            if request.query_params.get("v")
+            else "no-cache"
+        ),
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         path=thumb_path,
-        media_type="image/png",
-        filename=f"slide_{slide_index}.png"
+        media_type="image/webp",
+        filename=f"slide_{slide_index}_{size}.webp",
+        headers=headers
     )
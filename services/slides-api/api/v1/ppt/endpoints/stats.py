@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from services.export_executor import EXPORT_EXECUTOR
+from services.llm_response_cache import LLM_RESPONSE_CACHE
+from services.process_runner import PROCESS_RUNNER
+
+STATS_ROUTER = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@STATS_ROUTER.get("")
+async def get_stats():
+    """Per tool timings of external processes, export pool and LLM cache usage"""
+    return {
+        "processes": PROCESS_RUNNER.stats(),
+        "exports": EXPORT_EXECUTOR.stats(),
+        "llm_response_cache": LLM_RESPONSE_CACHE.stats(),
+    }
@@ -17,6 +17,7 @@ from api.v1.ppt.endpoints.slide import SLIDE_ROUTER
 from api.v1.ppt.endpoints.pptx_slides import PPTX_FONTS_ROUTER
 from api.v1.ppt.endpoints.pptx_templates import router as PPTX_TEMPLATES_ROUTER
 from api.v1.ppt.endpoints.smart_templates import router as SMART_TEMPLATES_ROUTER
+from api.v1.ppt.endpoints.stats import STATS_ROUTER
 
 
 API_V1_PPT_ROUTER = APIRouter(prefix="/api/v1/ppt")
@@ -41,3 +42,4 @@ API_V1_PPT_ROUTER.include_router(GOOGLE_ROUTER)
 API_V1_PPT_ROUTER.include_router(PPTX_FONTS_ROUTER)
 API_V1_PPT_ROUTER.include_router(PPTX_TEMPLATES_ROUTER)
 API_V1_PPT_ROUTER.include_router(SMART_TEMPLATES_ROUTER)
+API_V1_PPT_ROUTER.include_router(STATS_ROUTER)
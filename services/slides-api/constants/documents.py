@@ -18,3 +18,7 @@ WEBP_MIME_TYPES = ["image/webp"]
 UPLOAD_ACCEPTED_FILE_TYPES = (
     PDF_MIME_TYPES + TEXT_MIME_TYPES + POWERPOINT_TYPES + WORD_TYPES
 )
+
+
+# Largest side in pixels of the slide screenshots rendered from PDFs
+SLIDE_SCREENSHOT_SIZE = 1920
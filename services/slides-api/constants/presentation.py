@@ -1 +1,11 @@
 DEFAULT_TEMPLATES = ["general", "modern", "standard", "swift"]
+
+# Maximum number of slide contents generated concurrently for one presentation
+MAX_CONCURRENT_SLIDE_GENERATIONS = 10
+
+# Streamed outlines whose layouts are selected together with unordered layouts,
+# before their contents are generated
+OUTLINES_PER_LAYOUT_SELECTION = 3
+
+# Maximum number of images and icons fetched concurrently for one presentation
+MAX_CONCURRENT_ASSET_FETCHES = 8
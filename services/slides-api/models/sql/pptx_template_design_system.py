@@ -0,0 +1,25 @@
+from datetime import datetime
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from utils.datetime_utils import get_current_utc_datetime
+
+
+class PptxTemplateDesignSystemModel(SQLModel, table=True):
+    """
+    Design system extracted from a PPTX template, so it is not extracted
+    again on every generation.
+    """
+
+    __tablename__ = "pptx_template_design_systems"
+
+    template_id: uuid.UUID = Field(primary_key=True)
+    # SHA-256 of the template file the design system was extracted from
+    content_hash: str
+    design_system: dict = Field(sa_column=Column(JSON))
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=get_current_utc_datetime,
+    )
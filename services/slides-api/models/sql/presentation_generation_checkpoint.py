@@ -0,0 +1,21 @@
+from datetime import datetime
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from utils.datetime_utils import get_current_utc_datetime
+
+
+class PresentationGenerationCheckpointModel(SQLModel, table=True):
+
+    __tablename__ = "presentation_generation_checkpoints"
+
+    presentation_id: uuid.UUID = Field(primary_key=True)
+    # "outlines", "structure", "slide_content:3", "slide_assets:3", ...
+    stage: str = Field(primary_key=True)
+    data: dict = Field(sa_column=Column(JSON))
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=get_current_utc_datetime,
+    )
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from utils.datetime_utils import get_current_utc_datetime
+
+
+class PresentationGenerationJobModel(SQLModel, table=True):
+
+    __tablename__ = "presentation_generation_jobs"
+
+    # Same id as the AsyncPresentationGenerationTaskModel reporting its status
+    id: str = Field(primary_key=True)
+    presentation_id: uuid.UUID
+    request: dict = Field(sa_column=Column(JSON))
+    status: str = Field(default="queued", index=True)
+    attempts: int = 0
+    max_attempts: int = 3
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=True), default=None
+    )
+    available_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=get_current_utc_datetime,
+    )
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=get_current_utc_datetime,
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=get_current_utc_datetime,
+    )
@@ -0,0 +1,129 @@
+"""
+Benchmark the icon search backends
+
+Runs the same batches of icon queries against the Chroma collection and the
+NumPy index (see build_icon_index.py), and prints the latency of each backend
+and how often their top results agree.
+
+With --synthetic, random embeddings stand in for the icons and the queries,
+so the index searches are compared without the embedding model. Embedding
+the queries costs the same with both backends.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+QUERIES = [
+    "growth chart",
+    "team collaboration",
+    "security lock",
+    "money savings",
+    "calendar schedule",
+    "cloud upload",
+    "rocket launch",
+    "education graduation",
+    "email message",
+    "settings gear",
+    "heart health",
+    "world globe",
+    "lightbulb idea",
+    "shopping cart",
+    "target goal",
+    "handshake partnership",
+]
+
+
+def benchmark(name, query, batch_size: int, n_runs: int):
+    queries = (QUERIES * (batch_size // len(QUERIES) + 1))[:batch_size]
+
+    # Warm up the embedding session and the index
+    query(queries, 1)
+
+    started_at = time.perf_counter()
+    for _ in range(n_runs):
+        results = query(queries, 1)
+    elapsed = (time.perf_counter() - started_at) / n_runs
+    print(f"{name:>8} | batch {batch_size:>3} | {elapsed * 1000:8.2f} ms per batch")
+    return results
+
+
+# Number of bold icons in assets/icons.json
+SYNTHETIC_ICON_COUNT = 1512
+EMBEDDING_SIZE = 384
+
+
+def get_synthetic_backends(directory: str):
+    """Chroma collection and NumPy index of random icon embeddings"""
+    import chromadb
+    from chromadb.config import Settings
+    import numpy as np
+
+    from services.numpy_icon_index import NumpyIconIndex
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal(
+        (SYNTHETIC_ICON_COUNT, EMBEDDING_SIZE), dtype=np.float32
+    )
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    ids = [f"icon-{index}" for index in range(SYNTHETIC_ICON_COUNT)]
+
+    client = chromadb.EphemeralClient(Settings(anonymized_telemetry=False))
+    collection = client.create_collection(
+        name="icons", metadata={"hnsw:space": "cosine"}, embedding_function=None
+    )
+    collection.add(embeddings=embeddings.tolist(), ids=ids)
+
+    embeddings_path = os.path.join(directory, "icon_embeddings.npy")
+    ids_path = os.path.join(directory, "icon_embeddings_ids.json")
+    np.save(embeddings_path, embeddings)
+    with open(ids_path, "w") as f:
+        json.dump(ids, f)
+    numpy_index = NumpyIconIndex(None, embeddings_path, ids_path)
+
+    query_embeddings = {
+        query: rng.standard_normal(EMBEDDING_SIZE, dtype=np.float32).tolist()
+        for query in QUERIES
+    }
+
+    def embed(queries):
+        return [query_embeddings[query] for query in queries]
+
+    def query_chroma(queries, n_results):
+        return collection.query(
+            query_embeddings=embed(queries), n_results=n_results
+        )["ids"]
+
+    def query_numpy(queries, n_results):
+        return numpy_index.query_embeddings(embed(queries), n_results)
+
+    return query_chroma, query_numpy
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ["ICON_INDEX_BACKEND"] = "chroma"
+
+    if "--synthetic" in sys.argv:
+        directory = tempfile.mkdtemp()
+        query_chroma, query_numpy = get_synthetic_backends(directory)
+    else:
+        from services.icon_finder_service import ICON_FINDER_SERVICE
+        from services.numpy_icon_index import NumpyIconIndex
+
+        numpy_index = NumpyIconIndex(ICON_FINDER_SERVICE.embedding_function)
+        query_chroma, query_numpy = ICON_FINDER_SERVICE.query, numpy_index.query
+
+    for batch_size in (1, 16, 64):
+        chroma_results = benchmark("chroma", query_chroma, batch_size, n_runs=20)
+        numpy_results = benchmark("numpy", query_numpy, batch_size, n_runs=20)
+        agreement = sum(
+            chroma[0] == numpy[0]
+            for chroma, numpy in zip(chroma_results, numpy_results)
+        ) / len(chroma_results)
+        print(f"top-1 agreement: {agreement:.0%}")
@@ -0,0 +1,126 @@
+"""
+Benchmark the image transforms of utils/image_utils.py
+
+Compares the NumPy implementations of round_image_corners, invert_image and
+set_image_opacity with the previous Pillow ones, kept below for reference,
+and shows the gain of downscaling to the target box before transforming.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
+from utils.image_utils import (
+    downscale_to_cover,
+    fit_image,
+    invert_image,
+    round_image_corners,
+    set_image_opacity,
+)
+
+
+def pillow_round_image_corners(image, radii):
+    w, h = image.size
+    max_radius = min(w // 2, h // 2)
+    radii = [min(radius, max_radius) for radius in radii]
+    image = image.convert("RGBA")
+    rounded_mask = Image.new("L", image.size, 0)
+    rectangular_mask = Image.new("L", image.size, 255)
+    for i, radius in enumerate(radii):
+        if radius <= 0:
+            continue
+        circle = Image.new("L", (radius * 2, radius * 2), 0)
+        ImageDraw.Draw(circle).ellipse((0, 0, radius * 2 - 1, radius * 2 - 1), fill=255)
+        if i == 0:
+            rounded_mask.paste(circle.crop((0, 0, radius, radius)), (0, 0))
+            rectangular_mask.paste(0, (0, 0, radius, radius))
+        elif i == 1:
+            rounded_mask.paste(circle.crop((radius, 0, radius * 2, radius)), (w - radius, 0))
+            rectangular_mask.paste(0, (w - radius, 0, w, radius))
+        elif i == 2:
+            rounded_mask.paste(
+                circle.crop((radius, radius, radius * 2, radius * 2)), (w - radius, h - radius)
+            )
+            rectangular_mask.paste(0, (w - radius, h - radius, w, h))
+        else:
+            rounded_mask.paste(circle.crop((0, radius, radius, radius * 2)), (0, h - radius))
+            rectangular_mask.paste(0, (0, h - radius, radius, h))
+    corner_mask = Image.composite(rounded_mask, rectangular_mask, rounded_mask)
+    final_alpha = Image.composite(
+        image.getchannel("A"), Image.new("L", image.size, 0), corner_mask
+    )
+    result = Image.new("RGBA", image.size)
+    result.paste(image.convert("RGB"), (0, 0))
+    result.putalpha(final_alpha)
+    return result
+
+
+def pillow_invert_image(img):
+    new_data = []
+    for r, g, b, a in img.getdata():
+        new_data.append((255 - r, 255 - g, 255 - b, a) if a != 0 else (0, 0, 0, 0))
+    new_img = Image.new("RGBA", img.size)
+    new_img.putdata(new_data)
+    return new_img
+
+
+def pillow_set_image_opacity(image, opacity):
+    new_alpha = image.getchannel("A").point(lambda x: int(x * opacity))
+    result = Image.new("RGBA", image.size)
+    result.paste(image.convert("RGB"), (0, 0))
+    result.putalpha(new_alpha)
+    return result
+
+
+def measure(fn, *args, n_runs: int = 3) -> float:
+    started_at = time.perf_counter()
+    for _ in range(n_runs):
+        fn(*args)
+    return (time.perf_counter() - started_at) / n_runs * 1000
+
+
+def mismatch(a: Image.Image, b: Image.Image) -> float:
+    return float(np.mean(np.asarray(a) != np.asarray(b)))
+
+
+if __name__ == "__main__":
+    image = Image.fromarray(
+        (np.random.default_rng(0).random((2400, 3600, 4)) * 255).astype(np.uint8),
+        "RGBA",
+    )
+    radii = [80, 80, 40, 0]
+
+    for name, pillow_fn, numpy_fn, args in (
+        ("round_image_corners", pillow_round_image_corners, round_image_corners, (radii,)),
+        ("invert_image", pillow_invert_image, invert_image, ()),
+        ("set_image_opacity", pillow_set_image_opacity, set_image_opacity, (0.6,)),
+    ):
+        pillow_ms = measure(pillow_fn, image, *args, n_runs=1)
+        numpy_ms = measure(numpy_fn, image, *args)
+        print(
+            f"{name:>20} | pillow {pillow_ms:9.1f} ms | numpy {numpy_ms:7.1f} ms"
+            f" | differing values {mismatch(pillow_fn(image, *args), numpy_fn(image, *args)):.4%}"
+        )
+
+    # Picture box of 400 x 300 with cover fit and rounded corners
+    object_fit = PptxObjectFitModel(fit=PptxObjectFitEnum.COVER)
+
+    def full_resolution():
+        result = round_image_corners(image, radii)
+        return round_image_corners(fit_image(result, 400, 300, object_fit), radii)
+
+    def downscaled_first():
+        result = downscale_to_cover(image, 400, 300)
+        scale = result.width / image.width
+        result = round_image_corners(result, [round(r * scale) for r in radii])
+        return round_image_corners(fit_image(result, 400, 300, object_fit), radii)
+
+    print(f"{'cover 400x300':>20} | full resolution {measure(full_resolution):7.1f} ms")
+    print(f"{'cover 400x300':>20} | downscaled first {measure(downscaled_first):6.1f} ms")
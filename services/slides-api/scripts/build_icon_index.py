@@ -0,0 +1,60 @@
+"""
+Build the NumPy icon index
+
+Embeds every icon of assets/icons.json with the same model as the icons
+collection and stores the normalized float32 matrix in
+assets/icon_embeddings.npy, with the icon ids in assets/icon_embeddings_ids.json.
+Without assets/icons.json, the embeddings of the existing icons collection
+are exported instead.
+
+Set ICON_INDEX_BACKEND=numpy to search icons with this index.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.icon_finder_service import get_icon_documents, get_icon_embedding_function
+from services.numpy_icon_index import ICON_EMBEDDINGS_IDS_PATH, ICON_EMBEDDINGS_PATH
+
+
+def get_icon_embeddings():
+    if os.path.exists("assets/icons.json"):
+        documents, ids = get_icon_documents()
+        embedding_function = get_icon_embedding_function()
+        return embedding_function(documents), ids
+
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(
+        path="chroma", settings=Settings(anonymized_telemetry=False)
+    )
+    collection = client.get_collection("icons")
+    result = collection.get(include=["embeddings"])
+    return result["embeddings"], result["ids"]
+
+
+def build_icon_index():
+    embeddings, ids = get_icon_embeddings()
+
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings /= np.maximum(norms, 1e-12)
+
+    os.makedirs(os.path.dirname(ICON_EMBEDDINGS_PATH), exist_ok=True)
+    np.save(ICON_EMBEDDINGS_PATH, embeddings)
+    with open(ICON_EMBEDDINGS_IDS_PATH, "w") as f:
+        json.dump(list(ids), f)
+
+    print(f"Saved {len(ids)} icon embeddings to {ICON_EMBEDDINGS_PATH}")
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    build_icon_index()
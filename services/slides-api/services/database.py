@@ -15,8 +15,13 @@ from models.sql.image_asset import ImageAsset
 from models.sql.key_value import KeyValueSqlModel
 from models.sql.ollama_pull_status import OllamaPullStatus
 from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_checkpoint import (
+    PresentationGenerationCheckpointModel,
+)
+from models.sql.presentation_generation_job import PresentationGenerationJobModel
 from models.sql.slide import SlideModel
 from models.sql.presentation_layout_code import PresentationLayoutCodeModel
+from models.sql.pptx_template_design_system import PptxTemplateDesignSystemModel
 from models.sql.template import TemplateModel, PptxTemplateModel
 from models.sql.webhook_subscription import WebhookSubscription
 from utils.db_utils import get_database_url_and_connect_args
@@ -69,8 +74,11 @@ async def create_db_and_tables():
                     PresentationLayoutCodeModel.__table__,
                     TemplateModel.__table__,
                     PptxTemplateModel.__table__,
+                    PptxTemplateDesignSystemModel.__table__,
                     WebhookSubscription.__table__,
                     AsyncPresentationGenerationTaskModel.__table__,
+                    PresentationGenerationJobModel.__table__,
+                    PresentationGenerationCheckpointModel.__table__,
                 ],
             )
         )
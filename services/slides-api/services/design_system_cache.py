@@ -0,0 +1,88 @@
+import hashlib
+import threading
+from typing import Dict, Tuple
+import uuid
+
+from sqlmodel import Session, select
+
+from models.sql.pptx_template_design_system import PptxTemplateDesignSystemModel
+from models.sql.template import PptxTemplateModel
+from services.database import engine
+from services.design_system_extractor import DESIGN_SYSTEM_EXTRACTOR, DesignSystem
+
+
+def get_file_hash(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class DesignSystemCache:
+    """
+    Design systems extracted from PPTX templates, kept in memory and in the
+    database with the hash of the template file they were extracted from.
+
+    A design system is only extracted on upload or re-analysis of its
+    template, or the first time a template without one is used. Memory
+    entries are checked against the hash stored in the database, so a
+    re-analysis done by another process is picked up.
+    """
+
+    def __init__(self):
+        self._memory: Dict[uuid.UUID, Tuple[str, DesignSystem]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, template: PptxTemplateModel) -> DesignSystem:
+        with Session(engine) as session:
+            content_hash = session.exec(
+                select(PptxTemplateDesignSystemModel.content_hash).where(
+                    PptxTemplateDesignSystemModel.template_id == template.id
+                )
+            ).first()
+
+            if content_hash is None:
+                return self.refresh(template)
+
+            cached = self._memory.get(template.id)
+            if cached and cached[0] == content_hash:
+                return cached[1]
+
+            stored = session.get(PptxTemplateDesignSystemModel, template.id)
+            design_system = DesignSystem.from_dict(stored.design_system)
+
+        with self._lock:
+            self._memory[template.id] = (content_hash, design_system)
+        return design_system
+
+    def refresh(self, template: PptxTemplateModel) -> DesignSystem:
+        """Extracts the design system of the template again and stores it"""
+        content_hash = get_file_hash(template.file_path)
+        design_system = DESIGN_SYSTEM_EXTRACTOR.extract(
+            template.file_path, template.name
+        )
+        self.store(template.id, design_system, content_hash)
+        return design_system
+
+    def store(
+        self,
+        template_id: uuid.UUID,
+        design_system: DesignSystem,
+        content_hash: str,
+    ):
+        with Session(engine) as session:
+            session.merge(
+                PptxTemplateDesignSystemModel(
+                    template_id=template_id,
+                    content_hash=content_hash,
+                    design_system=design_system.to_dict(),
+                )
+            )
+            session.commit()
+
+        with self._lock:
+            self._memory[template_id] = (content_hash, design_system)
+
+
+DESIGN_SYSTEM_CACHE = DesignSystemCache()
@@ -170,6 +170,66 @@ class DesignSystem:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), indent=2, default=str)
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DesignSystem":
+        """Rebuild a design system serialized with to_dict"""
+        data = dict(data)
+        data["layouts"] = [_layout_from_dict(l) for l in data.get("layouts", [])]
+        for key in ("title_style", "subtitle_style", "body_style"):
+            data[key] = _text_style_from_dict(data.get(key))
+        return cls(**data)
+
+
+def _color_from_dict(data: Optional[Dict]) -> Optional[ColorInfo]:
+    return ColorInfo(**data) if data else None
+
+
+def _text_style_from_dict(data: Optional[Dict]) -> Optional[TextStyleInfo]:
+    if not data:
+        return None
+    font = dict(data["font"])
+    font["color"] = _color_from_dict(font.get("color"))
+    return TextStyleInfo(
+        **{
+            **data,
+            "font": FontInfo(**font),
+            "bullet_color": _color_from_dict(data.get("bullet_color")),
+        }
+    )
+
+
+def _shape_style_from_dict(data: Optional[Dict]) -> Optional[ShapeStyleInfo]:
+    if not data:
+        return None
+    return ShapeStyleInfo(
+        **{
+            **data,
+            "fill_color": _color_from_dict(data.get("fill_color")),
+            "line_color": _color_from_dict(data.get("line_color")),
+        }
+    )
+
+
+def _layout_from_dict(data: Dict) -> SlideLayoutInfo:
+    placeholders = [
+        PlaceholderInfo(
+            **{
+                **p,
+                "text_styles": [_text_style_from_dict(s) for s in p.get("text_styles", [])],
+                "shape_style": _shape_style_from_dict(p.get("shape_style")),
+            }
+        )
+        for p in data.get("placeholders", [])
+    ]
+    return SlideLayoutInfo(
+        **{
+            **data,
+            "layout_type": LayoutType(data["layout_type"]),
+            "background_color": _color_from_dict(data.get("background_color")),
+            "placeholders": placeholders,
+        }
+    )
+
 
 class DesignSystemExtractor:
     """
@@ -2,7 +2,6 @@ import mimetypes
 from fastapi import HTTPException
 import os, asyncio
 from typing import List, Optional, Tuple
-import pdfplumber
 
 from constants.documents import (
     PDF_MIME_TYPES,
@@ -11,6 +10,11 @@ from constants.documents import (
     WORD_TYPES,
 )
 from services.docling_service import DoclingService
+from services.pdf_rasterizer import (
+    PDF_RASTERIZER,
+    get_pdf_page_count,
+    render_pdf_pages,
+)
 
 
 class DocumentsLoader:
@@ -99,17 +103,21 @@ class DocumentsLoader:
 
     @classmethod
     def get_page_images_from_pdf(cls, file_path: str, temp_dir: str) -> List[str]:
-        with pdfplumber.open(file_path) as pdf:
-            images = []
-            for page in pdf.pages:
-                img = page.to_image(resolution=150)
-                image_path = os.path.join(temp_dir, f"page_{page.page_number}.png")
-                img.save(image_path)
-                images.append(image_path)
-            return images
+        page_indexes = list(range(get_pdf_page_count(file_path)))
+        return render_pdf_pages(file_path, temp_dir, page_indexes, "page_{number}.png")
 
     @classmethod
-    async def get_page_images_from_pdf_async(cls, file_path: str, temp_dir: str):
-        return await asyncio.to_thread(
-            cls.get_page_images_from_pdf, file_path, temp_dir
+    async def get_page_images_from_pdf_async(
+        cls,
+        file_path: str,
+        temp_dir: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Renders the pages in parallel, at 150 DPI or fitting width x height
+        pixels when given.
+        """
+        return await PDF_RASTERIZER.rasterize(
+            file_path, temp_dir, width=width, height=height
         )
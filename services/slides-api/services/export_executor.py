@@ -0,0 +1,161 @@
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+
+from utils.get_env import (
+    get_export_queue_size_env,
+    get_export_timeout_env,
+    get_export_workers_env,
+)
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_EXPORT_QUEUE_SIZE = 16
+DEFAULT_EXPORT_TIMEOUT = 300
+
+
+class ExportExecutor:
+    """
+    Process pool running the CPU bound python-pptx builds and saves, so a
+    large export does not block the event loop serving other requests.
+
+    Exports beyond the pool size wait in a bounded queue. Once the queue is
+    full new exports are rejected with a 429. A running job cannot be
+    stopped without breaking the pool for the other jobs, so a job exceeding
+    its timeout is abandoned and keeps its worker until it ends. When a
+    worker crashes the pool is replaced and the exports it was running fail
+    with a 503. With EXPORT_WORKERS=0 jobs run in a thread of this process
+    instead.
+    """
+
+    def __init__(self):
+        workers = parse_int_or_none(get_export_workers_env())
+        self.max_workers = (
+            workers if workers is not None else min(4, os.cpu_count() or 1)
+        )
+        queue_size = parse_int_or_none(get_export_queue_size_env())
+        self.max_queue_size = (
+            queue_size if queue_size is not None else DEFAULT_EXPORT_QUEUE_SIZE
+        )
+        self.timeout = (
+            parse_int_or_none(get_export_timeout_env()) or DEFAULT_EXPORT_TIMEOUT
+        )
+        self.running = 0
+        self.queued = 0
+        self.abandoned = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                # Forking would copy the event loop and the threads of this process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._executor
+
+    def _replace_broken_executor(self, executor: Executor):
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _abandon(self, job: Future) -> bool:
+        """
+        Cancels a job which has not started yet. Otherwise it keeps its slot
+        until it ends, so the pool is never oversubscribed. Returns whether
+        the slot is still taken.
+        """
+        if job.cancel():
+            return False
+        self.abandoned += 1
+        loop = asyncio.get_running_loop()
+
+        def release_slot(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._release_abandoned)
+
+        job.add_done_callback(release_slot)
+        return True
+
+    def _release_abandoned(self):
+        self.abandoned -= 1
+        self._slots.release()
+
+    def is_saturated(self) -> bool:
+        return self.queued >= self.max_queue_size
+
+    async def run(
+        self, fn: Callable[..., Any], *args, timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Runs fn(*args) in a worker process. fn and its arguments must be
+        picklable, so fn has to be a module level function.
+        """
+        if self.is_saturated():
+            raise HTTPException(
+                status_code=429,
+                detail="Too many exports in progress. Please try again later.",
+                headers={"Retry-After": "10"},
+            )
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(self.max_workers, 1))
+
+        self.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        slot_taken = False
+        executor = self._get_executor()
+        try:
+            job = executor.submit(fn, *args)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(job)), timeout or self.timeout
+                )
+            except asyncio.TimeoutError:
+                slot_taken = self._abandon(job)
+                raise HTTPException(status_code=504, detail="Export timed out")
+            except asyncio.CancelledError:
+                slot_taken = self._abandon(job)
+                raise
+        except BrokenProcessPool:
+            self._replace_broken_executor(executor)
+            raise HTTPException(
+                status_code=503,
+                detail="Export worker crashed. Please try again.",
+                headers={"Retry-After": "5"},
+            )
+        finally:
+            self.running -= 1
+            if not slot_taken:
+                self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "running": self.running,
+            "queued": self.queued,
+            "abandoned": self.abandoned,
+            "max_queue_size": self.max_queue_size,
+        }
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+EXPORT_EXECUTOR = ExportExecutor()
@@ -0,0 +1,109 @@
+import asyncio
+import os
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from urllib.parse import quote
+
+from fastapi.responses import StreamingResponse
+
+from services.temp_file_service import TEMP_FILE_SERVICE
+
+
+EXPORT_STREAM_CHUNK_SIZE = 64 * 1024
+PPTX_MEDIA_TYPE = (
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+)
+
+
+async def stream_export(
+    build: Callable[[str], Awaitable], save_path: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Streams the file written by build(path) while it is being written.
+
+    build writes into a named pipe instead of a file, which works from the
+    export executor processes as the zip container of a PPTX is written
+    sequentially. The file is also written to save_path when given.
+    """
+    temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
+    pipe_path = os.path.join(temp_dir, "export.pipe")
+    os.mkfifo(pipe_path)
+    # Opened for writing as well, so the build never blocks opening the pipe
+    # and reading never hits the end of file. The end of the stream is the
+    # end of the build.
+    fd = os.open(pipe_path, os.O_RDWR | os.O_NONBLOCK)
+
+    loop = asyncio.get_running_loop()
+    save_file = None
+    partial_save_path = f"{save_path}.part" if save_path else None
+    build_task = asyncio.create_task(build(pipe_path))
+    try:
+        if partial_save_path:
+            save_file = open(partial_save_path, "wb")
+
+        while True:
+            # Everything written before the build finished is in the pipe
+            is_built = build_task.done()
+            try:
+                chunk = os.read(fd, EXPORT_STREAM_CHUNK_SIZE)
+            except BlockingIOError:
+                if is_built:
+                    break
+                readable = loop.create_future()
+                loop.add_reader(
+                    fd, lambda: readable.done() or readable.set_result(None)
+                )
+                try:
+                    await asyncio.wait(
+                        [readable, build_task], return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    loop.remove_reader(fd)
+                continue
+
+            if save_file:
+                save_file.write(chunk)
+            yield chunk
+
+        # Raises the error of a failed build
+        build_task.result()
+        if save_file:
+            save_file.close()
+            os.replace(partial_save_path, save_path)
+    finally:
+        # A build still running gets a broken pipe once the pipe is closed
+        build_task.cancel()
+        os.close(fd)
+        TEMP_FILE_SERVICE.cleanup_temp_dir(temp_dir)
+        if save_file and not save_file.closed:
+            save_file.close()
+            os.remove(partial_save_path)
+
+
+async def create_export_streaming_response(
+    build: Callable[[str], Awaitable],
+    filename: str,
+    save_path: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Waits for the first chunk of the export before responding, so the errors
+    of the build which usually happen before (missing presentation, busy
+    export executor) are still returned as error responses.
+    """
+    stream = stream_export(build, save_path)
+    try:
+        first_chunk = await anext(stream)
+    except StopAsyncIteration:
+        first_chunk = b""
+
+    async def content():
+        if first_chunk:
+            yield first_chunk
+        async for chunk in stream:
+            yield chunk
+
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"
+    }
+    if save_path:
+        headers["X-Export-Path"] = quote(save_path)
+    return StreamingResponse(content(), media_type=PPTX_MEDIA_TYPE, headers=headers)
@@ -1,13 +1,62 @@
 import asyncio
 import json
+import os
+from typing import List, Optional, Set, Tuple
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+from services.numpy_icon_index import ICON_EMBEDDINGS_PATH, NumpyIconIndex
+from utils.get_env import get_icon_index_backend_env
+
+
+# Concurrent queries arriving within this window are embedded and searched
+# together in a single index query
+ICON_SEARCH_BATCH_WINDOW = 0.005
+ICON_SEARCH_MAX_BATCH_SIZE = 64
+
+
+def get_icon_documents() -> Tuple[List[str], List[str]]:
+    with open("assets/icons.json", "r") as f:
+        icons = json.load(f)
+
+    documents = []
+    ids = []
+
+    for each in icons["icons"]:
+        if each["name"].split("-")[-1] == "bold":
+            doc_text = f"{each['name']} {each['tags']}"
+            documents.append(doc_text)
+            ids.append(each["name"])
+
+    return documents, ids
+
+
+def get_icon_embedding_function() -> ONNXMiniLM_L6_V2:
+    embedding_function = ONNXMiniLM_L6_V2()
+    embedding_function.DOWNLOAD_PATH = "chroma/models"
+    embedding_function._download_model_if_not_exists()
+    return embedding_function
+
 
 class IconFinderService:
     def __init__(self):
         self.collection_name = "icons"
+        self._pending_searches: List[Tuple[str, int, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self.embedding_function = get_icon_embedding_function()
+        self.index: Optional[NumpyIconIndex] = None
+
+        if get_icon_index_backend_env() == "numpy":
+            if os.path.exists(ICON_EMBEDDINGS_PATH):
+                print("Loading icons index...")
+                self.index = NumpyIconIndex(self.embedding_function)
+                print("Icons index loaded.")
+                return
+            print(f"{ICON_EMBEDDINGS_PATH} not found, using the icons collection")
+
         self.client = chromadb.PersistentClient(
             path="chroma", settings=Settings(anonymized_telemetry=False)
         )
@@ -16,25 +65,12 @@ class IconFinderService:
         print("Icons collection initialized.")
 
     def _initialize_icons_collection(self):
-        self.embedding_function = ONNXMiniLM_L6_V2()
-        self.embedding_function.DOWNLOAD_PATH = "chroma/models"
-        self.embedding_function._download_model_if_not_exists()
         try:
             self.collection = self.client.get_collection(
                 self.collection_name, embedding_function=self.embedding_function
             )
         except Exception:
-            with open("assets/icons.json", "r") as f:
-                icons = json.load(f)
-
-            documents = []
-            ids = []
-
-            for i, each in enumerate(icons["icons"]):
-                if each["name"].split("-")[-1] == "bold":
-                    doc_text = f"{each['name']} {each['tags']}"
-                    documents.append(doc_text)
-                    ids.append(each["name"])
+            documents, ids = get_icon_documents()
 
             if documents:
                 self.collection = self.client.create_collection(
@@ -44,13 +80,56 @@ class IconFinderService:
                 )
                 self.collection.add(documents=documents, ids=ids)
 
+    def query(self, query_texts: List[str], n_results: int) -> List[List[str]]:
+        if self.index:
+            return self.index.query(query_texts, n_results)
+        result = self.collection.query(query_texts=query_texts, n_results=n_results)
+        return result["ids"]
+
     async def search_icons(self, query: str, k: int = 1):
-        result = await asyncio.to_thread(
-            self.collection.query,
-            query_texts=[query],
-            n_results=k,
-        )
-        return [f"/static/icons/bold/{each}.svg" for each in result["ids"][0]]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_searches.append((query, k, future))
+
+        if len(self._pending_searches) >= ICON_SEARCH_MAX_BATCH_SIZE:
+            self._flush_pending_searches()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                ICON_SEARCH_BATCH_WINDOW, self._flush_pending_searches
+            )
+
+        return await future
+
+    def _flush_pending_searches(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        searches = self._pending_searches
+        self._pending_searches = []
+        if searches:
+            task = asyncio.create_task(self._run_batch_search(searches))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch_search(self, searches: List[Tuple[str, int, asyncio.Future]]):
+        try:
+            result = await asyncio.to_thread(
+                self.query,
+                [query for query, _, _ in searches],
+                max(k for _, k, _ in searches),
+            )
+        except Exception as e:
+            for _, _, future in searches:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, k, future), ids in zip(searches, result):
+            if not future.done():
+                future.set_result(
+                    [f"/static/icons/bold/{each}.svg" for each in ids[:k]]
+                )
 
 
 ICON_FINDER_SERVICE = IconFinderService()
@@ -0,0 +1,200 @@
+import asyncio
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import mimetypes
+import os
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+from utils.asset_directory_utils import get_cache_directory
+from utils.file_utils import get_directory_size, prune_directory_lru
+from utils.get_env import get_image_cache_max_age_env, get_image_cache_size_mb_env
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_IMAGE_CACHE_SIZE_MB = 1024
+DEFAULT_IMAGE_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+@dataclass
+class CachedImage:
+    url: str
+    content_hash: str
+    extension: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0
+
+
+class ImageCache:
+    """
+    Disk cache of remote images (stock photos, generated images) by URL.
+
+    Image files are stored once by content hash, with a small metadata file
+    per URL. Within IMAGE_CACHE_MAX_AGE an image is served from disk without
+    any request, after that it is revalidated with its ETag/Last-Modified.
+    Least recently used files are evicted past IMAGE_CACHE_SIZE_MB. All the
+    downloads share one pooled session.
+    """
+
+    def __init__(self):
+        size_mb = parse_int_or_none(get_image_cache_size_mb_env())
+        self.max_size = (
+            size_mb if size_mb is not None else DEFAULT_IMAGE_CACHE_SIZE_MB
+        ) * 1024 * 1024
+        max_age = parse_int_or_none(get_image_cache_max_age_env())
+        self.max_age = max_age if max_age is not None else DEFAULT_IMAGE_CACHE_MAX_AGE
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._size: Optional[int] = None
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(get_cache_directory(), "images")
+
+    def _objects_directory(self) -> str:
+        directory = os.path.join(self.directory, "objects")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _urls_directory(self) -> str:
+        directory = os.path.join(self.directory, "urls")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _metadata_path(self, url: str) -> str:
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._urls_directory(), f"{url_hash}.json")
+
+    def _object_path(self, entry: CachedImage) -> str:
+        return os.path.join(
+            self._objects_directory(), f"{entry.content_hash}{entry.extension}"
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16),
+                timeout=aiohttp.ClientTimeout(total=30),
+                trust_env=True,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _read_entry(self, url: str) -> Optional[CachedImage]:
+        try:
+            with open(self._metadata_path(url), "r") as f:
+                entry = CachedImage(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not os.path.isfile(self._object_path(entry)):
+            return None
+        return entry
+
+    def _write_entry(self, entry: CachedImage):
+        path = self._metadata_path(entry.url)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(asdict(entry), f)
+        os.replace(temp_path, path)
+
+    def _write_object(self, entry: CachedImage, content: bytes):
+        path = self._object_path(entry)
+        if os.path.exists(path):
+            return
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        self._evict(added=len(content))
+
+    def _touch(self, entry: CachedImage) -> str:
+        path = self._object_path(entry)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def _evict(self, added: int):
+        objects_directory = self._objects_directory()
+        if self._size is None:
+            self._size = get_directory_size(objects_directory)
+        else:
+            self._size += added
+        # Metadata of evicted files goes stale and is ignored
+        self._size = prune_directory_lru(objects_directory, self.max_size, self._size)
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> Optional[str]:
+        """
+        Returns the path of the cached image of the url, downloading or
+        revalidating it as needed. Returns None if it can't be fetched.
+        """
+        # Concurrent requests for the same url share one download
+        future = self._in_flight.get(url)
+        if future:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[url] = future
+        path = None
+        try:
+            path = await self._get(url, headers)
+        except Exception as e:
+            print(f"Error downloading image from {url}: {e}")
+        finally:
+            self._in_flight.pop(url, None)
+            future.set_result(path)
+        return path
+
+    async def _get(self, url: str, headers: Optional[dict]) -> Optional[str]:
+        entry = await asyncio.to_thread(self._read_entry, url)
+        if entry and time.time() - entry.fetched_at < self.max_age:
+            return await asyncio.to_thread(self._touch, entry)
+
+        request_headers = dict(headers or {})
+        if entry and entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+
+        async with self._get_session().get(url, headers=request_headers) as response:
+            if response.status == 304 and entry:
+                entry.fetched_at = time.time()
+                await asyncio.to_thread(self._write_entry, entry)
+                return await asyncio.to_thread(self._touch, entry)
+
+            if response.status != 200:
+                print(f"Failed to download image {url}. HTTP status: {response.status}")
+                return None
+
+            content = await response.read()
+            content_type = response.headers.get("Content-Type", "").split(";")[0]
+            new_entry = CachedImage(
+                url=url,
+                content_hash=hashlib.sha256(content).hexdigest(),
+                extension=self._get_extension(url, content_type),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.time(),
+            )
+
+        await asyncio.to_thread(self._write_object, new_entry, content)
+        await asyncio.to_thread(self._write_entry, new_entry)
+        return self._object_path(new_entry)
+
+    def _get_extension(self, url: str, content_type: str) -> str:
+        extension = mimetypes.guess_extension(content_type) if content_type else None
+        if not extension:
+            extension = os.path.splitext(url.split("?")[0])[1][:5]
+        return extension or ""
+
+
+IMAGE_CACHE = ImageCache()
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from PIL import Image
+
+from utils.asset_directory_utils import get_cache_directory
+from utils.file_utils import get_directory_size, prune_directory_lru
+from utils.get_env import (
+    get_image_transform_cache_size_mb_env,
+    get_pptx_jpeg_quality_env,
+    get_pptx_photo_format_env,
+)
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_IMAGE_TRANSFORM_CACHE_SIZE_MB = 512
+DEFAULT_PPTX_JPEG_QUALITY = 85
+
+
+class ImageTransformCache:
+    """
+    Disk cache of the images transformed for PPTX pictures (fit, clip, rounded
+    corners, opacity...), keyed by the hash of the source image and the
+    transform parameters. Shared by the export worker processes, least
+    recently used files are evicted past IMAGE_TRANSFORM_CACHE_SIZE_MB.
+
+    With PPTX_PHOTO_FORMAT=jpeg, fully opaque results are stored as JPEG
+    instead of PNG, which is much smaller for photos.
+    """
+
+    def __init__(self):
+        size_mb = parse_int_or_none(get_image_transform_cache_size_mb_env())
+        self.max_size = (
+            size_mb if size_mb is not None else DEFAULT_IMAGE_TRANSFORM_CACHE_SIZE_MB
+        ) * 1024 * 1024
+        self.photo_format = (get_pptx_photo_format_env() or "png").lower()
+        self.jpeg_quality = (
+            parse_int_or_none(get_pptx_jpeg_quality_env()) or DEFAULT_PPTX_JPEG_QUALITY
+        )
+        self._source_hashes: Dict[str, str] = {}
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        directory = os.path.join(get_cache_directory(), "image_transforms")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def get_source_hash(self, image_path: str) -> str:
+        stat = os.stat(image_path)
+        memo_key = f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        source_hash = self._source_hashes.get(memo_key)
+        if source_hash is None:
+            sha256 = hashlib.sha256()
+            with open(image_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha256.update(chunk)
+            source_hash = sha256.hexdigest()
+            self._source_hashes[memo_key] = source_hash
+        return source_hash
+
+    def get_key(self, image_path: str, params: dict) -> str:
+        params = {
+            **params,
+            "source": self.get_source_hash(image_path),
+            "photo_format": self.photo_format,
+        }
+        serialized = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        for extension in (".png", ".jpg"):
+            path = os.path.join(self.directory, f"{key}{extension}")
+            try:
+                os.utime(path)
+                return path
+            except OSError:
+                continue
+        return None
+
+    def put(self, key: str, image: Image.Image) -> str:
+        if self.photo_format in ("jpeg", "jpg") and self._is_opaque(image):
+            extension, save_kwargs = ".jpg", {
+                "format": "JPEG",
+                "quality": self.jpeg_quality,
+            }
+            image = image.convert("RGB")
+        else:
+            extension, save_kwargs = ".png", {"format": "PNG"}
+
+        path = os.path.join(self.directory, f"{key}{extension}")
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        image.save(temp_path, **save_kwargs)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = get_directory_size(self.directory)
+            else:
+                self._size += os.path.getsize(path)
+            self._size = prune_directory_lru(self.directory, self.max_size, self._size)
+        return path
+
+    def _is_opaque(self, image: Image.Image) -> bool:
+        if image.mode != "RGBA":
+            return image.mode in ("RGB", "L")
+        return image.getchannel("A").getextrema() == (255, 255)
+
+
+IMAGE_TRANSFORM_CACHE = ImageTransformCache()
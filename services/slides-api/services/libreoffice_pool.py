@@ -0,0 +1,355 @@
+import asyncio
+from html import escape
+import os
+from pathlib import Path
+import shutil
+import socket
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from services.process_runner import (
+    PROCESS_RUNNER,
+    ProcessCancelledError,
+    ProcessError,
+    ProcessTimeoutError,
+)
+from utils.asset_directory_utils import get_cache_directory
+from utils.get_env import (
+    get_libreoffice_max_conversions_env,
+    get_libreoffice_timeout_env,
+    get_libreoffice_workers_env,
+)
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_LIBREOFFICE_WORKERS = 2
+DEFAULT_LIBREOFFICE_MAX_CONVERSIONS = 100
+DEFAULT_LIBREOFFICE_TIMEOUT = 500
+LIBREOFFICE_STARTUP_TIMEOUT = 60
+# Aliases an instance keeps from previous conversions, over it only the
+# aliases of the current conversion are kept
+LIBREOFFICE_MAX_FONT_ALIASES = 256
+
+LIBREOFFICE_PATHS = [
+    "/usr/local/bin/soffice",  # macOS Homebrew
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",  # macOS native
+    "C:\\Program Files\\LibreOffice\\program\\soffice.exe",  # Windows
+]
+
+
+def find_libreoffice() -> Optional[str]:
+    path = shutil.which("soffice") or shutil.which("libreoffice")
+    if path:
+        return path
+    for path in LIBREOFFICE_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def write_font_alias_config(font_aliases: Dict[str, str], path: str) -> str:
+    """
+    Writes a fontconfig configuration that aliases variant family names to
+    their normalized root families. Returns the path to the config file.
+    """
+    with open(path, "w", encoding="utf-8") as cfg:
+        cfg.write(
+            """<?xml version='1.0'?>
+<!DOCTYPE fontconfig SYSTEM "urn:fontconfig:fonts.dtd">
+<fontconfig>
+  <include>/etc/fonts/fonts.conf</include>
+"""
+        )
+        for src, dst in font_aliases.items():
+            cfg.write(
+                f"""
+  <match target="pattern">
+    <test name="family" compare="eq">
+      <string>{escape(src)}</string>
+    </test>
+    <edit name="family" mode="assign" binding="strong">
+      <string>{escape(dst)}</string>
+    </edit>
+  </match>
+"""
+            )
+        cfg.write("\n</fontconfig>\n")
+    return path
+
+
+def _get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LibreOfficeWorker:
+    """
+    A long-lived headless LibreOffice instance with its own user profile.
+
+    Conversions run `soffice --convert-to` against the same profile, which
+    hands them over to the running instance instead of starting a new one.
+    The instance also listens on a local socket, used as health check.
+    """
+
+    def __init__(self, executable: str, directory: str):
+        self.executable = executable
+        self.directory = directory
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.port: Optional[int] = None
+        self.env: Optional[Dict[str, str]] = None
+        self.font_aliases: Dict[str, str] = {}
+        self.generation = 0
+        self.conversions = 0
+        # Set when a conversion was cancelled, the instance may still run it
+        self.interrupted = False
+
+    def has_font_aliases(self, font_aliases: Dict[str, str]) -> bool:
+        return font_aliases.items() <= self.font_aliases.items()
+
+    @property
+    def profile_url(self) -> str:
+        return Path(self.directory, "profile").as_uri()
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def is_healthy(self) -> bool:
+        if not self.is_running():
+            return False
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", self.port), 2
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    async def start(self, font_aliases: Dict[str, str], generation: int):
+        await self.stop()
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Fonts are resolved by the running instance, so it gets the aliases
+        self.font_aliases = dict(font_aliases)
+        self.env = os.environ.copy()
+        self.env["FONTCONFIG_FILE"] = write_font_alias_config(
+            self.font_aliases, os.path.join(self.directory, "fonts.conf")
+        )
+        self.port = _get_free_port()
+        self.process = await PROCESS_RUNNER.spawn(
+            [
+                self.executable,
+                f"-env:UserInstallation={self.profile_url}",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"--accept=socket,host=127.0.0.1,port={self.port};urp;",
+            ],
+            env=self.env,
+        )
+        self.generation = generation
+        self.conversions = 0
+        self.interrupted = False
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LIBREOFFICE_STARTUP_TIMEOUT
+        while not await self.is_healthy():
+            if not self.is_running() or loop.time() > deadline:
+                await self.stop()
+                raise Exception("LibreOffice failed to start")
+            await asyncio.sleep(0.2)
+
+    async def stop(self):
+        process = self.process
+        self.process = None
+        if process is None or process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), 10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def convert(
+        self,
+        input_path: str,
+        output_dir: str,
+        convert_to: str,
+        timeout: float,
+        is_cancelled: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> str:
+        self.conversions += 1
+        try:
+            await PROCESS_RUNNER.run(
+                [
+                    self.executable,
+                    f"-env:UserInstallation={self.profile_url}",
+                    "--headless",
+                    "--convert-to",
+                    convert_to,
+                    "--outdir",
+                    output_dir,
+                    input_path,
+                ],
+                timeout=timeout,
+                env=self.env,
+                is_cancelled=is_cancelled,
+            )
+        except (ProcessTimeoutError, ProcessCancelledError):
+            raise
+        except ProcessError as e:
+            raise Exception(f"LibreOffice conversion failed: {e.stderr}")
+
+        output_path = os.path.join(
+            output_dir, f"{Path(input_path).stem}.{convert_to.split(':')[0]}"
+        )
+        if not os.path.exists(output_path):
+            raise Exception("LibreOffice conversion failed: no output file")
+        return output_path
+
+
+class LibreOfficePool:
+    """
+    Pool of warm headless LibreOffice instances converting documents, so
+    conversions do not pay the startup of LibreOffice every time.
+
+    Conversions wait for an idle instance, preferring one that already has
+    their font aliases. Instances are started on first use, restarted when
+    their health check fails or a conversion times out or is cancelled, and
+    recycled after LIBREOFFICE_MAX_CONVERSIONS conversions or after new fonts
+    are installed. Only the instance picked for a conversion restarts when it
+    lacks the font aliases of that conversion.
+    """
+
+    def __init__(self):
+        workers = parse_int_or_none(get_libreoffice_workers_env())
+        self.n_workers = max(
+            1, workers if workers is not None else DEFAULT_LIBREOFFICE_WORKERS
+        )
+        self.max_conversions = (
+            parse_int_or_none(get_libreoffice_max_conversions_env())
+            or DEFAULT_LIBREOFFICE_MAX_CONVERSIONS
+        )
+        self.timeout = (
+            parse_int_or_none(get_libreoffice_timeout_env())
+            or DEFAULT_LIBREOFFICE_TIMEOUT
+        )
+        self.executable = find_libreoffice()
+        self.generation = 0
+        self._workers: List[LibreOfficeWorker] = []
+        self._idle_workers: List[LibreOfficeWorker] = []
+        self._idle_condition: Optional[asyncio.Condition] = None
+
+    @property
+    def is_available(self) -> bool:
+        return self.executable is not None
+
+    def _get_idle_condition(self) -> asyncio.Condition:
+        if self._idle_condition is None:
+            self._idle_condition = asyncio.Condition()
+            directory = os.path.join(get_cache_directory(), "libreoffice")
+            for index in range(self.n_workers):
+                worker = LibreOfficeWorker(
+                    self.executable, os.path.join(directory, f"worker_{index}")
+                )
+                self._workers.append(worker)
+                self._idle_workers.append(worker)
+        return self._idle_condition
+
+    async def _acquire_worker(self, font_aliases: Dict[str, str]) -> LibreOfficeWorker:
+        idle_condition = self._get_idle_condition()
+        async with idle_condition:
+            await idle_condition.wait_for(lambda: self._idle_workers)
+            worker = next(
+                (
+                    worker
+                    for worker in self._idle_workers
+                    if worker.has_font_aliases(font_aliases)
+                ),
+                self._idle_workers[0],
+            )
+            self._idle_workers.remove(worker)
+            return worker
+
+    async def _release_worker(self, worker: LibreOfficeWorker):
+        idle_condition = self._get_idle_condition()
+        async with idle_condition:
+            self._idle_workers.append(worker)
+            idle_condition.notify()
+
+    def recycle(self):
+        """Restarts the instances before their next conversion"""
+        self.generation += 1
+
+    async def _needs_restart(
+        self, worker: LibreOfficeWorker, font_aliases: Dict[str, str]
+    ) -> bool:
+        return (
+            worker.generation != self.generation
+            or worker.conversions >= self.max_conversions
+            or worker.interrupted
+            or not worker.has_font_aliases(font_aliases)
+            or not await worker.is_healthy()
+        )
+
+    def _get_worker_font_aliases(
+        self, worker: LibreOfficeWorker, font_aliases: Dict[str, str]
+    ) -> Dict[str, str]:
+        merged_font_aliases = {**worker.font_aliases, **font_aliases}
+        if len(merged_font_aliases) > LIBREOFFICE_MAX_FONT_ALIASES:
+            return dict(font_aliases)
+        return merged_font_aliases
+
+    async def convert(
+        self,
+        input_path: str,
+        output_dir: str,
+        convert_to: str = "pdf",
+        font_aliases: Optional[Dict[str, str]] = None,
+        is_cancelled: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> str:
+        """
+        Converts input_path into output_dir and returns the converted file.
+
+        font_aliases maps font family names to the ones to render them with.
+        An instance keeps the aliases of its previous conversions, so it only
+        restarts for the aliases it does not have yet. The conversion is
+        abandoned once is_cancelled returns True.
+        """
+        if not self.is_available:
+            raise Exception("LibreOffice conversion failed: LibreOffice not found")
+
+        font_aliases = font_aliases or {}
+        worker = await self._acquire_worker(font_aliases)
+        try:
+            if await self._needs_restart(worker, font_aliases):
+                await worker.start(
+                    self._get_worker_font_aliases(worker, font_aliases),
+                    self.generation,
+                )
+            try:
+                return await worker.convert(
+                    input_path, output_dir, convert_to, self.timeout, is_cancelled
+                )
+            except ProcessTimeoutError:
+                await worker.stop()
+                raise Exception(
+                    f"LibreOffice conversion timed out after {self.timeout} seconds"
+                )
+            except (ProcessCancelledError, asyncio.CancelledError):
+                # Only the forwarding soffice client was killed, the instance
+                # is restarted before its next conversion
+                worker.interrupted = True
+                raise
+        finally:
+            await self._release_worker(worker)
+
+    async def close(self):
+        await asyncio.gather(*[worker.stop() for worker in self._workers])
+
+
+LIBREOFFICE_POOL = LibreOfficePool()
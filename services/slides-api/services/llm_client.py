@@ -1,7 +1,7 @@
 import asyncio
 import dirtyjson
 import json
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Callable, List, Optional
 from fastapi import HTTPException
 from openai import AsyncOpenAI
 from openai.types.chat.chat_completion_chunk import (
@@ -39,6 +39,15 @@ from models.llm_tool_call import (
     OpenAIToolCallFunction,
 )
 from models.llm_tools import LLMDynamicTool, LLMTool
+from services.llm_client_pool import LLM_CLIENT_POOL
+from services.llm_rate_limiter import (
+    LLM_RATE_LIMITER,
+    estimate_tokens,
+    get_usage_tokens,
+    record_llm_usage,
+    record_rate_limit_headers,
+)
+from services.llm_response_cache import LLM_RESPONSE_CACHE
 from services.llm_tool_calls_handler import LLMToolCallsHandler
 from utils.async_iterator import iterator_to_async
 from utils.dummy_functions import do_nothing_async
@@ -107,46 +116,121 @@ class LLMClient:
                 )
 
     def _get_openai_client(self):
-        if not get_openai_api_key_env():
+        api_key = get_openai_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="OpenAI API Key is not set",
             )
-        return AsyncOpenAI()
+        return LLM_CLIENT_POOL.get_client(
+            LLMProvider.OPENAI,
+            None,
+            api_key,
+            lambda: AsyncOpenAI(api_key=api_key),
+        )
 
     def _get_google_client(self):
-        if not get_google_api_key_env():
+        api_key = get_google_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="Google API Key is not set",
             )
-        return genai.Client()
+        return LLM_CLIENT_POOL.get_client(
+            LLMProvider.GOOGLE,
+            None,
+            api_key,
+            lambda: genai.Client(api_key=api_key),
+        )
 
     def _get_anthropic_client(self):
-        if not get_anthropic_api_key_env():
+        api_key = get_anthropic_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="Anthropic API Key is not set",
             )
-        return AsyncAnthropic()
+        return LLM_CLIENT_POOL.get_client(
+            LLMProvider.ANTHROPIC,
+            None,
+            api_key,
+            lambda: AsyncAnthropic(api_key=api_key),
+        )
 
     def _get_ollama_client(self):
-        return AsyncOpenAI(
-            base_url=(get_ollama_url_env() or "http://localhost:11434") + "/v1",
-            api_key="ollama",
+        base_url = (get_ollama_url_env() or "http://localhost:11434") + "/v1"
+        return LLM_CLIENT_POOL.get_client(
+            LLMProvider.OLLAMA,
+            base_url,
+            "ollama",
+            lambda: AsyncOpenAI(base_url=base_url, api_key="ollama"),
         )
 
     def _get_custom_client(self):
-        if not get_custom_llm_url_env():
+        base_url = get_custom_llm_url_env()
+        if not base_url:
             raise HTTPException(
                 status_code=400,
                 detail="Custom LLM URL is not set",
             )
-        return AsyncOpenAI(
-            base_url=get_custom_llm_url_env(),
-            api_key=get_custom_llm_api_key_env() or "null",
+        api_key = get_custom_llm_api_key_env() or "null"
+        return LLM_CLIENT_POOL.get_client(
+            LLMProvider.CUSTOM,
+            base_url,
+            api_key,
+            lambda: AsyncOpenAI(base_url=base_url, api_key=api_key),
         )
 
+    # ? Rate limiting
+    def _get_prompt_text(self, messages: List[LLMMessage]) -> str:
+        return "".join(
+            message.content
+            for message in messages
+            if isinstance(getattr(message, "content", None), str)
+        )
+
+    def _estimate_tokens(
+        self, messages: List[LLMMessage], max_tokens: Optional[int] = None
+    ) -> int:
+        return estimate_tokens(self._get_prompt_text(messages), max_tokens)
+
+    async def _rate_limited_stream(
+        self,
+        create_stream: Callable[[], AsyncGenerator[str, None]],
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        attempt = 0
+        while True:
+            streamed_characters = 0
+            try:
+                async with LLM_RATE_LIMITER.slot(
+                    self.llm_provider, self._estimate_tokens(messages, max_tokens)
+                ):
+                    async for chunk in create_stream():
+                        streamed_characters += len(chunk)
+                        yield chunk
+                    # Streams do not report usage, estimate it from what was streamed
+                    record_llm_usage(
+                        (len(self._get_prompt_text(messages)) + streamed_characters)
+                        // 4
+                    )
+                LLM_RATE_LIMITER.record_success(self.llm_provider)
+                return
+            except Exception as e:
+                # Chunks already sent cannot be taken back
+                if streamed_characters or not LLM_RATE_LIMITER.should_retry(
+                    self.llm_provider, e, attempt
+                ):
+                    raise
+                attempt += 1
+
+    async def _create_openai_chat_completion(self, **kwargs):
+        client: AsyncOpenAI = self._client
+        response = await client.chat.completions.with_raw_response.create(**kwargs)
+        record_rate_limit_headers(response.headers)
+        return response.parse()
+
     # ? Prompts
     def _get_system_prompt(self, messages: List[LLMMessage]) -> str:
         for message in messages:
@@ -196,14 +280,14 @@ class LLMClient:
         extra_body: Optional[dict] = None,
         depth: int = 0,
     ) -> str | None:
-        client: AsyncOpenAI = self._client
-        response = await client.chat.completions.create(
+        response = await self._create_openai_chat_completion(
             model=model,
             messages=[message.model_dump() for message in messages],
             max_completion_tokens=max_tokens,
             tools=tools,
             extra_body=extra_body,
         )
+        record_llm_usage(get_usage_tokens(response))
 
         if len(response.choices) == 0:
             return None
@@ -270,6 +354,7 @@ class LLMClient:
                 max_output_tokens=max_tokens,
             ),
         )
+        record_llm_usage(get_usage_tokens(response))
 
         content = response.candidates[0].content
         response_parts = content.parts
@@ -333,6 +418,7 @@ class LLMClient:
             tools=tools,
             max_tokens=max_tokens or 4000,
         )
+        record_llm_usage(get_usage_tokens(response))
         text_content = None
         tool_calls: List[AnthropicToolCall] = []
         for content in response.content:
@@ -410,42 +496,58 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
-        content = None
-        match self.llm_provider:
-            case LLMProvider.OPENAI:
-                content = await self._generate_openai(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.GOOGLE:
-                content = await self._generate_google(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.ANTHROPIC:
-                content = await self._generate_anthropic(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.OLLAMA:
-                content = await self._generate_ollama(
-                    model=model, messages=messages, max_tokens=max_tokens
-                )
-            case LLMProvider.CUSTOM:
-                content = await self._generate_custom(
-                    model=model, messages=messages, max_tokens=max_tokens
-                )
+        async def call():
+            match self.llm_provider:
+                case LLMProvider.OPENAI:
+                    return await self._generate_openai(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.GOOGLE:
+                    return await self._generate_google(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.ANTHROPIC:
+                    return await self._generate_anthropic(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.OLLAMA:
+                    return await self._generate_ollama(
+                        model=model, messages=messages, max_tokens=max_tokens
+                    )
+                case LLMProvider.CUSTOM:
+                    return await self._generate_custom(
+                        model=model, messages=messages, max_tokens=max_tokens
+                    )
+
+        cache_key = LLM_RESPONSE_CACHE.get_key(
+            self.llm_provider,
+            model,
+            messages,
+            tools=parsed_tools,
+            max_tokens=max_tokens,
+        )
+        content = await LLM_RESPONSE_CACHE.get(cache_key)
+        if content is not None:
+            return content
+
+        content = await LLM_RATE_LIMITER.run(
+            self.llm_provider, self._estimate_tokens(messages, max_tokens), call
+        )
         if content is None:
             raise HTTPException(
                 status_code=400,
                 detail="LLM did not return any content",
             )
+        await LLM_RESPONSE_CACHE.set(cache_key, content)
         return content
 
     # ? Generate Structured Content
@@ -460,7 +562,6 @@ class LLMClient:
         extra_body: Optional[dict] = None,
         depth: int = 0,
     ) -> dict | None:
-        client: AsyncOpenAI = self._client
         response_schema = response_format
         all_tools = [*tools] if tools else None
 
@@ -488,7 +589,7 @@ class LLMClient:
                 )
             )
 
-        response = await client.chat.completions.create(
+        response = await self._create_openai_chat_completion(
             model=model,
             messages=[message.model_dump() for message in messages],
             response_format=(
@@ -509,6 +610,7 @@ class LLMClient:
             tools=all_tools,
             extra_body=extra_body,
         )
+        record_llm_usage(get_usage_tokens(response))
 
         if len(response.choices) == 0:
             return None
@@ -615,6 +717,7 @@ class LLMClient:
                 max_output_tokens=max_tokens,
             ),
         )
+        record_llm_usage(get_usage_tokens(response))
 
         content = response.candidates[0].content
         response_parts = content.parts
@@ -693,6 +796,7 @@ class LLMClient:
                 *(tools or []),
             ],
         )
+        record_llm_usage(get_usage_tokens(response))
         tool_calls: List[AnthropicToolCall] = []
         for content in response.content:
             if content.type == "tool_use":
@@ -784,54 +888,72 @@ class LLMClient:
     ) -> dict:
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
-        content = None
-        match self.llm_provider:
-            case LLMProvider.OPENAI:
-                content = await self._generate_openai_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.GOOGLE:
-                content = await self._generate_google_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.ANTHROPIC:
-                content = await self._generate_anthropic_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.OLLAMA:
-                content = await self._generate_ollama_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.CUSTOM:
-                content = await self._generate_custom_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    max_tokens=max_tokens,
-                )
+        async def call():
+            match self.llm_provider:
+                case LLMProvider.OPENAI:
+                    return await self._generate_openai_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.GOOGLE:
+                    return await self._generate_google_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.ANTHROPIC:
+                    return await self._generate_anthropic_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.OLLAMA:
+                    return await self._generate_ollama_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.CUSTOM:
+                    return await self._generate_custom_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        max_tokens=max_tokens,
+                    )
+
+        cache_key = LLM_RESPONSE_CACHE.get_key(
+            self.llm_provider,
+            model,
+            messages,
+            response_format=response_format,
+            tools=parsed_tools,
+            strict=strict,
+            max_tokens=max_tokens,
+        )
+        content = await LLM_RESPONSE_CACHE.get(cache_key)
+        if content is not None:
+            return content
+
+        content = await LLM_RATE_LIMITER.run(
+            self.llm_provider, self._estimate_tokens(messages, max_tokens), call
+        )
         if content is None:
             raise HTTPException(
                 status_code=400,
                 detail="LLM did not return any content",
             )
+        await LLM_RESPONSE_CACHE.set(cache_key, content)
         return content
 
     # ? Stream Unstructured Content
@@ -844,14 +966,12 @@ class LLMClient:
         extra_body: Optional[dict] = None,
         depth: int = 0,
     ) -> AsyncGenerator[str, None]:
-        client: AsyncOpenAI = self._client
-
         tool_calls: List[LLMToolCall] = []
         current_index = 0
         current_id = None
         current_name = None
         current_arguments = None
-        async for event in await client.chat.completions.create(
+        async for event in await self._create_openai_chat_completion(
             model=model,
             messages=[message.model_dump() for message in messages],
             max_completion_tokens=max_tokens,
@@ -1104,36 +1224,39 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
-        match self.llm_provider:
-            case LLMProvider.OPENAI:
-                return self._stream_openai(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.GOOGLE:
-                return self._stream_google(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.ANTHROPIC:
-                return self._stream_anthropic(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    tools=parsed_tools,
-                )
-            case LLMProvider.OLLAMA:
-                return self._stream_ollama(
-                    model=model, messages=messages, max_tokens=max_tokens
-                )
-            case LLMProvider.CUSTOM:
-                return self._stream_custom(
-                    model=model, messages=messages, max_tokens=max_tokens
-                )
+        def create_stream():
+            match self.llm_provider:
+                case LLMProvider.OPENAI:
+                    return self._stream_openai(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.GOOGLE:
+                    return self._stream_google(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.ANTHROPIC:
+                    return self._stream_anthropic(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        tools=parsed_tools,
+                    )
+                case LLMProvider.OLLAMA:
+                    return self._stream_ollama(
+                        model=model, messages=messages, max_tokens=max_tokens
+                    )
+                case LLMProvider.CUSTOM:
+                    return self._stream_custom(
+                        model=model, messages=messages, max_tokens=max_tokens
+                    )
+
+        return self._rate_limited_stream(create_stream, messages, max_tokens)
 
     # ? Stream Structured Content
     async def _stream_openai_structured(
@@ -1147,8 +1270,6 @@ class LLMClient:
         extra_body: Optional[dict] = None,
         depth: int = 0,
     ) -> AsyncGenerator[str, None]:
-        client: AsyncOpenAI = self._client
-
         response_schema = response_format
         all_tools = [*tools] if tools else None
 
@@ -1184,7 +1305,7 @@ class LLMClient:
         current_arguments = None
 
         has_response_schema_tool_call = False
-        async for event in await client.chat.completions.create(
+        async for event in await self._create_openai_chat_completion(
             model=model,
             messages=[message.model_dump() for message in messages],
             max_completion_tokens=max_tokens,
@@ -1528,48 +1649,51 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
-        match self.llm_provider:
-            case LLMProvider.OPENAI:
-                return self._stream_openai_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.GOOGLE:
-                return self._stream_google_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.ANTHROPIC:
-                return self._stream_anthropic_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    tools=parsed_tools,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.OLLAMA:
-                return self._stream_ollama_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    max_tokens=max_tokens,
-                )
-            case LLMProvider.CUSTOM:
-                return self._stream_custom_structured(
-                    model=model,
-                    messages=messages,
-                    response_format=response_format,
-                    strict=strict,
-                    max_tokens=max_tokens,
-                )
+        def create_stream():
+            match self.llm_provider:
+                case LLMProvider.OPENAI:
+                    return self._stream_openai_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.GOOGLE:
+                    return self._stream_google_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.ANTHROPIC:
+                    return self._stream_anthropic_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        tools=parsed_tools,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.OLLAMA:
+                    return self._stream_ollama_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        max_tokens=max_tokens,
+                    )
+                case LLMProvider.CUSTOM:
+                    return self._stream_custom_structured(
+                        model=model,
+                        messages=messages,
+                        response_format=response_format,
+                        strict=strict,
+                        max_tokens=max_tokens,
+                    )
+
+        return self._rate_limited_stream(create_stream, messages, max_tokens)
 
     # ? Web search
     async def _search_openai(self, query: str) -> str:
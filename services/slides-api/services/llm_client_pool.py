@@ -0,0 +1,53 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from enums.llm_provider import LLMProvider
+
+
+LLMClientPoolKey = Tuple[LLMProvider, Optional[str], Optional[str]]
+
+
+class LLMClientPool:
+    """
+    Process wide registry of provider SDK clients.
+
+    Every SDK client owns its own HTTP connection pool, so building one per
+    LLM call means a new TLS handshake per slide. Clients are keyed by
+    provider, base url and api key: as long as the credentials stay the same
+    the warm client is reused, and a new one is only built when the user
+    config actually changes them.
+    """
+
+    def __init__(self):
+        self._clients: Dict[LLMProvider, Tuple[LLMClientPoolKey, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        provider: LLMProvider,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        factory: Callable[[], Any],
+    ):
+        key = (provider, base_url, api_key)
+        with self._lock:
+            cached = self._clients.get(provider)
+            if cached and cached[0] == key:
+                return cached[1]
+
+            # Only one client is kept per provider. The stale one is not closed
+            # here as in-flight requests may still be using it, it is released
+            # once the last reference goes away.
+            client = factory()
+            self._clients[provider] = (key, client)
+            return client
+
+    def invalidate(self, provider: Optional[LLMProvider] = None):
+        with self._lock:
+            if provider is None:
+                self._clients.clear()
+            else:
+                self._clients.pop(provider, None)
+
+
+LLM_CLIENT_POOL = LLMClientPool()
@@ -0,0 +1,368 @@
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import random
+import re
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from enums.llm_provider import LLMProvider
+from utils.get_env import (
+    get_llm_max_concurrency_env,
+    get_llm_max_retries_env,
+    get_llm_tokens_per_minute_env,
+)
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_LLM_MAX_CONCURRENCY = 8
+DEFAULT_LLM_MAX_RETRIES = 4
+RATE_LIMIT_STATUS_CODES = (429, 529)
+
+# Presentation (or request) the current LLM call is made for. Slots are handed
+# out round robin between owners so one large deck cannot starve the others.
+LLM_REQUEST_OWNER: ContextVar[str] = ContextVar("llm_request_owner", default="")
+
+
+class _TokenReservation:
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+        self.reported = False
+
+
+# Tokens reserved by the LLM call running in the current context, replaced by
+# the usage the provider reports once the call returns
+LLM_TOKEN_RESERVATION: ContextVar[Optional[_TokenReservation]] = ContextVar(
+    "llm_token_reservation", default=None
+)
+
+# Provider state of the LLM call running in the current context, updated with
+# the rate limit headers of its responses
+LLM_PROVIDER_STATE: ContextVar[Optional["_ProviderState"]] = ContextVar(
+    "llm_provider_state", default=None
+)
+
+
+def set_llm_request_owner(owner: str):
+    LLM_REQUEST_OWNER.set(owner)
+
+
+def record_llm_usage(tokens: Optional[int]):
+    reservation = LLM_TOKEN_RESERVATION.get()
+    if reservation is None or not tokens:
+        return
+    # Tool calls make several requests under the same slot
+    if reservation.reported:
+        reservation.tokens += tokens
+    else:
+        reservation.tokens = tokens
+        reservation.reported = True
+
+
+def record_rate_limit_headers(headers: Any):
+    state = LLM_PROVIDER_STATE.get()
+    if state is None or not headers:
+        return
+    state.update_remaining(headers, time.monotonic())
+
+
+def get_usage_tokens(response: Any) -> Optional[int]:
+    # OpenAI and Anthropic responses have usage, Google ones usage_metadata
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        total_tokens = getattr(usage, "total_tokens", None)
+        if total_tokens is None:
+            total_tokens = (getattr(usage, "input_tokens", None) or 0) + (
+                getattr(usage, "output_tokens", None) or 0
+            )
+        return total_tokens
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if usage_metadata is not None:
+        return getattr(usage_metadata, "total_token_count", None)
+    return None
+
+
+def estimate_tokens(text: str, max_tokens: Optional[int] = None) -> int:
+    # Roughly 4 characters per token, plus the expected completion
+    return len(text) // 4 + (max_tokens or 1000)
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    # Supports "12", "1.5", "20ms", "6m0s" and "1h2m3.5s"
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    total = 0.0
+    matches = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not matches:
+        return None
+    for amount, unit in matches:
+        total += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total
+
+
+def _get_header_duration(headers: Any, header: str) -> Optional[float]:
+    value = headers.get(header)
+    return _parse_duration(value) if value else None
+
+
+def get_rate_limit_status(e: Exception) -> Optional[int]:
+    status = getattr(e, "status_code", None) or getattr(e, "code", None)
+    if isinstance(status, int) and status in RATE_LIMIT_STATUS_CODES:
+        return status
+    return None
+
+
+def get_retry_after(e: Exception) -> Optional[float]:
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        duration = _parse_duration(retry_after_ms)
+        if duration is not None:
+            return duration / 1000
+
+    for header in (
+        "retry-after",
+        "x-ratelimit-reset-tokens",
+        "x-ratelimit-reset-requests",
+    ):
+        value = headers.get(header)
+        if value:
+            duration = _parse_duration(value)
+            if duration is not None:
+                return duration
+    return None
+
+
+class _ProviderState:
+    def __init__(self, max_concurrency: int, tokens_per_minute: Optional[int]):
+        self.max_concurrency = max_concurrency
+        self.concurrency_limit = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.token_usage: Deque[Tuple[float, _TokenReservation]] = deque()
+        self.waiters: OrderedDict[
+            str, Deque[Tuple[asyncio.Future, _TokenReservation]]
+        ] = OrderedDict()
+        self.wakeup: Optional[asyncio.TimerHandle] = None
+        # Tokens the provider reported as remaining until remaining_tokens_reset_at
+        self.remaining_tokens: Optional[int] = None
+        self.remaining_tokens_reset_at = 0.0
+
+    def update_remaining(self, headers: Any, now: float):
+        remaining_tokens = parse_int_or_none(
+            headers.get("x-ratelimit-remaining-tokens")
+        )
+        reset_tokens = _get_header_duration(headers, "x-ratelimit-reset-tokens")
+        if remaining_tokens is not None and reset_tokens is not None:
+            self.remaining_tokens = remaining_tokens
+            self.remaining_tokens_reset_at = now + reset_tokens
+
+        remaining_requests = parse_int_or_none(
+            headers.get("x-ratelimit-remaining-requests")
+        )
+        reset_requests = _get_header_duration(headers, "x-ratelimit-reset-requests")
+        if remaining_requests == 0 and reset_requests is not None:
+            self.cooldown_until = max(self.cooldown_until, now + reset_requests)
+
+    def tokens_used(self, now: float) -> int:
+        while self.token_usage and now - self.token_usage[0][0] >= 60:
+            self.token_usage.popleft()
+        return sum(reservation.tokens for _, reservation in self.token_usage)
+
+
+class LLMRateLimiter:
+    """
+    Process wide scheduler for LLM calls.
+
+    Enforces a per provider concurrency cap and an optional tokens per minute
+    budget. Each call reserves its estimated tokens, corrected with the usage
+    reported through record_llm_usage. Calls also wait while the remaining
+    tokens or requests reported through record_rate_limit_headers are used
+    up. The concurrency cap adapts: it is halved whenever the provider rate
+    limits us and grows back by one slot per successful call. Rate limited
+    calls are retried after the delay advertised in the response headers, or
+    an exponential backoff with jitter.
+    """
+
+    def __init__(self):
+        self._providers: Dict[LLMProvider, _ProviderState] = {}
+
+    def _get_state(self, provider: LLMProvider) -> _ProviderState:
+        state = self._providers.get(provider)
+        max_concurrency = (
+            parse_int_or_none(get_llm_max_concurrency_env())
+            or DEFAULT_LLM_MAX_CONCURRENCY
+        )
+        tokens_per_minute = parse_int_or_none(get_llm_tokens_per_minute_env())
+        if state is None:
+            state = _ProviderState(max_concurrency, tokens_per_minute)
+            self._providers[provider] = state
+        elif (
+            state.max_concurrency != max_concurrency
+            or state.tokens_per_minute != tokens_per_minute
+        ):
+            state.max_concurrency = max_concurrency
+            state.concurrency_limit = min(state.concurrency_limit, max_concurrency)
+            state.tokens_per_minute = tokens_per_minute
+        return state
+
+    def _next_waiter(self, state: _ProviderState):
+        while state.waiters:
+            owner, queue = next(iter(state.waiters.items()))
+            while queue and queue[0][0].done():
+                queue.popleft()
+            if not queue:
+                state.waiters.pop(owner)
+                continue
+            return owner, queue
+        return None
+
+    def _schedule_wakeup(self, state: _ProviderState, delay: float):
+        if state.wakeup:
+            state.wakeup.cancel()
+        state.wakeup = asyncio.get_running_loop().call_later(
+            max(delay, 0.01), self._dispatch, state
+        )
+
+    def _dispatch(self, state: _ProviderState):
+        state.wakeup = None
+        while state.in_flight < state.concurrency_limit:
+            next_waiter = self._next_waiter(state)
+            if next_waiter is None:
+                return
+            owner, queue = next_waiter
+
+            now = time.monotonic()
+            if now < state.cooldown_until:
+                self._schedule_wakeup(state, state.cooldown_until - now)
+                return
+
+            future, reservation = queue[0]
+            # A call larger than the whole budget still runs once the window
+            # is empty
+            if (
+                state.tokens_per_minute
+                and state.tokens_used(now) + reservation.tokens
+                > state.tokens_per_minute
+                and state.token_usage
+            ):
+                self._schedule_wakeup(state, 60 - (now - state.token_usage[0][0]))
+                return
+            if (
+                state.remaining_tokens is not None
+                and now < state.remaining_tokens_reset_at
+                and reservation.tokens > state.remaining_tokens
+            ):
+                self._schedule_wakeup(state, state.remaining_tokens_reset_at - now)
+                return
+
+            queue.popleft()
+            # Round robin: the owner goes to the back of the line
+            state.waiters.pop(owner)
+            if queue:
+                state.waiters[owner] = queue
+
+            state.in_flight += 1
+            state.token_usage.append((now, reservation))
+            if state.remaining_tokens is not None:
+                state.remaining_tokens -= reservation.tokens
+            future.set_result(None)
+
+    def _release(self, state: _ProviderState):
+        state.in_flight -= 1
+        self._dispatch(state)
+
+    @asynccontextmanager
+    async def slot(self, provider: LLMProvider, tokens: int):
+        state = self._get_state(provider)
+        future = asyncio.get_running_loop().create_future()
+        reservation = _TokenReservation(tokens)
+        state.waiters.setdefault(LLM_REQUEST_OWNER.get(), deque()).append(
+            (future, reservation)
+        )
+        self._dispatch(state)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Slot might have been granted right before cancellation
+            if future.done() and not future.cancelled():
+                self._release(state)
+            else:
+                future.cancel()
+            raise
+
+        previous_reservation = LLM_TOKEN_RESERVATION.get()
+        previous_state = LLM_PROVIDER_STATE.get()
+        LLM_TOKEN_RESERVATION.set(reservation)
+        LLM_PROVIDER_STATE.set(state)
+        try:
+            yield
+        finally:
+            LLM_TOKEN_RESERVATION.set(previous_reservation)
+            LLM_PROVIDER_STATE.set(previous_state)
+            self._release(state)
+
+    def _on_success(self, state: _ProviderState):
+        if state.concurrency_limit < state.max_concurrency:
+            state.concurrency_limit += 1
+
+    def _on_rate_limited(self, state: _ProviderState, retry_after: float):
+        state.concurrency_limit = max(1, state.concurrency_limit // 2)
+        state.cooldown_until = max(
+            state.cooldown_until, time.monotonic() + retry_after
+        )
+
+    def record_success(self, provider: LLMProvider):
+        self._on_success(self._get_state(provider))
+
+    def should_retry(self, provider: LLMProvider, e: Exception, attempt: int) -> bool:
+        """
+        Returns whether a call that failed with e should be retried, after
+        backing off the provider if it rate limited us.
+        """
+        max_retries = parse_int_or_none(get_llm_max_retries_env())
+        if max_retries is None:
+            max_retries = DEFAULT_LLM_MAX_RETRIES
+        if get_rate_limit_status(e) is None or attempt >= max_retries:
+            return False
+
+        backoff = min(60, 2**attempt) * (0.5 + random.random())
+        retry_after = max(get_retry_after(e) or 0, backoff)
+        print(
+            f"LLM provider {provider.value} rate limited, "
+            f"retrying in {retry_after:.1f}s"
+        )
+        self._on_rate_limited(self._get_state(provider), retry_after)
+        return True
+
+    async def run(
+        self,
+        provider: LLMProvider,
+        tokens: int,
+        call: Callable[[], Awaitable[Any]],
+    ):
+        attempt = 0
+        while True:
+            try:
+                async with self.slot(provider, tokens):
+                    result = await call()
+                self.record_success(provider)
+                return result
+            except Exception as e:
+                if not self.should_retry(provider, e, attempt):
+                    raise
+                attempt += 1
+
+
+LLM_RATE_LIMITER = LLMRateLimiter()
@@ -0,0 +1,242 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional
+
+from enums.llm_provider import LLMProvider
+from models.llm_message import LLMMessage
+from utils.asset_directory_utils import get_cache_directory
+from utils.get_env import (
+    get_llm_response_cache_env,
+    get_llm_response_cache_max_disk_entries_env,
+    get_llm_response_cache_max_entries_env,
+    get_llm_response_cache_ttl_env,
+)
+from utils.parsers import parse_bool_or_none, parse_int_or_none
+
+
+DEFAULT_LLM_RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES = 512
+DEFAULT_LLM_RESPONSE_CACHE_MAX_DISK_ENTRIES = 10000
+
+# Prompts embed the current date and time, which would make every key unique
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d+)?")
+
+
+class LLMResponseCache:
+    """
+    Opt-in content addressed cache for non streamed LLM responses.
+
+    Responses are keyed on a hash of the provider, model, messages, response
+    schema and tools. Entries live in an in-memory LRU and in a SQLite file
+    under the app data directory, both bounded by size and TTL.
+    """
+
+    def __init__(self):
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def is_enabled(self) -> bool:
+        return parse_bool_or_none(get_llm_response_cache_env()) or False
+
+    def _get_ttl(self) -> int:
+        return (
+            parse_int_or_none(get_llm_response_cache_ttl_env())
+            or DEFAULT_LLM_RESPONSE_CACHE_TTL
+        )
+
+    def _get_max_entries(self) -> int:
+        return (
+            parse_int_or_none(get_llm_response_cache_max_entries_env())
+            or DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES
+        )
+
+    def _get_max_disk_entries(self) -> int:
+        return (
+            parse_int_or_none(get_llm_response_cache_max_disk_entries_env())
+            or DEFAULT_LLM_RESPONSE_CACHE_MAX_DISK_ENTRIES
+        )
+
+    def get_key(
+        self,
+        provider: LLMProvider,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: Optional[dict] = None,
+        tools: Optional[List[dict]] = None,
+        **params,
+    ) -> Optional[str]:
+        if not self.is_enabled():
+            return None
+
+        payload = json.dumps(
+            {
+                "provider": provider.value,
+                "model": model,
+                "messages": [
+                    message.model_dump(mode="json") for message in messages
+                ],
+                "response_format": response_format,
+                "tools": tools,
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        payload = TIMESTAMP_PATTERN.sub("", payload)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ? Disk tier
+    # Called with _disk_lock held, the connection is shared between threads
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(
+                os.path.join(get_cache_directory(), "llm_responses.db"),
+                timeout=30,
+                check_same_thread=False,
+            )
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS llm_responses_accessed_at "
+                    "ON llm_responses (accessed_at)"
+                )
+            self._disk_entries = self._count_disk_entries(connection)
+            self._connection = connection
+        return self._connection
+
+    def _count_disk_entries(self, connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def _get_from_disk(self, key: str, now: float) -> Optional[tuple[float, str]]:
+        with self._disk_lock, self._get_connection() as connection:
+            row = connection.execute(
+                "SELECT created_at, value FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[0] > self._get_ttl():
+                connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._disk_entries -= 1
+                return None
+            connection.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0], row[1]
+
+    def _set_on_disk(self, key: str, value: str, now: float):
+        with self._disk_lock, self._get_connection() as connection:
+            updated = connection.execute(
+                "UPDATE llm_responses SET value = ?, created_at = ?, accessed_at = ? "
+                "WHERE key = ?",
+                (value, now, now, key),
+            ).rowcount
+            if updated:
+                return
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._disk_entries += 1
+
+            max_disk_entries = self._get_max_disk_entries()
+            if self._disk_entries <= max_disk_entries:
+                return
+            # Other processes may share the file, recount before evicting
+            connection.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self._get_ttl(),),
+            )
+            disk_entries = self._count_disk_entries(connection)
+            if disk_entries > max_disk_entries:
+                connection.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                    (disk_entries - max_disk_entries,),
+                )
+            self._disk_entries = min(disk_entries, max_disk_entries)
+
+    # ? Memory tier
+    def _set_in_memory(self, key: str, created_at: float, value: str):
+        with self._lock:
+            self._memory[key] = (created_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._get_max_entries():
+                self._memory.popitem(last=False)
+
+    def _get_from_memory(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if now - entry[0] > self._get_ttl():
+                self._memory.pop(key)
+                return None
+            self._memory.move_to_end(key)
+            return entry[1]
+
+    async def get(self, key: Optional[str]) -> Optional[Any]:
+        if key is None:
+            return None
+
+        now = time.time()
+        value = self._get_from_memory(key, now)
+        if value is not None:
+            self.memory_hits += 1
+            # Always return a fresh copy, callers mutate the response
+            return json.loads(value)
+
+        try:
+            entry = await asyncio.to_thread(self._get_from_disk, key, now)
+        except Exception as e:
+            print(f"Error reading LLM response cache: {e}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._set_in_memory(key, *entry)
+        return json.loads(entry[1])
+
+    async def set(self, key: Optional[str], response: Any):
+        if key is None or response is None:
+            return
+
+        now = time.time()
+        value = json.dumps(response)
+        self._set_in_memory(key, now, value)
+        try:
+            await asyncio.to_thread(self._set_on_disk, key, value, now)
+        except Exception as e:
+            print(f"Error writing LLM response cache: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.is_enabled(),
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+LLM_RESPONSE_CACHE = LLMResponseCache()
@@ -0,0 +1,47 @@
+import json
+from typing import Any, Callable, List
+
+import numpy as np
+
+
+# Built by scripts/build_icon_index.py
+ICON_EMBEDDINGS_PATH = "assets/icon_embeddings.npy"
+ICON_EMBEDDINGS_IDS_PATH = "assets/icon_embeddings_ids.json"
+
+
+class NumpyIconIndex:
+    """
+    Icon embeddings held in a contiguous float32 matrix.
+
+    The normalized matrix is memory mapped from a .npy file, so the top k
+    icons of a whole batch of queries come from a single matrix product
+    instead of an HNSW search backed by SQLite.
+    """
+
+    def __init__(
+        self,
+        embedding_function: Callable[[List[str]], Any],
+        embeddings_path: str = ICON_EMBEDDINGS_PATH,
+        ids_path: str = ICON_EMBEDDINGS_IDS_PATH,
+    ):
+        self.embedding_function = embedding_function
+        self.embeddings = np.load(embeddings_path, mmap_mode="r")
+        with open(ids_path, "r") as f:
+            self.ids: List[str] = json.load(f)
+
+    def query(self, query_texts: List[str], n_results: int) -> List[List[str]]:
+        return self.query_embeddings(self.embedding_function(query_texts), n_results)
+
+    def query_embeddings(self, embeddings, n_results: int) -> List[List[str]]:
+        queries = np.array(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries /= np.maximum(norms, 1e-12)
+
+        # Cosine similarity, as the rows of the matrix are normalized
+        scores = queries @ self.embeddings.T
+
+        n_results = min(n_results, len(self.ids))
+        top = np.argpartition(-scores, n_results - 1, axis=1)[:, :n_results]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        return [[self.ids[index] for index in row] for row in top]
@@ -0,0 +1,223 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import math
+import multiprocessing
+import os
+import threading
+from typing import AsyncIterator, List, Optional, Tuple
+
+import pypdfium2 as pdfium
+
+from utils.get_env import get_rasterizer_workers_env
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_RASTERIZER_DPI = 150
+# Below this many pages a document is rendered in a thread of this process
+MIN_PAGES_PER_PROCESS = 4
+
+# PDFium is not thread safe, so threads of a process take turns using it
+PDFIUM_LOCK = threading.Lock()
+
+
+def get_render_scale(
+    page_width: float,
+    page_height: float,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    dpi: int = DEFAULT_RASTERIZER_DPI,
+) -> float:
+    """
+    Scale from PDF points to pixels fitting the page in width x height,
+    or at the given DPI without target size.
+    """
+    scales = []
+    if width:
+        scales.append(width / page_width)
+    if height:
+        scales.append(height / page_height)
+    return min(scales) if scales else dpi / 72
+
+
+def render_pdf_pages(
+    pdf_path: str,
+    output_dir: str,
+    page_indexes: List[int],
+    filename_format: str,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    dpi: int = DEFAULT_RASTERIZER_DPI,
+) -> List[str]:
+    """
+    Renders the given pages of a PDF as PNG files, each written as soon as
+    it is rendered. Runs in the rasterizer processes.
+    """
+    paths = []
+    with PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for index in page_indexes:
+            with PDFIUM_LOCK:
+                page = pdf[index]
+                try:
+                    page_width, page_height = page.get_size()
+                    scale = get_render_scale(
+                        page_width, page_height, width, height, dpi
+                    )
+                    bitmap = page.render(scale=scale)
+                    # Copied, as the bitmap memory is freed by PDFium
+                    image = bitmap.to_pil().copy()
+                    bitmap.close()
+                finally:
+                    page.close()
+
+            # Encoding does not use PDFium, other threads render meanwhile
+            path = os.path.join(
+                output_dir, filename_format.format(index=index, number=index + 1)
+            )
+            image.save(path)
+            paths.append(path)
+    finally:
+        with PDFIUM_LOCK:
+            pdf.close()
+    return paths
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    with PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+class PdfRasterizer:
+    """
+    Renders the pages of PDFs to images with PDFium, splitting the pages of
+    large documents in ranges rendered in parallel by a process pool of
+    RASTERIZER_WORKERS processes (PDFium is not thread safe).
+
+    Pages are sized to fit a target width and/or height in pixels, or at a
+    DPI without target size. With RASTERIZER_WORKERS=0, and for small
+    documents, pages are rendered in threads of this process instead, which
+    take turns using PDFium.
+    """
+
+    def __init__(self):
+        workers = parse_int_or_none(get_rasterizer_workers_env())
+        self.max_workers = (
+            workers if workers is not None else min(4, os.cpu_count() or 1)
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def rasterize(
+        self,
+        pdf_path: str,
+        output_dir: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        dpi: int = DEFAULT_RASTERIZER_DPI,
+        filename_format: str = "page_{number}.png",
+    ) -> List[str]:
+        """
+        Renders every page of the PDF into output_dir and returns the image
+        paths in page order. filename_format gets the page index (from 0)
+        and number (from 1).
+        """
+        pages = [
+            page
+            async for page in self.iter_rasterize(
+                pdf_path, output_dir, width, height, dpi, filename_format
+            )
+        ]
+        return [path for _, path in sorted(pages)]
+
+    async def iter_rasterize(
+        self,
+        pdf_path: str,
+        output_dir: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        dpi: int = DEFAULT_RASTERIZER_DPI,
+        filename_format: str = "page_{number}.png",
+        range_size: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Same as rasterize, but yields (page index, image path) as soon as
+        each range of range_size pages is rendered, in completion order.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        page_count = await asyncio.to_thread(get_pdf_page_count, pdf_path)
+        render_args = (filename_format, width, height, dpi)
+
+        in_process = self.max_workers == 0 or page_count < MIN_PAGES_PER_PROCESS * 2
+        if not range_size:
+            # Smaller ranges than one per worker even out slow pages
+            range_size = (
+                max(1, page_count)
+                if in_process
+                else max(
+                    MIN_PAGES_PER_PROCESS,
+                    math.ceil(page_count / (self.max_workers * 2)),
+                )
+            )
+        ranges = [
+            list(range(start, min(start + range_size, page_count)))
+            for start in range(0, page_count, range_size)
+        ]
+
+        if in_process:
+            for page_indexes in ranges:
+                paths = await asyncio.to_thread(
+                    render_pdf_pages, pdf_path, output_dir, page_indexes, *render_args
+                )
+                for page in zip(page_indexes, paths):
+                    yield page
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = {
+            loop.run_in_executor(
+                self._get_executor(),
+                render_pdf_pages,
+                pdf_path,
+                output_dir,
+                page_indexes,
+                *render_args,
+            ): page_indexes
+            for page_indexes in ranges
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    page_indexes = pending.pop(future)
+                    for page in zip(page_indexes, future.result()):
+                        yield page
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+        finally:
+            # Ranges not started yet are dropped when the caller stops early
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+PDF_RASTERIZER = PdfRasterizer()
@@ -28,12 +28,14 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.oxml.ns import qn
 from pptx.oxml import parse_xml
-import aiohttp
 
 from services.design_system_extractor import (
     DesignSystem, SlideLayoutInfo, LayoutType,
     PlaceholderInfo, TextStyleInfo, FontInfo, ColorInfo
 )
+from services.export_executor import EXPORT_EXECUTOR
+from services.pptx_template_cache import PPTX_TEMPLATE_CACHE
+from utils.download_helpers import download_images
 
 
 @dataclass
@@ -69,6 +71,7 @@ class PptxBuilder:
         self.template_path = template_path
         self.prs: Optional[Presentation] = None
         self.output_path: Optional[str] = None
+        self.images: Dict[str, bytes] = {}
 
     async def build(
         self,
@@ -87,8 +90,35 @@ class PptxBuilder:
         Returns:
             Path to generated PPTX
         """
-        # Load template
-        self.prs = Presentation(self.template_path)
+        output_dir = output_dir or tempfile.gettempdir()
+        self.output_path = os.path.join(output_dir, f"{output_filename}.pptx")
+
+        # Images are downloaded here, the CPU bound build runs in the executor
+        images = await download_images(
+            [content.image_url for content in slides_content]
+        )
+        await EXPORT_EXECUTOR.run(
+            build_pptx_file,
+            self.design_system,
+            self.template_path,
+            slides_content,
+            self.output_path,
+            images,
+        )
+
+        return self.output_path
+
+    def build_sync(
+        self,
+        slides_content: List[SlideContent],
+        output_path: str,
+        images: Dict[str, bytes]
+    ):
+        """Build and save the PPTX with images already downloaded, by URL"""
+        self.images = images
+
+        # Load a copy of the parsed template
+        self.prs = PPTX_TEMPLATE_CACHE.open(self.template_path)
         template_slide_count = len(self.prs.slides)
 
         # Process each content item
@@ -96,30 +126,27 @@ class PptxBuilder:
             if idx < template_slide_count:
                 # Use existing slide
                 slide = self.prs.slides[idx]
-                await self._fill_slide(slide, content, idx)
+                self._fill_slide(slide, content, idx)
             else:
                 # Need to add new slide - find best layout
                 best_layout_idx = self._select_best_layout(content)
                 if best_layout_idx < template_slide_count:
                     # Duplicate an existing slide
                     slide = self._duplicate_slide(best_layout_idx)
-                    await self._fill_slide(slide, content, idx)
+                    self._fill_slide(slide, content, idx)
                 else:
                     # Create from layout
                     slide = self._create_slide_from_layout(best_layout_idx)
-                    await self._fill_slide(slide, content, idx)
+                    self._fill_slide(slide, content, idx)
 
         # Remove unused slides
         while len(self.prs.slides) > len(slides_content):
             self._remove_last_slide()
 
         # Save
-        output_dir = output_dir or tempfile.gettempdir()
-        self.output_path = os.path.join(output_dir, f"{output_filename}.pptx")
+        self.output_path = output_path
         self.prs.save(self.output_path)
 
-        return self.output_path
-
     def _select_best_layout(self, content: SlideContent) -> int:
         """Select the best layout for given content"""
         # Check content hints first
@@ -161,7 +188,7 @@ class PptxBuilder:
         # Fallback to second slide (usually content)
         return min(1, len(self.design_system.layouts) - 1)
 
-    async def _fill_slide(self, slide, content: SlideContent, slide_idx: int):
+    def _fill_slide(self, slide, content: SlideContent, slide_idx: int):
         """Fill a slide with content while preserving styling"""
         # Get layout info
         layout_info = None
@@ -199,12 +226,12 @@ class PptxBuilder:
                     body_filled = True
 
             elif ph_type == 'picture' and content.image_url:
-                await self._replace_picture(slide, shape, content.image_url)
+                self._replace_picture(slide, shape, content.image_url)
 
         # Second pass: Fill static text shapes if content not yet placed
         # This handles templates that use TextBoxes instead of native placeholders
         if not title_filled or not body_filled:
-            await self._fill_static_text_shapes(slide, content, layout_info, title_filled, subtitle_filled, body_filled)
+            self._fill_static_text_shapes(slide, content, layout_info, title_filled, subtitle_filled, body_filled)
 
         # Add speaker notes
         if content.speaker_notes:
@@ -370,10 +397,9 @@ class PptxBuilder:
         # For basic cases, we'll rely on the template's default styling
         pass
 
-    async def _replace_picture(self, slide, shape, image_url: str):
+    def _replace_picture(self, slide, shape, image_url: str):
         """Replace a picture placeholder with new image"""
-        # Download image
-        image_bytes = await self._download_image(image_url)
+        image_bytes = self.images.get(image_url)
         if not image_bytes:
             return
 
@@ -397,17 +423,6 @@ class PptxBuilder:
         finally:
             os.unlink(tmp_path)
 
-    async def _download_image(self, url: str) -> Optional[bytes]:
-        """Download image from URL"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.read()
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-        return None
-
     def _has_placeholder_for_content(self, slide, content: SlideContent) -> bool:
         """Check if slide has placeholders for all content"""
         has_title_ph = False
@@ -427,7 +442,7 @@ class PptxBuilder:
 
         return True
 
-    async def _fill_static_text_shapes(
+    def _fill_static_text_shapes(
         self,
         slide,
         content: SlideContent,
@@ -478,9 +493,9 @@ class PptxBuilder:
 
         # Fallback: if still not filled, use position-based matching
         if not title_filled or not body_filled:
-            await self._fill_shapes_by_position(slide, content, title_filled, subtitle_filled, body_filled)
+            self._fill_shapes_by_position(slide, content, title_filled, subtitle_filled, body_filled)
 
-    async def _fill_shapes_by_position(
+    def _fill_shapes_by_position(
         self,
         slide,
         content: SlideContent,
@@ -533,7 +548,7 @@ class PptxBuilder:
             elif content.body:
                 self._fill_text_preserving_style(middle_shapes[0], content.body)
 
-    async def _fill_non_placeholder_shapes(self, slide, content: SlideContent):
+    def _fill_non_placeholder_shapes(self, slide, content: SlideContent):
         """Fill content in non-placeholder shapes when needed (legacy method)"""
         # Find text shapes that might be used for content
         text_shapes = []
@@ -605,6 +620,17 @@ class PptxBuilder:
             del self.prs.slides._sldIdLst[-1]
 
 
+def build_pptx_file(
+    design_system: DesignSystem,
+    template_path: str,
+    slides_content: List[SlideContent],
+    output_path: str,
+    images: Dict[str, bytes]
+):
+    """Entry point of the export executor workers"""
+    PptxBuilder(design_system, template_path).build_sync(slides_content, output_path, images)
+
+
 async def build_pptx_from_design_system(
     design_system: DesignSystem,
     template_path: str,
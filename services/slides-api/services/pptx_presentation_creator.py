@@ -1,4 +1,3 @@
-import os
 from typing import List, Optional
 from lxml import etree
 from services.html_to_text_runs_service import (
@@ -34,19 +33,33 @@ from models.pptx_models import (
     PptxTextBoxModel,
     PptxTextRunModel,
 )
-from utils.download_helpers import download_files
+from services.export_executor import EXPORT_EXECUTOR
+from services.image_transform_cache import IMAGE_TRANSFORM_CACHE
+from services.pptx_slide_cache import PPTX_SLIDE_CACHE
+from utils.download_helpers import download_files, get_local_image_path
 from utils.image_utils import (
     clip_image,
     create_circle_image,
+    downscale_to_cover,
     fit_image,
     invert_image,
     round_image_corners,
     set_image_opacity,
 )
-import uuid
 
 BLANK_SLIDE_LAYOUT = 6
 
+# Fields of a picture box changing its transformed image
+TRANSFORM_PARAMETERS = {
+    "position": {"width", "height"},
+    "clip": True,
+    "opacity": True,
+    "invert": True,
+    "border_radius": True,
+    "shape": True,
+    "object_fit": True,
+}
+
 
 class PptxPresentationCreator:
     def __init__(self, ppt_model: PptxPresentationModel, temp_dir: str):
@@ -70,35 +83,21 @@ class PptxPresentationCreator:
         image_urls = []
         models_with_network_asset: List[PptxPictureBoxModel] = []
 
-        if self._ppt_model.shapes:
-            for each_shape in self._ppt_model.shapes:
-                if isinstance(each_shape, PptxPictureBoxModel):
-                    image_path = each_shape.picture.path
-                    if image_path.startswith("http"):
-                        if "app_data/" in image_path:
-                            relative_path = image_path.split("app_data/")[1]
-                            each_shape.picture.path = os.path.join(
-                                "/app_data", relative_path
-                            )
-                            each_shape.picture.is_network = False
-                            continue
-                        image_urls.append(image_path)
-                        models_with_network_asset.append(each_shape)
-
+        shapes = list(self._ppt_model.shapes or [])
         for each_slide in self._slide_models:
-            for each_shape in each_slide.shapes:
-                if isinstance(each_shape, PptxPictureBoxModel):
-                    image_path = each_shape.picture.path
-                    if image_path.startswith("http"):
-                        if "app_data" in image_path:
-                            relative_path = image_path.split("app_data/")[1]
-                            each_shape.picture.path = os.path.join(
-                                "/app_data", relative_path
-                            )
-                            each_shape.picture.is_network = False
-                            continue
-                        image_urls.append(image_path)
-                        models_with_network_asset.append(each_shape)
+            shapes.extend(each_slide.shapes)
+
+        for each_shape in shapes:
+            if isinstance(each_shape, PptxPictureBoxModel):
+                image_path = each_shape.picture.path
+                # Images served by this app are read from disk
+                local_path = get_local_image_path(image_path)
+                if local_path:
+                    each_shape.picture.path = local_path
+                    each_shape.picture.is_network = False
+                elif image_path.startswith("http"):
+                    image_urls.append(image_path)
+                    models_with_network_asset.append(each_shape)
 
         if image_urls:
             image_paths = await download_files(image_urls, self._temp_dir)
@@ -112,13 +111,44 @@ class PptxPresentationCreator:
 
     async def create_ppt(self):
         await self.fetch_network_assets()
+        self.add_slides()
+
+    async def create_and_save(self, path: str):
+        """
+        Downloads the network assets here and builds and saves the presentation
+        in the export executor, off the event loop. Slides unchanged since a
+        previous export are restored from the slide cache.
+        """
+        slide_keys = [
+            PPTX_SLIDE_CACHE.get_key(slide_model, self._ppt_model.shapes)
+            for slide_model in self._slide_models
+        ]
+        await self.fetch_network_assets()
+        await EXPORT_EXECUTOR.run(
+            build_pptx_file, self._ppt_model, self._temp_dir, path, slide_keys
+        )
 
-        for slide_model in self._slide_models:
+    def add_slides(self, slide_keys: Optional[List[Optional[str]]] = None):
+        slide_keys = slide_keys or [None] * len(self._slide_models)
+        for slide_model, slide_key in zip(self._slide_models, slide_keys):
             # Adding global shapes to slide
             if self._ppt_model.shapes:
                 slide_model.shapes.append(self._ppt_model.shapes)
 
-            self.add_and_populate_slide(slide_model)
+            if slide_key:
+                self.add_cached_slide(slide_model, slide_key)
+            else:
+                self.add_and_populate_slide(slide_model)
+
+    def add_cached_slide(self, slide_model: PptxSlideModel, slide_key: str):
+        slide = self._ppt.slides.add_slide(self._ppt.slide_layouts[BLANK_SLIDE_LAYOUT])
+        if PPTX_SLIDE_CACHE.restore(slide_key, slide):
+            if slide_model.note:
+                slide.notes_slide.notes_text_frame.text = slide_model.note
+            return
+
+        self.populate_slide(slide, slide_model)
+        PPTX_SLIDE_CACHE.store(slide_key, slide)
 
     def set_presentation_theme(self):
         slide_master = self._ppt.slide_master
@@ -142,7 +172,9 @@ class PptxPresentationCreator:
 
     def add_and_populate_slide(self, slide_model: PptxSlideModel):
         slide = self._ppt.slides.add_slide(self._ppt.slide_layouts[BLANK_SLIDE_LAYOUT])
+        self.populate_slide(slide, slide_model)
 
+    def populate_slide(self, slide: Slide, slide_model: PptxSlideModel):
         if slide_model.background:
             self.apply_fill_to_shape(slide.background, slide_model.background)
 
@@ -185,45 +217,75 @@ class PptxPresentationCreator:
             or picture_model.shape
         ):
             try:
-                image = Image.open(image_path)
-            except Exception:
-                print(f"Could not open image: {image_path}")
+                image_path = self.get_transformed_image(picture_model)
+            except Exception as e:
+                print(f"Could not process image {image_path}: {e}")
                 return
 
-            image = image.convert("RGBA")
-            # ? Applying border radius twice to support both clip and object fit
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.object_fit:
-                image = fit_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                    picture_model.object_fit,
-                )
-            elif picture_model.clip:
-                image = clip_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                )
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
-                image = create_circle_image(image)
-            if picture_model.invert:
-                image = invert_image(image)
-            if picture_model.opacity:
-                image = set_image_opacity(image, picture_model.opacity)
-            image_path = os.path.join(self._temp_dir, f"{uuid.uuid4()}.png")
-            image.save(image_path)
-
         margined_position = self.get_margined_position(
             picture_model.position, picture_model.margin
         )
 
         slide.shapes.add_picture(image_path, *margined_position.to_pt_list())
 
+    def get_transformed_image(self, picture_model: PptxPictureBoxModel) -> str:
+        """
+        Applies the picture transforms to its image. Results are cached by
+        source image and parameters, so the same picture on several slides or
+        in several exports is processed once. Identical files are also stored
+        once in the PPTX, as python-pptx dedupes image parts by content.
+        """
+        image_path = picture_model.picture.path
+        key = IMAGE_TRANSFORM_CACHE.get_key(
+            image_path,
+            picture_model.model_dump(
+                mode="json", include=TRANSFORM_PARAMETERS, exclude_none=True
+            ),
+        )
+        transformed_path = IMAGE_TRANSFORM_CACHE.get(key)
+        if transformed_path:
+            return transformed_path
+
+        image = Image.open(image_path)
+        original_width = image.width
+        if picture_model.object_fit or picture_model.clip:
+            # Only the part covering the box ends up in the slide. JPEGs are
+            # decoded at a reduced size directly, other images are downscaled
+            box_size = (picture_model.position.width, picture_model.position.height)
+            image.draft(image.mode, box_size)
+            image = downscale_to_cover(image.convert("RGBA"), *box_size)
+        else:
+            image = image.convert("RGBA")
+        # Border radii are given for the original size
+        scale = image.width / original_width
+        # ? Applying border radius twice to support both clip and object fit
+        if picture_model.border_radius:
+            image = round_image_corners(
+                image, [round(radius * scale) for radius in picture_model.border_radius]
+            )
+        if picture_model.object_fit:
+            image = fit_image(
+                image,
+                picture_model.position.width,
+                picture_model.position.height,
+                picture_model.object_fit,
+            )
+        elif picture_model.clip:
+            image = clip_image(
+                image,
+                picture_model.position.width,
+                picture_model.position.height,
+            )
+        if picture_model.border_radius:
+            image = round_image_corners(image, picture_model.border_radius)
+        if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
+            image = create_circle_image(image)
+        if picture_model.invert:
+            image = invert_image(image)
+        if picture_model.opacity:
+            image = set_image_opacity(image, picture_model.opacity)
+        return IMAGE_TRANSFORM_CACHE.put(key, image)
+
     def add_autoshape(self, slide: Slide, autoshape_box_model: PptxAutoShapeBoxModel):
         position = autoshape_box_model.position
         if autoshape_box_model.margin:
@@ -484,3 +546,15 @@ class PptxPresentationCreator:
 
     def save(self, path: str):
         self._ppt.save(path)
+
+
+def build_pptx_file(
+    ppt_model: PptxPresentationModel,
+    temp_dir: str,
+    path: str,
+    slide_keys: Optional[List[Optional[str]]] = None,
+):
+    # Runs in the export executor, network assets are already downloaded
+    pptx_creator = PptxPresentationCreator(ppt_model, temp_dir)
+    pptx_creator.add_slides(slide_keys)
+    pptx_creator.save(path)
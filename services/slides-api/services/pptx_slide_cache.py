@@ -0,0 +1,169 @@
+import hashlib
+from io import BytesIO
+import os
+import threading
+from typing import List, Optional
+import zipfile
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.slide import Slide
+
+from models.pptx_models import PptxPictureBoxModel, PptxShapeModel, PptxSlideModel
+from utils.asset_directory_utils import get_cache_directory
+from utils.download_helpers import get_local_image_path
+from utils.file_utils import get_directory_size, prune_directory_lru
+from utils.get_env import get_pptx_slide_cache_size_mb_env
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_PPTX_SLIDE_CACHE_SIZE_MB = 256
+# Changes of the slide rendering must bump this to invalidate the cache
+PPTX_SLIDE_CACHE_VERSION = "2"
+SLIDE_XML_ENTRY = "slide.xml"
+IMAGES_DIRECTORY = "images/"
+
+RELATIONSHIP_ATTRIBUTES = [
+    f"{{http://schemas.openxmlformats.org/officeDocument/2006/relationships}}{name}"
+    for name in ("embed", "link", "id")
+]
+
+
+class PptxSlideCache:
+    """
+    Disk cache of the slides rendered by PptxPresentationCreator, keyed by a
+    hash of everything rendered on the slide, so re-exporting a deck after an
+    edit only renders the edited slides.
+
+    A cached slide is a zip of the XML of its shape tree and background and
+    of the images it references. Restoring it copies the XML into a new blank
+    slide and relates the images again. Unreadable entries are dropped and
+    the slide is rendered again. Least recently used slides are evicted past
+    PPTX_SLIDE_CACHE_SIZE_MB.
+    """
+
+    def __init__(self):
+        size_mb = parse_int_or_none(get_pptx_slide_cache_size_mb_env())
+        self.max_size = (
+            size_mb if size_mb is not None else DEFAULT_PPTX_SLIDE_CACHE_SIZE_MB
+        ) * 1024 * 1024
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        directory = os.path.join(get_cache_directory(), "pptx_slides")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def get_key(
+        self,
+        slide_model: PptxSlideModel,
+        global_shapes: Optional[List[PptxShapeModel]] = None,
+    ) -> Optional[str]:
+        """
+        Hashes the slide model, the shapes added to every slide and the
+        files of the local images. Must be computed before the network
+        images of the slide are downloaded, as their local paths change on
+        every export.
+        """
+        if self.max_size <= 0:
+            return None
+        digest = hashlib.sha256(PPTX_SLIDE_CACHE_VERSION.encode("utf-8"))
+        shapes = list(slide_model.shapes) + list(global_shapes or [])
+        digest.update(slide_model.model_dump_json().encode("utf-8"))
+        for shape in global_shapes or []:
+            digest.update(shape.model_dump_json().encode("utf-8"))
+        for shape in shapes:
+            if isinstance(shape, PptxPictureBoxModel):
+                local_path = get_local_image_path(shape.picture.path)
+                if local_path:
+                    stat = os.stat(local_path)
+                    digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.zip")
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def restore(self, key: str, slide: Slide) -> bool:
+        """Fills a new blank slide with the cached slide, if any"""
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return False
+        try:
+            with zipfile.ZipFile(path) as archive:
+                c_sld = parse_xml(archive.read(SLIDE_XML_ENTRY))
+                images = {
+                    name[len(IMAGES_DIRECTORY) :]: archive.read(name)
+                    for name in archive.namelist()
+                    if name.startswith(IMAGES_DIRECTORY)
+                }
+            os.utime(path)
+        except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+            print(f"Dropping unreadable cached slide {key}: {e}")
+            self._remove(path)
+            return False
+
+        # Relationship ids of the cached slide to the ones of the new slide
+        relationship_ids = {}
+        try:
+            for old_rId, blob in images.items():
+                _, relationship_ids[old_rId] = slide.part.get_or_add_image_part(
+                    BytesIO(blob)
+                )
+        except Exception as e:
+            print(f"Dropping cached slide {key} with an invalid image: {e}")
+            for rId in relationship_ids.values():
+                slide.part.drop_rel(rId)
+            self._remove(path)
+            return False
+
+        for element in c_sld.iter():
+            for attribute in RELATIONSHIP_ATTRIBUTES:
+                rId = element.get(attribute)
+                if rId in relationship_ids:
+                    element.set(attribute, relationship_ids[rId])
+
+        # The shape tree of the new slide is kept, slide.shapes is bound to it
+        sp_tree = slide._element.cSld.spTree
+        for child in list(sp_tree):
+            sp_tree.remove(child)
+        sp_tree.extend(list(c_sld.spTree))
+        c_sld.replace(c_sld.spTree, sp_tree)
+        slide._element.replace(slide._element.cSld, c_sld)
+        return True
+
+    def store(self, key: str, slide: Slide):
+        buffer = BytesIO()
+        # Images are compressed already
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr(SLIDE_XML_ENTRY, etree.tostring(slide._element.cSld))
+            for rId, relationship in slide.part.rels.items():
+                if relationship.reltype == RT.IMAGE:
+                    archive.writestr(
+                        f"{IMAGES_DIRECTORY}{rId}", relationship.target_part.blob
+                    )
+        data = buffer.getvalue()
+
+        path = self._get_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = get_directory_size(self.directory)
+            else:
+                self._size += len(data)
+            self._size = prune_directory_lru(self.directory, self.max_size, self._size)
+
+
+PPTX_SLIDE_CACHE = PptxSlideCache()
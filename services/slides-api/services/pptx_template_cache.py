@@ -0,0 +1,96 @@
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import hashlib
+from io import BytesIO
+import os
+import threading
+
+from pptx import Presentation
+
+from utils.get_env import get_pptx_template_cache_size_mb_env
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_PPTX_TEMPLATE_CACHE_SIZE_MB = 256
+
+
+@dataclass
+class CachedPptxTemplate:
+    mtime_ns: int
+    size: int
+    sha256: str
+    presentation: Presentation
+
+
+class PptxTemplateCache:
+    """
+    Keeps a pristine parsed copy of the PPTX templates used by exports.
+
+    Every export gets a deep copy of the parsed template, which is several
+    times cheaper than unzipping and parsing the file again. An entry is
+    reloaded when the mtime or size of its file changes and its content hash
+    differs. Least recently used templates are evicted once the size of the
+    cached files exceeds PPTX_TEMPLATE_CACHE_SIZE_MB.
+    """
+
+    def __init__(self):
+        size_mb = parse_int_or_none(get_pptx_template_cache_size_mb_env())
+        self.max_size = (
+            size_mb if size_mb is not None else DEFAULT_PPTX_TEMPLATE_CACHE_SIZE_MB
+        ) * 1024 * 1024
+        self._entries: OrderedDict[str, CachedPptxTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, template_path: str) -> CachedPptxTemplate:
+        stat = os.stat(template_path)
+        with self._lock:
+            entry = self._entries.get(template_path)
+            if (
+                entry
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self._entries.move_to_end(template_path)
+                return entry
+
+        with open(template_path, "rb") as f:
+            data = f.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        if entry and entry.sha256 == sha256:
+            # Touched but unchanged
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+        else:
+            entry = CachedPptxTemplate(
+                mtime_ns=stat.st_mtime_ns,
+                size=len(data),
+                sha256=sha256,
+                presentation=Presentation(BytesIO(data)),
+            )
+
+        with self._lock:
+            self._entries[template_path] = entry
+            self._entries.move_to_end(template_path)
+            self._evict()
+        return entry
+
+    def _evict(self):
+        total_size = sum(entry.size for entry in self._entries.values())
+        while len(self._entries) > 1 and total_size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            total_size -= evicted.size
+
+    def open(self, template_path: str) -> Presentation:
+        """Returns a copy of the template which can be modified freely."""
+        if self.max_size <= 0:
+            return Presentation(template_path)
+        return copy.deepcopy(self._load(template_path).presentation)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+PPTX_TEMPLATE_CACHE = PptxTemplateCache()
@@ -26,9 +26,11 @@ from pptx.shapes.base import BaseShape
 from pptx.shapes.picture import Picture
 from pptx.shapes.placeholder import PlaceholderPicture
 from PIL import Image
-import aiohttp
 import asyncio
 
+from services.export_executor import EXPORT_EXECUTOR
+from services.pptx_template_cache import PPTX_TEMPLATE_CACHE
+from utils.download_helpers import download_images
 from utils.get_env import get_app_data_directory_env as get_app_data_directory
 
 
@@ -301,7 +303,8 @@ class PptxTemplateService:
         template_path: str,
         slides_content: List[Dict[str, Any]],
         output_filename: str,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        output_path: Optional[str] = None,
     ) -> str:
         """
         Generate a new PPTX from a template by replacing content.
@@ -318,14 +321,47 @@ class PptxTemplateService:
             slides_content: List of content for each slide
             output_filename: Name for the output file
             options: Additional options (fonts, colors override, etc.)
+            output_path: Path to write to instead of the exports directory
 
         Returns:
             Path to the generated PPTX file
         """
         options = options or {}
 
-        # Load the template
-        prs = Presentation(template_path)
+        # Images are downloaded here, the CPU bound build runs in the executor
+        images = await download_images(
+            [
+                self._get_image_url(content["image"])
+                for content in slides_content
+                if isinstance(content.get("image"), dict)
+            ]
+        )
+
+        output_path = output_path or os.path.join(
+            self.exports_dir, f"{output_filename}.pptx"
+        )
+        await EXPORT_EXECUTOR.run(
+            build_from_template,
+            template_path,
+            slides_content,
+            output_path,
+            options,
+            images,
+        )
+
+        return output_path
+
+    def _build_from_template(
+        self,
+        template_path: str,
+        slides_content: List[Dict[str, Any]],
+        output_path: str,
+        options: Dict[str, Any],
+        images: Dict[str, bytes],
+    ):
+        """Build and save the PPTX, images are given as downloaded bytes by URL."""
+        # Load a copy of the parsed template
+        prs = PPTX_TEMPLATE_CACHE.open(template_path)
         template_slide_count = len(prs.slides)
 
         # Determine how to map content to slides
@@ -334,7 +370,7 @@ class PptxTemplateService:
         if content_count <= template_slide_count:
             # We have enough slides, just fill them
             for i, content in enumerate(slides_content):
-                await self._fill_slide(prs.slides[i], content, options)
+                self._fill_slide(prs.slides[i], content, options, images)
 
             # Remove unused slides (from end)
             for _ in range(template_slide_count - content_count):
@@ -344,25 +380,23 @@ class PptxTemplateService:
             # First, fill all existing slides
             for i in range(template_slide_count):
                 if i < content_count:
-                    await self._fill_slide(prs.slides[i], slides_content[i], options)
+                    self._fill_slide(prs.slides[i], slides_content[i], options, images)
 
             # Then duplicate appropriate slides for remaining content
             content_slide_idx = 1 if template_slide_count > 1 else 0  # Use second slide as template
             for i in range(template_slide_count, content_count):
                 new_slide = self._duplicate_slide(prs, content_slide_idx)
-                await self._fill_slide(new_slide, slides_content[i], options)
+                self._fill_slide(new_slide, slides_content[i], options, images)
 
         # Save the output
-        output_path = os.path.join(self.exports_dir, f"{output_filename}.pptx")
         prs.save(output_path)
 
-        return output_path
-
-    async def _fill_slide(
+    def _fill_slide(
         self,
         slide,
         content: Dict[str, Any],
-        options: Dict[str, Any]
+        options: Dict[str, Any],
+        images: Dict[str, bytes]
     ):
         """
         Fill a slide with content while preserving original formatting.
@@ -422,7 +456,7 @@ class PptxTemplateService:
 
         # Replace/add images
         if "image" in content:
-            await self._replace_image(slide, content["image"], options)
+            self._replace_image(slide, content["image"], options, images)
 
         # Add speaker notes
         if "speaker_notes" in content and content["speaker_notes"]:
@@ -575,14 +609,22 @@ class PptxTemplateService:
                                 para.runs[0].text = str(bullet_text)
                     return
 
-    async def _replace_image(self, slide, image_data: Dict[str, Any], options: Dict[str, Any]):
+    def _get_image_url(self, image_data: Dict[str, Any]) -> Optional[str]:
+        return image_data.get("url") or image_data.get("__image_url__")
+
+    def _replace_image(
+        self,
+        slide,
+        image_data: Dict[str, Any],
+        options: Dict[str, Any],
+        images: Dict[str, bytes]
+    ):
         """Replace or add an image to the slide."""
-        image_url = image_data.get("url") or image_data.get("__image_url__")
+        image_url = self._get_image_url(image_data)
         if not image_url:
             return
 
-        # Download the image
-        image_bytes = await self._download_image(image_url)
+        image_bytes = images.get(image_url)
         if not image_bytes:
             return
 
@@ -632,17 +674,6 @@ class PptxTemplateService:
             finally:
                 os.unlink(tmp_path)
 
-    async def _download_image(self, url: str) -> Optional[bytes]:
-        """Download an image from URL."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.read()
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-        return None
-
     def _duplicate_slide(self, prs: Presentation, slide_index: int):
         """Duplicate a slide in the presentation."""
         template_slide = prs.slides[slide_index]
@@ -672,3 +703,8 @@ class PptxTemplateService:
 
 # Singleton instance
 PPTX_TEMPLATE_SERVICE = PptxTemplateService()
+
+
+def build_from_template(*args):
+    # Module level entry point of the export executor workers
+    PPTX_TEMPLATE_SERVICE._build_from_template(*args)
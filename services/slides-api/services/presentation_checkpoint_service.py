@@ -0,0 +1,86 @@
+from typing import Dict, Optional
+import uuid
+
+from sqlalchemy import delete
+from sqlmodel import select
+
+from models.sql.presentation_generation_checkpoint import (
+    PresentationGenerationCheckpointModel,
+)
+from services.database import async_session_maker
+
+
+OUTLINES_STAGE = "outlines"
+STRUCTURE_STAGE = "structure"
+SAVED_STAGE = "saved"
+EXPORT_STAGE = "export"
+
+
+def get_slide_content_stage(index: int) -> str:
+    return f"slide_content:{index}"
+
+
+def get_slide_assets_stage(index: int) -> str:
+    return f"slide_assets:{index}"
+
+
+class PresentationCheckpointService:
+    """
+    Persists the completed stages of a presentation generation.
+
+    Each stage is committed in its own session as soon as it completes, so a
+    retried generation of the same presentation resumes from the stages that
+    already succeeded instead of paying for every LLM call again.
+    """
+
+    def __init__(self, presentation_id: uuid.UUID, enabled: bool = True):
+        self.presentation_id = presentation_id
+        self.enabled = enabled
+        self._checkpoints: Dict[str, dict] = {}
+
+    async def load(self):
+        if not self.enabled:
+            return
+        async with async_session_maker() as session:
+            checkpoints = await session.scalars(
+                select(PresentationGenerationCheckpointModel).where(
+                    PresentationGenerationCheckpointModel.presentation_id
+                    == self.presentation_id
+                )
+            )
+            self._checkpoints = {
+                checkpoint.stage: checkpoint.data for checkpoint in checkpoints
+            }
+        if self._checkpoints:
+            print(
+                f"Resuming presentation {self.presentation_id} from "
+                f"{len(self._checkpoints)} checkpoints"
+            )
+
+    def get(self, stage: str) -> Optional[dict]:
+        return self._checkpoints.get(stage)
+
+    async def save(self, stage: str, data: dict):
+        if not self.enabled:
+            return
+        self._checkpoints[stage] = data
+        async with async_session_maker() as session:
+            await session.merge(
+                PresentationGenerationCheckpointModel(
+                    presentation_id=self.presentation_id, stage=stage, data=data
+                )
+            )
+            await session.commit()
+
+    async def clear(self):
+        self._checkpoints = {}
+        if not self.enabled:
+            return
+        async with async_session_maker() as session:
+            await session.execute(
+                delete(PresentationGenerationCheckpointModel).where(
+                    PresentationGenerationCheckpointModel.presentation_id
+                    == self.presentation_id
+                )
+            )
+            await session.commit()
@@ -0,0 +1,238 @@
+from datetime import datetime, timedelta, timezone
+import json
+import time
+from typing import Optional
+
+from sqlalchemy import and_, or_, update
+from sqlmodel import select
+
+from models.sql.presentation_generation_job import PresentationGenerationJobModel
+from services.database import async_session_maker
+from utils.datetime_utils import get_current_utc_datetime
+from utils.get_env import get_presentation_job_queue_env, get_redis_url_env
+
+
+class SqlPresentationJobQueue:
+    """
+    Presentation generation job queue stored in the application database.
+
+    Jobs are leased with a conditional update, so several worker processes
+    sharing the same database never pick up the same job. A job whose lease
+    expires without heartbeat (crashed worker) becomes available again.
+    """
+
+    def _is_available(self, now: datetime):
+        return or_(
+            and_(
+                PresentationGenerationJobModel.status == "queued",
+                PresentationGenerationJobModel.available_at <= now,
+            ),
+            and_(
+                PresentationGenerationJobModel.status == "leased",
+                PresentationGenerationJobModel.lease_expires_at < now,
+            ),
+        )
+
+    async def enqueue(self, job: PresentationGenerationJobModel):
+        async with async_session_maker() as session:
+            session.add(job)
+            await session.commit()
+
+    async def lease(
+        self, worker_id: str, lease_seconds: int
+    ) -> Optional[PresentationGenerationJobModel]:
+        async with async_session_maker() as session:
+            now = get_current_utc_datetime()
+            candidate_ids = await session.scalars(
+                select(PresentationGenerationJobModel.id)
+                .where(self._is_available(now))
+                .order_by(PresentationGenerationJobModel.created_at)
+                .limit(5)
+            )
+            for job_id in list(candidate_ids):
+                result = await session.execute(
+                    update(PresentationGenerationJobModel)
+                    .where(
+                        PresentationGenerationJobModel.id == job_id,
+                        self._is_available(now),
+                    )
+                    .values(
+                        status="leased",
+                        lease_owner=worker_id,
+                        lease_expires_at=now + timedelta(seconds=lease_seconds),
+                        attempts=PresentationGenerationJobModel.attempts + 1,
+                        updated_at=now,
+                    )
+                )
+                await session.commit()
+                if result.rowcount == 1:
+                    return await session.get(PresentationGenerationJobModel, job_id)
+        return None
+
+    async def heartbeat(
+        self, job: PresentationGenerationJobModel, worker_id: str, lease_seconds: int
+    ) -> bool:
+        async with async_session_maker() as session:
+            now = get_current_utc_datetime()
+            result = await session.execute(
+                update(PresentationGenerationJobModel)
+                .where(
+                    PresentationGenerationJobModel.id == job.id,
+                    PresentationGenerationJobModel.lease_owner == worker_id,
+                    PresentationGenerationJobModel.status == "leased",
+                )
+                .values(
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    updated_at=now,
+                )
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def _finish(self, job: PresentationGenerationJobModel, **values):
+        async with async_session_maker() as session:
+            await session.execute(
+                update(PresentationGenerationJobModel)
+                .where(PresentationGenerationJobModel.id == job.id)
+                .values(
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=get_current_utc_datetime(),
+                    **values,
+                )
+            )
+            await session.commit()
+
+    async def complete(self, job: PresentationGenerationJobModel):
+        await self._finish(job, status="completed")
+
+    async def fail(self, job: PresentationGenerationJobModel):
+        await self._finish(job, status="failed")
+
+    async def retry(self, job: PresentationGenerationJobModel, delay: float):
+        await self._finish(
+            job,
+            status="queued",
+            available_at=get_current_utc_datetime() + timedelta(seconds=delay),
+        )
+
+
+class RedisPresentationJobQueue:
+    """
+    Presentation generation job queue stored in Redis.
+
+    Queued jobs live in a sorted set scored by the time they become available
+    and leased jobs in a sorted set scored by their lease expiry. Leasing is a
+    single Lua script which also moves expired leases back to the queue.
+    """
+
+    LEASE_SCRIPT = """
+        local now = tonumber(ARGV[1])
+        local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)
+        for _, id in ipairs(expired) do
+            redis.call('ZREM', KEYS[2], id)
+            redis.call('ZADD', KEYS[1], now, id)
+        end
+        local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, 1)
+        if #ids == 0 then
+            return nil
+        end
+        local id = ids[1]
+        redis.call('ZREM', KEYS[1], id)
+        redis.call('ZADD', KEYS[2], tonumber(ARGV[2]), id)
+        redis.call('HSET', KEYS[3], id, ARGV[3])
+        return id
+    """
+
+    def __init__(self, redis_url: str, prefix: str = "presentation_jobs"):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(redis_url, decode_responses=True)
+        self.queue_key = f"{prefix}:queue"
+        self.leases_key = f"{prefix}:leases"
+        self.owners_key = f"{prefix}:owners"
+        self.jobs_key = f"{prefix}:jobs"
+        self._lease_script = self.redis.register_script(self.LEASE_SCRIPT)
+
+    async def enqueue(self, job: PresentationGenerationJobModel):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self.jobs_key, job.id, job.model_dump_json())
+            pipe.zadd(self.queue_key, {job.id: job.available_at.timestamp()})
+            await pipe.execute()
+
+    async def lease(
+        self, worker_id: str, lease_seconds: int
+    ) -> Optional[PresentationGenerationJobModel]:
+        now = time.time()
+        job_id = await self._lease_script(
+            keys=[self.queue_key, self.leases_key, self.owners_key],
+            args=[now, now + lease_seconds, worker_id],
+        )
+        if not job_id:
+            return None
+
+        job_json = await self.redis.hget(self.jobs_key, job_id)
+        if not job_json:
+            await self.redis.zrem(self.leases_key, job_id)
+            return None
+
+        job = PresentationGenerationJobModel.model_validate(json.loads(job_json))
+        job.status = "leased"
+        job.attempts += 1
+        job.lease_owner = worker_id
+        job.lease_expires_at = datetime.fromtimestamp(
+            now + lease_seconds, timezone.utc
+        )
+        job.updated_at = get_current_utc_datetime()
+        await self.redis.hset(self.jobs_key, job.id, job.model_dump_json())
+        return job
+
+    async def heartbeat(
+        self, job: PresentationGenerationJobModel, worker_id: str, lease_seconds: int
+    ) -> bool:
+        if await self.redis.hget(self.owners_key, job.id) != worker_id:
+            return False
+        return bool(
+            await self.redis.zadd(
+                self.leases_key,
+                {job.id: time.time() + lease_seconds},
+                xx=True,
+                ch=True,
+            )
+        )
+
+    def _release(self, pipe, job: PresentationGenerationJobModel):
+        pipe.zrem(self.leases_key, job.id)
+        pipe.hdel(self.owners_key, job.id)
+
+    async def complete(self, job: PresentationGenerationJobModel):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._release(pipe, job)
+            pipe.hdel(self.jobs_key, job.id)
+            await pipe.execute()
+
+    async def fail(self, job: PresentationGenerationJobModel):
+        await self.complete(job)
+
+    async def retry(self, job: PresentationGenerationJobModel, delay: float):
+        job.status = "queued"
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.available_at = get_current_utc_datetime() + timedelta(seconds=delay)
+        job.updated_at = get_current_utc_datetime()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._release(pipe, job)
+            pipe.hset(self.jobs_key, job.id, job.model_dump_json())
+            pipe.zadd(self.queue_key, {job.id: job.available_at.timestamp()})
+            await pipe.execute()
+
+
+def get_presentation_job_queue():
+    if get_presentation_job_queue_env() == "redis":
+        return RedisPresentationJobQueue(
+            get_redis_url_env() or "redis://localhost:6379/0"
+        )
+    return SqlPresentationJobQueue()
+
+
+PRESENTATION_JOB_QUEUE = get_presentation_job_queue()
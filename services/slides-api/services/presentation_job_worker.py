@@ -0,0 +1,222 @@
+import asyncio
+import os
+import secrets
+import traceback
+from datetime import datetime
+from typing import List, Optional
+
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.sql.async_presentation_generation_status import (
+    AsyncPresentationGenerationTaskModel,
+)
+from models.sql.presentation_generation_job import PresentationGenerationJobModel
+from services.database import async_session_maker
+from services.presentation_checkpoint_service import PresentationCheckpointService
+from services.presentation_job_queue import PRESENTATION_JOB_QUEUE
+from utils.get_env import (
+    get_can_change_keys_env,
+    get_presentation_job_lease_seconds_env,
+    get_presentation_job_max_attempts_env,
+    get_presentation_job_workers_env,
+)
+from utils.parsers import parse_int_or_none
+from utils.user_config import update_env_with_user_config
+
+
+DEFAULT_PRESENTATION_JOB_WORKERS = 2
+DEFAULT_PRESENTATION_JOB_LEASE_SECONDS = 120
+DEFAULT_PRESENTATION_JOB_MAX_ATTEMPTS = 3
+IDLE_POLL_INTERVAL = 2
+
+
+def get_presentation_job_max_attempts() -> int:
+    return (
+        parse_int_or_none(get_presentation_job_max_attempts_env())
+        or DEFAULT_PRESENTATION_JOB_MAX_ATTEMPTS
+    )
+
+
+class PresentationJobWorkerPool:
+    """
+    Pool of workers processing queued presentation generation jobs.
+
+    Every worker leases one job at a time and keeps its lease alive with
+    heartbeats while the presentation is generated. Failed jobs are retried
+    with a backoff until they run out of attempts. Several processes can run
+    a pool against the same queue to scale throughput.
+    """
+
+    def __init__(self, n_workers: Optional[int] = None):
+        workers_env = parse_int_or_none(get_presentation_job_workers_env())
+        self.n_workers = (
+            n_workers
+            if n_workers is not None
+            else (
+                workers_env
+                if workers_env is not None
+                else DEFAULT_PRESENTATION_JOB_WORKERS
+            )
+        )
+        self.lease_seconds = (
+            parse_int_or_none(get_presentation_job_lease_seconds_env())
+            or DEFAULT_PRESENTATION_JOB_LEASE_SECONDS
+        )
+        self.worker_prefix = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    def start(self):
+        if self._workers:
+            return
+        for index in range(self.n_workers):
+            worker_id = f"{self.worker_prefix}-{index}"
+            self._workers.append(asyncio.create_task(self._run_worker(worker_id)))
+        print(f"Started {self.n_workers} presentation generation workers")
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        # Leases of interrupted jobs expire and the jobs are picked up again
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def notify(self):
+        self._wakeup.set()
+
+    async def _wait_for_jobs(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), IDLE_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run_worker(self, worker_id: str):
+        while True:
+            try:
+                job = await PRESENTATION_JOB_QUEUE.lease(worker_id, self.lease_seconds)
+            except Exception:
+                traceback.print_exc()
+                job = None
+
+            if job is None:
+                await self._wait_for_jobs()
+                continue
+
+            try:
+                await self._process_job(job, worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                traceback.print_exc()
+
+    async def _heartbeat(
+        self,
+        job: PresentationGenerationJobModel,
+        worker_id: str,
+        generation_task: asyncio.Task,
+    ):
+        """
+        Renews the lease of the job. Once the lease is lost the job may run
+        on another worker, so the generation is stopped here.
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await PRESENTATION_JOB_QUEUE.heartbeat(
+                    job, worker_id, self.lease_seconds
+                ):
+                    print(f"Lost lease on presentation generation job {job.id}")
+                    generation_task.cancel()
+                    return
+            except Exception:
+                traceback.print_exc()
+
+    async def _fail_job(self, job: PresentationGenerationJobModel):
+        await PRESENTATION_JOB_QUEUE.fail(job)
+        # Nothing will resume from the checkpoints anymore
+        await PresentationCheckpointService(job.presentation_id).clear()
+
+    async def _generate(
+        self,
+        job: PresentationGenerationJobModel,
+        async_status: AsyncPresentationGenerationTaskModel,
+        sql_session,
+        is_last_attempt: bool,
+    ):
+        from api.v1.ppt.endpoints.presentation import generate_presentation_handler
+
+        await generate_presentation_handler(
+            GeneratePresentationRequest(**job.request),
+            job.presentation_id,
+            async_status,
+            sql_session,
+            trigger_failure_webhook=is_last_attempt,
+        )
+
+    async def _process_job(self, job: PresentationGenerationJobModel, worker_id: str):
+        # Workers may run outside the API process, so user config is applied here
+        if get_can_change_keys_env() != "false":
+            update_env_with_user_config()
+
+        async with async_session_maker() as sql_session:
+            async_status = await sql_session.get(
+                AsyncPresentationGenerationTaskModel, job.id
+            )
+            if not async_status:
+                await PRESENTATION_JOB_QUEUE.fail(job)
+                return
+
+            is_last_attempt = job.attempts >= job.max_attempts
+            if job.attempts > job.max_attempts:
+                # Lease expired after the last attempt, the worker crashed
+                async_status.status = "error"
+                async_status.message = "Presentation generation failed"
+                async_status.updated_at = datetime.now()
+                sql_session.add(async_status)
+                await sql_session.commit()
+                await self._fail_job(job)
+                return
+
+            generation_task = asyncio.create_task(
+                self._generate(job, async_status, sql_session, is_last_attempt)
+            )
+            heartbeat_task = asyncio.create_task(
+                self._heartbeat(job, worker_id, generation_task)
+            )
+            try:
+                await generation_task
+            except asyncio.CancelledError:
+                # Stopped by the heartbeat, the job now belongs to another worker
+                if heartbeat_task.done() and not asyncio.current_task().cancelling():
+                    return
+                raise
+            finally:
+                heartbeat_task.cancel()
+
+            if async_status.status == "completed":
+                await PRESENTATION_JOB_QUEUE.complete(job)
+                return
+
+            if is_last_attempt:
+                await self._fail_job(job)
+                return
+
+            async_status.status = "pending"
+            async_status.message = (
+                f"Retrying presentation generation "
+                f"(attempt {job.attempts + 1} of {job.max_attempts})"
+            )
+            async_status.updated_at = datetime.now()
+            sql_session.add(async_status)
+            await sql_session.commit()
+            await PRESENTATION_JOB_QUEUE.retry(job, delay=10 * job.attempts)
+
+
+PRESENTATION_JOB_WORKER_POOL: Optional[PresentationJobWorkerPool] = None
+
+
+def get_presentation_job_worker_pool() -> PresentationJobWorkerPool:
+    global PRESENTATION_JOB_WORKER_POOL
+    if PRESENTATION_JOB_WORKER_POOL is None:
+        PRESENTATION_JOB_WORKER_POOL = PresentationJobWorkerPool()
+    return PRESENTATION_JOB_WORKER_POOL
@@ -0,0 +1,214 @@
+import asyncio
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from utils.get_env import get_process_concurrency_env
+from utils.parsers import parse_int_or_none
+
+
+DEFAULT_PROCESS_CONCURRENCY = 4
+MAX_STDERR_SIZE = 64 * 1024
+CANCELLATION_POLL_INTERVAL = 1
+
+
+@dataclass
+class ProcessResult:
+    returncode: int
+    stdout: bytes
+    stderr: str
+    duration: float
+
+
+@dataclass
+class ToolStats:
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    cancellations: int = 0
+    running: int = 0
+    waiting: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+
+class ProcessError(Exception):
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(f"{message}: {stderr}" if stderr else message)
+        self.stderr = stderr
+
+
+class ProcessTimeoutError(ProcessError):
+    pass
+
+
+class ProcessCancelledError(ProcessError):
+    pass
+
+
+class ProcessRunner:
+    """
+    Runs the external tools (LibreOffice, fontconfig...) as asyncio
+    subprocesses, so they never block the event loop.
+
+    Every tool has its own concurrency limit of PROCESS_CONCURRENCY runs.
+    A run is killed on timeout, when its task is cancelled or when
+    is_cancelled reports it is not needed anymore (client disconnected).
+    The stderr of a run is read as it is written, keeping its end only.
+    PDF pages are not rendered by an external tool but in process by PDFium,
+    see pdf_rasterizer.
+    """
+
+    def __init__(self):
+        concurrency = parse_int_or_none(get_process_concurrency_env())
+        self.concurrency = max(1, concurrency or DEFAULT_PROCESS_CONCURRENCY)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, ToolStats] = {}
+
+    def _get_tool(self, args: List[str]) -> str:
+        return Path(args[0]).stem
+
+    def _get_semaphore(self, tool: str) -> asyncio.Semaphore:
+        if tool not in self._semaphores:
+            self._semaphores[tool] = asyncio.Semaphore(self.concurrency)
+        return self._semaphores[tool]
+
+    def _get_stats(self, tool: str) -> ToolStats:
+        if tool not in self._stats:
+            self._stats[tool] = ToolStats()
+        return self._stats[tool]
+
+    def stats(self) -> Dict[str, dict]:
+        return {tool: asdict(stats) for tool, stats in self._stats.items()}
+
+    async def spawn(
+        self, args: List[str], env: Optional[Dict[str, str]] = None
+    ) -> asyncio.subprocess.Process:
+        """Starts a long-lived process, outside of the concurrency limits"""
+        return await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+        )
+
+    async def run(
+        self,
+        args: List[str],
+        timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None,
+        check: bool = True,
+        capture_stdout: bool = False,
+        is_cancelled: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> ProcessResult:
+        tool = self._get_tool(args)
+        stats = self._get_stats(tool)
+
+        stats.waiting += 1
+        try:
+            await self._get_semaphore(tool).acquire()
+        finally:
+            stats.waiting -= 1
+
+        stats.running += 1
+        started_at = time.monotonic()
+        try:
+            result = await self._run(args, timeout, env, capture_stdout, is_cancelled)
+        except ProcessTimeoutError:
+            stats.timeouts += 1
+            raise
+        except (ProcessCancelledError, asyncio.CancelledError):
+            stats.cancellations += 1
+            raise
+        finally:
+            duration = time.monotonic() - started_at
+            stats.running -= 1
+            stats.runs += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            self._get_semaphore(tool).release()
+
+        if result.returncode != 0:
+            stats.failures += 1
+            if check:
+                raise ProcessError(
+                    f"{tool} exited with code {result.returncode}", result.stderr
+                )
+        return result
+
+    async def _run(
+        self,
+        args: List[str],
+        timeout: Optional[float],
+        env: Optional[Dict[str, str]],
+        capture_stdout: bool,
+        is_cancelled: Optional[Callable[[], Awaitable[bool]]],
+    ) -> ProcessResult:
+        started_at = time.monotonic()
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=(
+                asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL
+            ),
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        stderr = bytearray()
+
+        async def read_stderr():
+            while chunk := await process.stderr.read(8192):
+                stderr.extend(chunk)
+                del stderr[:-MAX_STDERR_SIZE]
+
+        async def communicate() -> bytes:
+            stdout, _ = await asyncio.gather(
+                process.stdout.read() if capture_stdout else asyncio.sleep(0, b""),
+                read_stderr(),
+            )
+            await process.wait()
+            return stdout
+
+        async def wait_for_cancellation():
+            while not await is_cancelled():
+                await asyncio.sleep(CANCELLATION_POLL_INTERVAL)
+
+        communicate_task = asyncio.create_task(communicate())
+        cancellation_task = (
+            asyncio.create_task(wait_for_cancellation()) if is_cancelled else None
+        )
+        try:
+            done, _ = await asyncio.wait(
+                [task for task in (communicate_task, cancellation_task) if task],
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            if cancellation_task:
+                cancellation_task.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not communicate_task.done():
+                communicate_task.cancel()
+
+        tool = self._get_tool(args)
+        stderr_text = stderr.decode(errors="replace")
+        if communicate_task not in done:
+            if cancellation_task in done:
+                raise ProcessCancelledError(f"{tool} was cancelled", stderr_text)
+            raise ProcessTimeoutError(
+                f"{tool} timed out after {timeout} seconds", stderr_text
+            )
+
+        return ProcessResult(
+            returncode=process.returncode,
+            stdout=communicate_task.result(),
+            stderr=stderr_text,
+            duration=time.monotonic() - started_at,
+        )
+
+
+PROCESS_RUNNER = ProcessRunner()
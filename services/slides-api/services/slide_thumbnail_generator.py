@@ -5,17 +5,23 @@ Uses LibreOffice in headless mode or python-pptx with Pillow to generate
 thumbnail images of slides for preview purposes.
 """
 
+import asyncio
 import os
-import subprocess
 import tempfile
 import shutil
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Emu
 from PIL import Image
-import io
-import base64
+
+from services.libreoffice_pool import LIBREOFFICE_POOL
+from services.pdf_rasterizer import PDF_RASTERIZER
+
+
+# Width in pixels of the WebP thumbnails of each size
+THUMBNAIL_SIZES = {"list": 320, "grid": 640, "full": 1920}
+THUMBNAIL_WEBP_QUALITY = 80
 
 
 class SlideThumbnailGenerator:
@@ -26,45 +32,55 @@ class SlideThumbnailGenerator:
     1. LibreOffice conversion (best quality)
     2. PDF intermediate conversion
     3. Basic placeholder-based preview (fallback)
+
+    Every slide is rendered once and saved as WebP in each of the
+    THUMBNAIL_SIZES. The thumbnails of a template are replaced all at once,
+    so they are never served half generated.
     """
 
     def __init__(self, output_dir: Optional[str] = None):
         self.output_dir = output_dir or tempfile.mkdtemp(prefix="slide_thumbs_")
         os.makedirs(self.output_dir, exist_ok=True)
+        self._tasks: Dict[str, asyncio.Task] = {}
 
-        # Check if LibreOffice is available
-        self.libreoffice_path = self._find_libreoffice()
-
-    def _find_libreoffice(self) -> Optional[str]:
-        """Find LibreOffice executable"""
-        possible_paths = [
-            "/usr/local/bin/soffice",  # macOS Homebrew
-            "/Applications/LibreOffice.app/Contents/MacOS/soffice",  # macOS native
-            "/usr/bin/libreoffice",  # Linux
-            "/usr/bin/soffice",  # Linux alt
-            "C:\\Program Files\\LibreOffice\\program\\soffice.exe",  # Windows
-            "libreoffice",  # PATH
-            "soffice",  # PATH
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-            # Check if in PATH
-            try:
-                result = subprocess.run(
-                    ["which", path] if os.name != "nt" else ["where", path],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-            except Exception:
-                pass
-
-        return None
+    def schedule(self, pptx_path: str, template_id: str) -> asyncio.Task:
+        """
+        Generates the thumbnails of a template in the background. Returns
+        the generation already running for the template if any.
+        """
+        task = self._tasks.get(template_id)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate_in_background(pptx_path, template_id)
+            )
+            self._tasks[template_id] = task
+            task.add_done_callback(lambda _: self._on_task_done(template_id, task))
+        return task
+
+    def _on_task_done(self, template_id: str, task: asyncio.Task):
+        # A cancelled generation may already be replaced by a new one
+        if self._tasks.get(template_id) is task:
+            del self._tasks[template_id]
+
+    def is_generating(self, template_id: str) -> bool:
+        return template_id in self._tasks
+
+    async def ensure_thumbnails(self, pptx_path: str, template_id: str) -> None:
+        """Waits for the thumbnails of a template, generating them if missing"""
+        if self.get_thumbnail_path(template_id, 0) and not self.is_generating(
+            template_id
+        ):
+            return
+        # Shielded, so a client going away does not stop the generation
+        await asyncio.shield(self.schedule(pptx_path, template_id))
+
+    async def _generate_in_background(self, pptx_path: str, template_id: str):
+        try:
+            await self.generate_thumbnails(pptx_path, template_id)
+        except Exception as e:
+            print(f"Error generating thumbnails for template {template_id}: {e}")
 
-    def generate_thumbnails(
+    async def generate_thumbnails(
         self,
         pptx_path: str,
         template_id: str,
@@ -81,29 +97,66 @@ class SlideThumbnailGenerator:
             height: Thumbnail height in pixels
 
         Returns:
-            List of paths to generated thumbnail images
+            List of paths to the full size thumbnails
         """
-        # Create template-specific directory
         template_dir = os.path.join(self.output_dir, template_id)
-        os.makedirs(template_dir, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix=f".{template_id}_", dir=self.output_dir)
+        try:
+            with tempfile.TemporaryDirectory() as render_dir:
+                images = []
 
-        thumbnails = []
+                # Try LibreOffice method first (best quality)
+                if LIBREOFFICE_POOL.is_available:
+                    images = await self._generate_with_libreoffice(
+                        pptx_path, render_dir, width, height
+                    )
 
-        # Try LibreOffice method first (best quality)
-        if self.libreoffice_path:
-            thumbnails = self._generate_with_libreoffice(
-                pptx_path, template_dir, width, height
-            )
+                # Fallback to basic preview if LibreOffice not available
+                if not images:
+                    images = await asyncio.to_thread(
+                        self._generate_basic_preview,
+                        pptx_path,
+                        render_dir,
+                        width,
+                        height,
+                    )
 
-        # Fallback to basic preview if LibreOffice not available
-        if not thumbnails:
-            thumbnails = self._generate_basic_preview(
-                pptx_path, template_dir, width, height
-            )
+                await asyncio.to_thread(self._save_webp_sizes, images, staging_dir)
 
-        return thumbnails
+            if os.path.exists(template_dir):
+                shutil.rmtree(template_dir)
+            os.replace(staging_dir, template_dir)
+        finally:
+            if os.path.exists(staging_dir):
+                shutil.rmtree(staging_dir)
+
+        return [
+            self._get_thumbnail_file(template_id, idx, "full")
+            for idx in range(len(images))
+        ]
+
+    def _save_webp_sizes(self, images: List[str], output_dir: str):
+        for idx, image_path in enumerate(images):
+            with Image.open(image_path) as image:
+                rgb_image = image.convert("RGB")
+            for size, size_width in THUMBNAIL_SIZES.items():
+                thumbnail = rgb_image
+                if rgb_image.width > size_width:
+                    thumbnail = rgb_image.resize(
+                        (
+                            size_width,
+                            round(rgb_image.height * size_width / rgb_image.width),
+                        ),
+                        Image.LANCZOS,
+                    )
+                thumbnail.save(
+                    os.path.join(output_dir, f"slide_{idx}_{size}.webp"),
+                    "WEBP",
+                    quality=THUMBNAIL_WEBP_QUALITY,
+                    method=4,
+                )
 
-    def _generate_with_libreoffice(
+    async def _generate_with_libreoffice(
         self,
         pptx_path: str,
         output_dir: str,
@@ -111,67 +164,24 @@ class SlideThumbnailGenerator:
         height: int
     ) -> List[str]:
         """Generate thumbnails using LibreOffice"""
-        thumbnails = []
-
         try:
             # Convert PPTX to PDF first
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Run LibreOffice to convert to PDF
-                cmd = [
-                    self.libreoffice_path,
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", temp_dir,
-                    pptx_path
-                ]
-
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
+                pdf_path = await LIBREOFFICE_POOL.convert(pptx_path, temp_dir, "pdf")
+
+                # Render the PDF pages in parallel
+                return await PDF_RASTERIZER.rasterize(
+                    pdf_path,
+                    output_dir,
+                    width=width,
+                    height=height,
+                    filename_format="slide_{index}.png",
                 )
 
-                if result.returncode != 0:
-                    print(f"LibreOffice conversion failed: {result.stderr}")
-                    return []
-
-                # Find the generated PDF
-                pdf_name = os.path.splitext(os.path.basename(pptx_path))[0] + ".pdf"
-                pdf_path = os.path.join(temp_dir, pdf_name)
-
-                if not os.path.exists(pdf_path):
-                    print(f"PDF not found: {pdf_path}")
-                    return []
-
-                # Convert PDF pages to images using pdf2image or poppler
-                try:
-                    from pdf2image import convert_from_path
-
-                    images = convert_from_path(
-                        pdf_path,
-                        dpi=72,
-                        size=(width, height)
-                    )
-
-                    for idx, image in enumerate(images):
-                        thumb_path = os.path.join(output_dir, f"slide_{idx}.png")
-                        image.save(thumb_path, "PNG")
-                        thumbnails.append(thumb_path)
-
-                except ImportError:
-                    print("pdf2image not installed, falling back to basic preview")
-                    return []
-
-        except subprocess.TimeoutExpired:
-            print("LibreOffice conversion timed out")
-            return []
         except Exception as e:
             print(f"LibreOffice conversion error: {e}")
             return []
 
-        return thumbnails
-
     def _generate_basic_preview(
         self,
         pptx_path: str,
@@ -296,30 +306,35 @@ class SlideThumbnailGenerator:
         except Exception:
             return "#cccccc"
 
-    def get_thumbnail_path(self, template_id: str, slide_index: int) -> Optional[str]:
-        """Get path to a specific slide thumbnail"""
-        thumb_path = os.path.join(
-            self.output_dir,
-            template_id,
-            f"slide_{slide_index}.png"
+    def _get_thumbnail_file(self, template_id: str, slide_index: int, size: str) -> str:
+        return os.path.join(
+            self.output_dir, template_id, f"slide_{slide_index}_{size}.webp"
         )
+
+    def get_thumbnail_path(
+        self, template_id: str, slide_index: int, size: str = "full"
+    ) -> Optional[str]:
+        """Get path to a specific slide thumbnail"""
+        thumb_path = self._get_thumbnail_file(template_id, slide_index, size)
         return thumb_path if os.path.exists(thumb_path) else None
 
-    def get_thumbnail_base64(self, template_id: str, slide_index: int) -> Optional[str]:
-        """Get base64 encoded thumbnail for embedding in JSON"""
-        thumb_path = self.get_thumbnail_path(template_id, slide_index)
-        if not thumb_path:
-            return None
+    def get_thumbnail_count(self, template_id: str) -> int:
+        count = 0
+        while self.get_thumbnail_path(template_id, count):
+            count += 1
+        return count
 
-        try:
-            with open(thumb_path, "rb") as f:
-                return base64.b64encode(f.read()).decode('utf-8')
-        except Exception:
-            return None
+    def get_thumbnail_etag(self, thumb_path: str) -> str:
+        """ETag of a thumbnail, which changes whenever it is regenerated"""
+        stat = os.stat(thumb_path)
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
 
     def cleanup(self, template_id: Optional[str] = None):
         """Clean up generated thumbnails"""
         if template_id:
+            task = self._tasks.pop(template_id, None)
+            if task:
+                task.cancel()
             template_dir = os.path.join(self.output_dir, template_id)
             if os.path.exists(template_dir):
                 shutil.rmtree(template_dir)
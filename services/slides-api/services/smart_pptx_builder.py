@@ -28,8 +28,9 @@ from pptx.shapes.base import BaseShape
 from pptx.shapes.autoshape import Shape
 from pptx.text.text import _Paragraph
 from lxml import etree
-import aiohttp
 
+from services.export_executor import EXPORT_EXECUTOR
+from utils.download_helpers import download_images
 from utils.get_env import get_app_data_directory_env as get_app_data_directory
 
 
@@ -791,27 +792,32 @@ class SmartPptxBuilder:
     # IMAGE HANDLING
     # ====================================================================================
 
-    async def process_images(self):
-        """Download and insert all placeholder images."""
+    def _get_image_placeholders(self) -> List[Tuple[Any, Any, str]]:
+        placeholders = []
         for slide in self.prs.slides:
-            shapes_to_process = []
-
             for shape in slide.shapes:
                 if hasattr(shape, 'name') and shape.name.startswith("IMAGE_PLACEHOLDER:"):
                     url = shape.name.replace("IMAGE_PLACEHOLDER:", "")
-                    shapes_to_process.append((shape, url))
+                    placeholders.append((slide, shape, url))
+        return placeholders
 
-            for shape, url in shapes_to_process:
-                await self._replace_with_image(slide, shape, url)
-
-    async def _replace_with_image(self, slide, placeholder_shape, url: str):
+    async def process_images(self):
+        """Download and insert all placeholder images."""
+        urls = [url for _, _, url in self._get_image_placeholders()]
+        missing_urls = [url for url in urls if url not in self._image_cache]
+        self._image_cache.update(await download_images(missing_urls))
+        self.insert_images(self._image_cache)
+
+    def insert_images(self, images: Dict[str, bytes]):
+        """Insert already downloaded images in place of their placeholders."""
+        for slide, shape, url in self._get_image_placeholders():
+            image_bytes = images.get(url)
+            if image_bytes:
+                self._replace_with_image(slide, shape, url, image_bytes)
+
+    def _replace_with_image(self, slide, placeholder_shape, url: str, image_bytes: bytes):
         """Replace a placeholder shape with an actual image."""
         try:
-            # Download image
-            image_bytes = await self._download_image(url)
-            if not image_bytes:
-                return
-
             # Get position
             left = placeholder_shape.left
             top = placeholder_shape.top
@@ -835,23 +841,6 @@ class SmartPptxBuilder:
         except Exception as e:
             print(f"Error processing image {url}: {e}")
 
-    async def _download_image(self, url: str) -> Optional[bytes]:
-        """Download an image from URL with caching."""
-        if url in self._image_cache:
-            return self._image_cache[url]
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        data = await response.read()
-                        self._image_cache[url] = data
-                        return data
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-
-        return None
-
     # ====================================================================================
     # EXPORT
     # ====================================================================================
@@ -891,6 +880,34 @@ async def build_presentation_from_content(
     Returns:
         Path to the generated PPTX file
     """
+    # Images are downloaded here, the CPU bound build runs in the executor
+    images = await download_images(
+        [_get_slide_image_url(slide_data) for slide_data in slides_content]
+    )
+
+    if not output_path:
+        exports_dir = os.path.join(get_app_data_directory(), "exports")
+        os.makedirs(exports_dir, exist_ok=True)
+        output_path = os.path.join(exports_dir, f"{title.replace(' ', '_')}_{uuid.uuid4().hex[:8]}.pptx")
+
+    await EXPORT_EXECUTOR.run(
+        build_presentation_file, slides_content, template_name, output_path, images
+    )
+
+    return output_path
+
+
+def _get_slide_image_url(slide_data: Dict[str, Any]) -> Optional[str]:
+    return slide_data.get("image", {}).get("__image_url__") or slide_data.get("image", {}).get("url")
+
+
+def build_presentation_file(
+    slides_content: List[Dict[str, Any]],
+    template_name: str,
+    output_path: str,
+    images: Dict[str, bytes]
+):
+    """Build and save a presentation from content with already downloaded images."""
     builder = SmartPptxBuilder(template_name)
 
     for i, slide_data in enumerate(slides_content):
@@ -902,7 +919,7 @@ async def build_presentation_from_content(
                 subtitle=slide_data.get("subtitle", slide_data.get("description", "")),
                 presenter_name=slide_data.get("presenterName", slide_data.get("presenter_name", "")),
                 date=slide_data.get("presentationDate", slide_data.get("date", "")),
-                image_url=slide_data.get("image", {}).get("__image_url__") or slide_data.get("image", {}).get("url")
+                image_url=_get_slide_image_url(slide_data)
             )
         elif slide_type == "conclusion":
             builder.create_conclusion_slide(
@@ -922,20 +939,10 @@ async def build_presentation_from_content(
                 title=slide_data.get("title", ""),
                 body=slide_data.get("body", slide_data.get("description", "")),
                 bullets=slide_data.get("bullets"),
-                image_url=slide_data.get("image", {}).get("__image_url__") or slide_data.get("image", {}).get("url"),
+                image_url=_get_slide_image_url(slide_data),
                 speaker_notes=slide_data.get("speaker_notes", slide_data.get("__speaker_note__", ""))
             )
 
-    # Process all images
-    await builder.process_images()
-
-    # Save
-    if not output_path:
-        exports_dir = os.path.join(get_app_data_directory(), "exports")
-        os.makedirs(exports_dir, exist_ok=True)
-        output_path = os.path.join(exports_dir, f"{title.replace(' ', '_')}_{uuid.uuid4().hex[:8]}.pptx")
-
+    builder.insert_images(images)
     builder.save(output_path)
     builder.cleanup()
-
-    return output_path
@@ -0,0 +1,22 @@
+from utils.download_helpers import get_local_image_path
+
+
+def test_local_image_paths_are_only_resolved_for_this_app(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("NEXTJS_URL", "https://slides.example.com")
+    image_path = tmp_path / "images" / "chart.png"
+    image_path.parent.mkdir()
+    image_path.write_bytes(b"png")
+
+    assert get_local_image_path("/app_data/images/chart.png") == str(image_path)
+    assert get_local_image_path(
+        "http://localhost:8000/app_data/images/chart.png"
+    ) == str(image_path)
+    assert get_local_image_path(
+        "https://slides.example.com/app_data/images/chart.png"
+    ) == str(image_path)
+    assert (
+        get_local_image_path("https://cdn.example.com/app_data/images/chart.png")
+        is None
+    )
+    assert get_local_image_path("/app_data/../secrets.png") is None
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from services.export_executor import ExportExecutor
+
+
+def test_timed_out_export_does_not_fail_the_others():
+    executor = ExportExecutor()
+    executor.max_workers = 2
+
+    async def run_test():
+        slow_export = asyncio.create_task(executor.run(time.sleep, 4, timeout=2))
+        other_export = asyncio.create_task(executor.run(sum, [1, 2], timeout=30))
+
+        with pytest.raises(HTTPException) as error:
+            await slow_export
+        assert error.value.status_code == 504
+        assert await other_export == 3
+        # The abandoned job keeps its worker until it ends
+        assert executor.stats()["abandoned"] == 1
+        assert await executor.run(sum, [3, 4]) == 7
+
+    try:
+        asyncio.run(run_test())
+    finally:
+        executor.shutdown()
+
+
+def test_runs_in_a_thread_without_workers():
+    executor = ExportExecutor()
+    executor.max_workers = 0
+
+    assert asyncio.run(executor.run(sum, [1, 2])) == 3
+    executor.shutdown()
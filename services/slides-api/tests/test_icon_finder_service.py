@@ -0,0 +1,44 @@
+import asyncio
+from typing import List
+
+from services.icon_finder_service import IconFinderService
+
+
+class RecordingIconFinderService(IconFinderService):
+    def __init__(self):
+        self._pending_searches = []
+        self._flush_handle = None
+        self._batch_tasks = set()
+        self.index = None
+        self.queries: List[List[str]] = []
+
+    def query(self, query_texts: List[str], n_results: int) -> List[List[str]]:
+        self.queries.append(query_texts)
+        return [
+            [f"{text}-{rank}" for rank in range(n_results)] for text in query_texts
+        ]
+
+
+def test_concurrent_searches_are_batched_in_one_query():
+    service = RecordingIconFinderService()
+
+    async def run_test():
+        return await asyncio.gather(
+            service.search_icons("chart", 2),
+            service.search_icons("user"),
+            service.search_icons("calendar", 3),
+        )
+
+    results = asyncio.run(run_test())
+
+    assert service.queries == [["chart", "user", "calendar"]]
+    assert results == [
+        ["/static/icons/bold/chart-0.svg", "/static/icons/bold/chart-1.svg"],
+        ["/static/icons/bold/user-0.svg"],
+        [
+            "/static/icons/bold/calendar-0.svg",
+            "/static/icons/bold/calendar-1.svg",
+            "/static/icons/bold/calendar-2.svg",
+        ],
+    ]
+    assert not service._batch_tasks
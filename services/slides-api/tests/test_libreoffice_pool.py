@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from services import libreoffice_pool
+from services.libreoffice_pool import LibreOfficePool, LibreOfficeWorker
+from services.process_runner import ProcessCancelledError
+
+
+class FakeWorker(LibreOfficeWorker):
+    def __init__(self, executable: str, directory: str):
+        super().__init__(executable, directory)
+        self.starts = []
+        self.running = False
+
+    def is_running(self) -> bool:
+        return self.running
+
+    async def is_healthy(self) -> bool:
+        return self.running
+
+    async def start(self, font_aliases, generation):
+        self.starts.append(dict(font_aliases))
+        self.font_aliases = dict(font_aliases)
+        self.generation = generation
+        self.conversions = 0
+        self.interrupted = False
+        self.running = True
+
+    async def stop(self):
+        self.running = False
+
+    async def convert(self, input_path, output_dir, convert_to, timeout, is_cancelled):
+        self.conversions += 1
+        if is_cancelled and await is_cancelled():
+            raise ProcessCancelledError("soffice cancelled")
+        return f"{output_dir}/{self.directory}.{convert_to}"
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("LIBREOFFICE_WORKERS", "2")
+    monkeypatch.setattr(libreoffice_pool, "LibreOfficeWorker", FakeWorker)
+    pool = LibreOfficePool()
+    pool.executable = "soffice"
+    return pool
+
+
+async def _convert(pool: LibreOfficePool, font_aliases=None, is_cancelled=None):
+    return await pool.convert(
+        "deck.pptx", "out", "pdf", font_aliases=font_aliases, is_cancelled=is_cancelled
+    )
+
+
+def test_only_the_worker_used_restarts_for_new_font_aliases(pool):
+    async def run():
+        await asyncio.gather(_convert(pool), _convert(pool))
+        await _convert(pool, {"Brand Sans": "Inter"})
+
+    asyncio.run(run())
+
+    first, second = pool._workers
+    assert first.starts == [{}, {"Brand Sans": "Inter"}]
+    assert second.starts == [{}]
+
+
+def test_workers_with_the_font_aliases_are_preferred(pool):
+    async def run():
+        await asyncio.gather(_convert(pool), _convert(pool))
+        await _convert(pool, {"Brand Sans": "Inter"})
+        await _convert(pool, {"Brand Serif": "Lora"})
+        await _convert(pool, {"Brand Sans": "Inter"})
+
+    asyncio.run(run())
+
+    first, second = pool._workers
+    assert first.starts == [{}, {"Brand Sans": "Inter"}]
+    assert second.starts == [{}, {"Brand Serif": "Lora"}]
+
+
+def test_font_aliases_kept_by_a_worker_are_capped(pool, monkeypatch):
+    monkeypatch.setattr(libreoffice_pool, "LIBREOFFICE_MAX_FONT_ALIASES", 2)
+    pool.n_workers = 1
+
+    async def run():
+        await _convert(pool, {"A": "Inter"})
+        await _convert(pool, {"B": "Inter"})
+        await _convert(pool, {"C": "Inter"})
+
+    asyncio.run(run())
+
+    assert pool._workers[0].starts == [
+        {"A": "Inter"},
+        {"A": "Inter", "B": "Inter"},
+        {"C": "Inter"},
+    ]
+
+
+def test_workers_restart_after_a_cancelled_conversion(pool):
+    pool.n_workers = 1
+
+    async def is_cancelled():
+        return True
+
+    async def run():
+        with pytest.raises(ProcessCancelledError):
+            await _convert(pool, is_cancelled=is_cancelled)
+        await _convert(pool)
+
+    asyncio.run(run())
+
+    assert pool._workers[0].starts == [{}, {}]
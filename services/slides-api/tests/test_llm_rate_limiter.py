@@ -0,0 +1,308 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from enums.llm_provider import LLMProvider
+from models.llm_message import LLMUserMessage
+from services import llm_client, llm_rate_limiter
+from services.llm_client import LLMClient
+from services.llm_rate_limiter import (
+    LLMRateLimiter,
+    get_usage_tokens,
+    record_llm_usage,
+    record_rate_limit_headers,
+    set_llm_request_owner,
+)
+
+
+class RateLimitedError(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after-ms": "1"})
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "8")
+    monkeypatch.delenv("LLM_TOKENS_PER_MINUTE", raising=False)
+    monkeypatch.delenv("LLM_MAX_RETRIES", raising=False)
+    # Shortest backoff, 0.5 seconds
+    monkeypatch.setattr(llm_rate_limiter, "random", SimpleNamespace(random=lambda: 0))
+    return LLMRateLimiter()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        llm_rate_limiter, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    return now
+
+
+def test_rate_limited_calls_are_retried_with_halved_concurrency(limiter):
+    attempts = []
+
+    async def call():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RateLimitedError()
+        return "content"
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        result = await limiter.run(LLMProvider.OPENAI, 10, call)
+        return result, loop.time() - started_at
+
+    result, elapsed = asyncio.run(run())
+
+    assert result == "content"
+    assert attempts == [0, 1]
+    assert elapsed >= 0.5
+    # Halved to 4 on the 429, then one slot back for the successful retry
+    assert limiter._providers[LLMProvider.OPENAI].concurrency_limit == 5
+
+
+def test_concurrency_recovers_one_slot_per_successful_call(limiter):
+    async def call():
+        return "content"
+
+    async def run():
+        state = limiter._get_state(LLMProvider.OPENAI)
+        limiter._on_rate_limited(state, 0)
+        limiter._on_rate_limited(state, 0)
+        limits = [state.concurrency_limit]
+        for _ in range(7):
+            await limiter.run(LLMProvider.OPENAI, 10, call)
+            limits.append(state.concurrency_limit)
+        return limits
+
+    assert asyncio.run(run()) == [2, 3, 4, 5, 6, 7, 8, 8]
+
+
+def test_rate_limited_calls_fail_once_retries_are_exhausted(limiter, monkeypatch):
+    monkeypatch.setenv("LLM_MAX_RETRIES", "0")
+    attempts = []
+
+    async def call():
+        attempts.append(None)
+        raise RateLimitedError()
+
+    with pytest.raises(RateLimitedError):
+        asyncio.run(limiter.run(LLMProvider.OPENAI, 10, call))
+    assert len(attempts) == 1
+
+
+def test_other_errors_are_not_retried(limiter):
+    attempts = []
+
+    async def call():
+        attempts.append(None)
+        raise ValueError("invalid response")
+
+    with pytest.raises(ValueError):
+        asyncio.run(limiter.run(LLMProvider.OPENAI, 10, call))
+    assert len(attempts) == 1
+
+
+def test_token_budget_holds_calls_until_the_window_frees(
+    limiter, clock, monkeypatch
+):
+    monkeypatch.setenv("LLM_TOKENS_PER_MINUTE", "1000")
+
+    async def run():
+        async with limiter.slot(LLMProvider.OPENAI, 800):
+            pass
+
+        # Nothing is in flight, the budget still applies
+        second = asyncio.create_task(_acquire(limiter, 300))
+        await asyncio.sleep(0.05)
+        held = not second.done()
+
+        clock[0] += 61
+        limiter._dispatch(limiter._providers[LLMProvider.OPENAI])
+        await asyncio.wait_for(second, 1)
+        return held
+
+    assert asyncio.run(run())
+
+
+def test_a_call_larger_than_the_budget_runs_alone(limiter, clock, monkeypatch):
+    monkeypatch.setenv("LLM_TOKENS_PER_MINUTE", "1000")
+
+    async def run():
+        await asyncio.wait_for(_acquire(limiter, 5000), 1)
+
+    asyncio.run(run())
+
+
+def test_token_budget_is_corrected_with_the_reported_usage(
+    limiter, clock, monkeypatch
+):
+    monkeypatch.setenv("LLM_TOKENS_PER_MINUTE", "1000")
+
+    async def run():
+        first_done = asyncio.Event()
+
+        async def first():
+            async with limiter.slot(LLMProvider.OPENAI, 900):
+                await first_done.wait()
+                record_llm_usage(100)
+
+        first_task = asyncio.create_task(first())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(_acquire(limiter, 500))
+        await asyncio.sleep(0.05)
+        held = not second.done()
+
+        first_done.set()
+        await first_task
+        await asyncio.wait_for(second, 1)
+        return held, limiter._providers[LLMProvider.OPENAI].tokens_used(clock[0])
+
+    held, tokens_used = asyncio.run(run())
+
+    assert held
+    assert tokens_used == 600
+
+
+def test_slots_are_handed_out_round_robin_between_owners(limiter, monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "1")
+    order = []
+
+    async def call(owner: str, name: str):
+        set_llm_request_owner(owner)
+        async with limiter.slot(LLMProvider.OPENAI, 1):
+            order.append(name)
+
+    async def run():
+        release = asyncio.Event()
+
+        async def blocker():
+            set_llm_request_owner("blocker")
+            async with limiter.slot(LLMProvider.OPENAI, 1):
+                await release.wait()
+
+        blocker_task = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(call("a", "a1")),
+            asyncio.create_task(call("a", "a2")),
+            asyncio.create_task(call("a", "a3")),
+            asyncio.create_task(call("b", "b1")),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(blocker_task, *tasks)
+
+    asyncio.run(run())
+
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+def test_usage_tokens_are_read_from_every_provider_response():
+    openai_response = SimpleNamespace(usage=SimpleNamespace(total_tokens=120))
+    anthropic_response = SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=100, output_tokens=30)
+    )
+    google_response = SimpleNamespace(
+        usage_metadata=SimpleNamespace(total_token_count=90)
+    )
+
+    assert get_usage_tokens(openai_response) == 120
+    assert get_usage_tokens(anthropic_response) == 130
+    assert get_usage_tokens(google_response) == 90
+    assert get_usage_tokens(SimpleNamespace()) is None
+
+
+def test_remaining_tokens_reported_by_the_provider_hold_calls(limiter, clock):
+    async def run():
+        async with limiter.slot(LLMProvider.OPENAI, 100):
+            record_rate_limit_headers(
+                {
+                    "x-ratelimit-remaining-tokens": "400",
+                    "x-ratelimit-reset-tokens": "20s",
+                }
+            )
+
+        await asyncio.wait_for(_acquire(limiter, 300), 1)
+        # Only 100 tokens remain until the reset
+        second = asyncio.create_task(_acquire(limiter, 300))
+        await asyncio.sleep(0.05)
+        held = not second.done()
+
+        clock[0] += 20
+        limiter._dispatch(limiter._providers[LLMProvider.OPENAI])
+        await asyncio.wait_for(second, 1)
+        return held
+
+    assert asyncio.run(run())
+
+
+def test_used_up_requests_reported_by_the_provider_start_a_cooldown(limiter, clock):
+    async def run():
+        async with limiter.slot(LLMProvider.OPENAI, 100):
+            record_rate_limit_headers(
+                {
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1m",
+                }
+            )
+
+    asyncio.run(run())
+
+    assert limiter._providers[LLMProvider.OPENAI].cooldown_until == 1060
+
+
+def test_streams_rate_limited_before_their_first_chunk_are_retried(
+    limiter, monkeypatch
+):
+    monkeypatch.setattr(llm_client, "LLM_RATE_LIMITER", limiter)
+    client = LLMClient.__new__(LLMClient)
+    client.llm_provider = LLMProvider.OPENAI
+    attempts = []
+
+    async def create_stream():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise RateLimitedError()
+        yield "Slide"
+        yield " content"
+
+    async def run():
+        stream = client._rate_limited_stream(
+            create_stream, [LLMUserMessage(content="Outline")]
+        )
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(run()) == ["Slide", " content"]
+    assert len(attempts) == 2
+
+
+def test_streams_rate_limited_after_their_first_chunk_are_not_retried(
+    limiter, monkeypatch
+):
+    monkeypatch.setattr(llm_client, "LLM_RATE_LIMITER", limiter)
+    client = LLMClient.__new__(LLMClient)
+    client.llm_provider = LLMProvider.OPENAI
+    chunks = []
+
+    async def create_stream():
+        yield "Slide"
+        raise RateLimitedError()
+
+    async def run():
+        async for chunk in client._rate_limited_stream(
+            create_stream, [LLMUserMessage(content="Outline")]
+        ):
+            chunks.append(chunk)
+
+    with pytest.raises(RateLimitedError):
+        asyncio.run(run())
+    assert chunks == ["Slide"]
+
+
+async def _acquire(limiter: LLMRateLimiter, tokens: int):
+    async with limiter.slot(LLMProvider.OPENAI, tokens):
+        pass
@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from enums.llm_provider import LLMProvider
+from models.llm_message import LLMSystemMessage, LLMUserMessage
+from services import llm_response_cache
+from services.llm_response_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "true")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", "2")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_MAX_DISK_ENTRIES", "2")
+    return LLMResponseCache()
+
+
+def get_key(cache: LLMResponseCache, system_prompt: str, prompt: str = "Outline"):
+    return cache.get_key(
+        LLMProvider.OPENAI,
+        "gpt-4.1",
+        [LLMSystemMessage(content=system_prompt), LLMUserMessage(content=prompt)],
+        max_tokens=1000,
+    )
+
+
+def test_keys_ignore_the_timestamps_embedded_in_prompts(cache):
+    key = get_key(cache, "Current date and time: 2026-10-17 09:12:45.123456")
+
+    assert key == get_key(cache, "Current date and time: 2026-10-18T17:01:02")
+    assert key != get_key(cache, "Current date and time: 2026-10-17 09:12:45", "Slide")
+    assert key != cache.get_key(
+        LLMProvider.ANTHROPIC,
+        "gpt-4.1",
+        [
+            LLMSystemMessage(content="Current date and time: 2026-10-17 09:12:45"),
+            LLMUserMessage(content="Outline"),
+        ],
+        max_tokens=1000,
+    )
+
+
+def test_keys_are_not_computed_when_disabled(cache, monkeypatch):
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "false")
+
+    assert get_key(cache, "System") is None
+
+
+def test_memory_tier_evicts_the_least_recently_used_entry(cache):
+    async def run():
+        await cache.set("a", {"value": "a"})
+        await cache.set("b", {"value": "b"})
+        await cache.get("a")
+        await cache.set("c", {"value": "c"})
+
+    asyncio.run(run())
+
+    assert list(cache._memory) == ["a", "c"]
+
+
+def test_disk_tier_evicts_the_least_recently_used_entry(cache):
+    async def run():
+        await cache.set("a", {"value": "a"})
+        await cache.set("b", {"value": "b"})
+        cache._memory.clear()
+        # Disk hit, refreshes the access time of a
+        assert await cache.get("a") == {"value": "a"}
+        cache._memory.clear()
+        await cache.set("c", {"value": "c"})
+        cache._memory.clear()
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == [{"value": "a"}, None, {"value": "c"}]
+    assert cache.disk_hits == 3
+    assert cache.misses == 1
+
+
+def test_disk_tier_is_shared_between_instances(cache):
+    asyncio.run(cache.set("a", ["slide"]))
+
+    # Overwriting an entry does not count against the cap
+    asyncio.run(cache.set("a", ["slide", "updated"]))
+    other_cache = LLMResponseCache()
+
+    assert asyncio.run(other_cache.get("a")) == ["slide", "updated"]
+    assert other_cache._disk_entries == 1
+
+
+def test_expired_entries_are_not_returned(cache, monkeypatch):
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_TTL", "1")
+    asyncio.run(cache.set("a", {"value": "a"}))
+    monkeypatch.setattr(llm_response_cache, "time", SimpleNamespace(time=lambda: 4e9))
+
+    assert asyncio.run(cache.get("a")) is None
+    assert cache._disk_entries == 0
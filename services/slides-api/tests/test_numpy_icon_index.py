@@ -0,0 +1,20 @@
+import json
+
+import numpy as np
+
+from services.numpy_icon_index import NumpyIconIndex
+
+
+def test_returns_the_most_similar_icons_in_order(tmp_path):
+    embeddings = np.eye(4, dtype=np.float32)
+    embeddings_path = str(tmp_path / "icon_embeddings.npy")
+    ids_path = str(tmp_path / "icon_embeddings_ids.json")
+    np.save(embeddings_path, embeddings)
+    with open(ids_path, "w") as f:
+        json.dump(["chart", "user", "calendar", "rocket"], f)
+    index = NumpyIconIndex(None, embeddings_path, ids_path)
+
+    results = index.query_embeddings([[0, 2, 1, 0], [0, 0, 0, 5]], 2)
+
+    assert results[0] == ["user", "calendar"]
+    assert results[1][0] == "rocket"
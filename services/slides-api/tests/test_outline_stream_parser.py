@@ -0,0 +1,33 @@
+import json
+
+from utils.outline_stream_parser import SlideOutlineStreamParser
+
+
+def test_yields_each_slide_outline_when_its_object_closes():
+    outlines = {
+        "slides": [
+            {"content": "# Intro\n- Welcome {to} the \"deck\""},
+            {"content": "# Agenda\n- [first] item"},
+            {"content": "# Closing"},
+        ]
+    }
+    text = json.dumps(outlines)
+
+    parser = SlideOutlineStreamParser()
+    received = []
+    for i in range(0, len(text), 7):
+        received.append([each.content for each in parser.feed(text[i : i + 7])])
+
+    flattened = [content for chunk in received for content in chunk]
+    assert flattened == [each["content"] for each in outlines["slides"]]
+
+    # First slide must be available before the stream has finished
+    first_slide_chunk = next(i for i, chunk in enumerate(received) if chunk)
+    assert first_slide_chunk < len(received) - 1
+
+
+def test_handles_whole_document_in_single_chunk():
+    parser = SlideOutlineStreamParser()
+    slides = parser.feed('{"slides": [{"content": "a"}, {"content": "b"}]}')
+    assert [each.content for each in slides] == ["a", "b"]
+    assert parser.feed("") == []
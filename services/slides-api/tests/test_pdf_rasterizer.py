@@ -0,0 +1,40 @@
+import asyncio
+
+from PIL import Image
+
+from services.pdf_rasterizer import PdfRasterizer
+
+
+def _save_pdf(path, colors):
+    pages = [Image.new("RGB", (400, 300), color) for color in colors]
+    pages[0].save(path, save_all=True, append_images=pages[1:])
+
+
+def test_concurrent_documents_render_in_threads(tmp_path):
+    colors = [["red", "green", "blue"], ["white", "black"]]
+    pdf_paths = []
+    for index, document_colors in enumerate(colors):
+        pdf_paths.append(str(tmp_path / f"document_{index}.pdf"))
+        _save_pdf(pdf_paths[-1], document_colors)
+    rasterizer = PdfRasterizer()
+    rasterizer.max_workers = 0
+
+    async def run_test():
+        return await asyncio.gather(
+            *[
+                rasterizer.rasterize(pdf_path, str(tmp_path / f"pages_{index}"), width=200)
+                for index, pdf_path in enumerate(pdf_paths)
+            ]
+        )
+
+    results = asyncio.run(run_test())
+
+    for document_colors, paths in zip(colors, results):
+        assert len(paths) == len(document_colors)
+        for color, path in zip(document_colors, paths):
+            with Image.open(path) as image:
+                assert image.width == 200
+                pixel = image.convert("RGB").getpixel((100, 75))
+            expected = Image.new("RGB", (1, 1), color).getpixel((0, 0))
+            # Pages are embedded as JPEG
+            assert all(abs(a - b) <= 8 for a, b in zip(pixel, expected))
@@ -0,0 +1,120 @@
+import os
+import zipfile
+
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+import pytest
+
+from models.pptx_models import (
+    PptxAutoShapeBoxModel,
+    PptxFillModel,
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+)
+from services.pptx_presentation_creator import BLANK_SLIDE_LAYOUT, PptxPresentationCreator
+from services.pptx_slide_cache import PptxSlideCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    cache = PptxSlideCache()
+    cache.max_size = 1024 * 1024
+    return cache
+
+
+def _rectangle(color: str) -> PptxAutoShapeBoxModel:
+    return PptxAutoShapeBoxModel(
+        type=MSO_AUTO_SHAPE_TYPE.RECTANGLE,
+        position=PptxPositionModel(left=20, top=20, width=100, height=100),
+        fill=PptxFillModel(color=color),
+    )
+
+
+def _slide_with_picture(tmp_path) -> PptxSlideModel:
+    image_path = str(tmp_path / "image.png")
+    Image.new("RGB", (40, 30), "red").save(image_path)
+    return PptxSlideModel(
+        shapes=[
+            _rectangle("FF0000"),
+            PptxPictureBoxModel(
+                position=PptxPositionModel(left=0, top=0, width=40, height=30),
+                picture=PptxPictureModel(is_network=False, path=image_path),
+            ),
+        ]
+    )
+
+
+def _new_slide(prs):
+    return prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE_LAYOUT])
+
+
+def test_restores_the_shapes_and_images_of_a_slide(cache, tmp_path):
+    slide_model = _slide_with_picture(tmp_path)
+    creator = PptxPresentationCreator(
+        PptxPresentationModel(slides=[slide_model]), str(tmp_path)
+    )
+    key = cache.get_key(slide_model)
+    slide = _new_slide(creator._ppt)
+    creator.populate_slide(slide, slide_model)
+    cache.store(key, slide)
+
+    prs = Presentation()
+    restored = _new_slide(prs)
+    assert cache.restore(key, restored)
+
+    assert len(restored.shapes) == 2
+    image_rIds = [
+        rId for rId, rel in restored.part.rels.items() if rel.reltype == RT.IMAGE
+    ]
+    assert len(image_rIds) == 1
+    assert restored.shapes[1]._element.blipFill.blip.rEmbed == image_rIds[0]
+    assert zipfile.is_zipfile(cache._get_path(key))
+
+
+def test_key_changes_with_the_shapes_on_every_slide(cache):
+    slide_model = PptxSlideModel(shapes=[_rectangle("FF0000")])
+
+    assert cache.get_key(slide_model) == cache.get_key(
+        PptxSlideModel(shapes=[_rectangle("FF0000")])
+    )
+    assert cache.get_key(slide_model, [_rectangle("00FF00")]) != cache.get_key(
+        slide_model, [_rectangle("0000FF")]
+    )
+
+
+def test_key_changes_with_the_local_image_files(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "services.pptx_slide_cache.get_local_image_path", lambda path: path
+    )
+    slide_model = _slide_with_picture(tmp_path)
+    key = cache.get_key(slide_model)
+
+    image_path = slide_model.shapes[1].picture.path
+    Image.new("RGB", (60, 30), "blue").save(image_path)
+
+    assert cache.get_key(slide_model) != key
+
+
+def test_renders_the_slide_again_when_the_entry_is_corrupt(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr("services.pptx_presentation_creator.PPTX_SLIDE_CACHE", cache)
+    slide_model = PptxSlideModel(shapes=[_rectangle("FF0000")])
+    key = cache.get_key(slide_model)
+    with zipfile.ZipFile(cache._get_path(key), "w") as archive:
+        archive.writestr("slide.xml", "<not xml")
+
+    creator = PptxPresentationCreator(
+        PptxPresentationModel(slides=[slide_model]), str(tmp_path)
+    )
+    creator.add_slides([key])
+
+    assert len(creator._ppt.slides[0].shapes) == 1
+    # The entry was replaced by the rendered slide
+    restored = _new_slide(Presentation())
+    assert cache.restore(key, restored)
+    assert len(restored.shapes) == 1
@@ -0,0 +1,53 @@
+import os
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from services.pptx_template_cache import PptxTemplateCache
+
+
+def _save_template(path, title: str):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = title
+    prs.save(path)
+
+
+def test_returns_independent_copies_of_the_template(tmp_path):
+    template_path = str(tmp_path / "template.pptx")
+    _save_template(template_path, "Original")
+    cache = PptxTemplateCache()
+
+    first = cache.open(template_path)
+    first.slides[0].shapes.title.text = "Changed"
+    first.slides[0].shapes.add_textbox(0, 0, Inches(1), Inches(1))
+
+    second = cache.open(template_path)
+    assert second.slides[0].shapes.title.text == "Original"
+    assert len(second.slides[0].shapes) == 1
+
+
+def test_reloads_the_template_when_its_file_changes(tmp_path):
+    template_path = str(tmp_path / "template.pptx")
+    _save_template(template_path, "Original")
+    cache = PptxTemplateCache()
+    assert cache.open(template_path).slides[0].shapes.title.text == "Original"
+
+    _save_template(template_path, "Updated")
+    stat = os.stat(template_path)
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.open(template_path).slides[0].shapes.title.text == "Updated"
+
+
+def test_evicts_least_recently_used_templates(tmp_path):
+    cache = PptxTemplateCache()
+    paths = [str(tmp_path / f"template_{i}.pptx") for i in range(3)]
+    for path in paths:
+        _save_template(path, path)
+    cache.max_size = sum(os.path.getsize(path) for path in paths[1:])
+
+    for path in paths:
+        cache.open(path)
+
+    assert list(cache._entries) == paths[1:]
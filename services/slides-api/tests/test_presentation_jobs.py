@@ -0,0 +1,205 @@
+import asyncio
+import os
+import secrets
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from models.sql.async_presentation_generation_status import (
+    AsyncPresentationGenerationTaskModel,
+)
+from models.sql.presentation_generation_job import PresentationGenerationJobModel
+import services.presentation_checkpoint_service as checkpoint_service
+import services.presentation_job_queue as job_queue
+import services.presentation_job_worker as job_worker
+from services.presentation_job_queue import (
+    RedisPresentationJobQueue,
+    SqlPresentationJobQueue,
+)
+from services.presentation_job_worker import PresentationJobWorkerPool
+
+
+@pytest.fixture
+def session_maker(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(create_tables())
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    for module in (job_queue, job_worker, checkpoint_service):
+        monkeypatch.setattr(module, "async_session_maker", session_maker)
+    yield session_maker
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(params=["sql", "redis"])
+def queue(request, session_maker):
+    if request.param == "sql":
+        yield SqlPresentationJobQueue()
+        return
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        pytest.skip("REDIS_URL is not set")
+    queue = RedisPresentationJobQueue(
+        redis_url, prefix=f"test_presentation_jobs_{secrets.token_hex(4)}"
+    )
+    yield queue
+
+    async def delete_keys():
+        await queue.redis.delete(
+            queue.queue_key, queue.leases_key, queue.owners_key, queue.jobs_key
+        )
+        await queue.redis.aclose()
+
+    asyncio.run(delete_keys())
+
+
+def _new_job(**values) -> PresentationGenerationJobModel:
+    return PresentationGenerationJobModel(
+        id=f"task-{secrets.token_hex(8)}",
+        presentation_id=uuid.uuid4(),
+        request={"content": "Test"},
+        **values,
+    )
+
+
+def test_a_job_is_leased_by_a_single_worker(queue):
+    async def run_test():
+        await queue.enqueue(_new_job())
+
+        job = await queue.lease("worker-1", 60)
+        assert job.lease_owner == "worker-1"
+        assert job.attempts == 1
+        assert await queue.lease("worker-2", 60) is None
+        assert await queue.heartbeat(job, "worker-1", 60)
+
+    asyncio.run(run_test())
+
+
+def test_an_expired_lease_is_taken_over(queue):
+    async def run_test():
+        await queue.enqueue(_new_job())
+        job = await queue.lease("worker-1", 0)
+        await asyncio.sleep(0.01)
+
+        taken_over = await queue.lease("worker-2", 60)
+        assert taken_over.id == job.id
+        assert taken_over.attempts == 2
+        # The first worker is told it lost the job
+        assert not await queue.heartbeat(job, "worker-1", 60)
+
+    asyncio.run(run_test())
+
+
+def test_a_retried_job_waits_for_its_delay(queue):
+    async def run_test():
+        await queue.enqueue(_new_job())
+        job = await queue.lease("worker-1", 60)
+
+        await queue.retry(job, delay=60)
+        assert await queue.lease("worker-1", 60) is None
+
+        await queue.retry(job, delay=0)
+        retried = await queue.lease("worker-1", 60)
+        assert retried.id == job.id
+
+        await queue.complete(retried)
+        assert await queue.lease("worker-1", 60) is None
+
+    asyncio.run(run_test())
+
+
+class FakeQueue:
+    def __init__(self, heartbeat_result: bool = True):
+        self.heartbeat_result = heartbeat_result
+        self.calls = []
+
+    async def heartbeat(self, job, worker_id, lease_seconds):
+        return self.heartbeat_result
+
+    async def complete(self, job):
+        self.calls.append("complete")
+
+    async def fail(self, job):
+        self.calls.append("fail")
+
+    async def retry(self, job, delay):
+        self.calls.append(("retry", delay))
+
+
+def _run_job(session_maker, pool, job, status="pending"):
+    async def run_test():
+        async with session_maker() as session:
+            session.add(AsyncPresentationGenerationTaskModel(id=job.id, status=status))
+            await session.commit()
+        await asyncio.wait_for(pool._process_job(job, "worker-1"), 5)
+        async with session_maker() as session:
+            return await session.get(AsyncPresentationGenerationTaskModel, job.id)
+
+    return asyncio.run(run_test())
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setenv("CAN_CHANGE_KEYS", "false")
+    pool = PresentationJobWorkerPool(n_workers=0)
+    pool.lease_seconds = 0.3
+    return pool
+
+
+def test_generation_stops_when_the_lease_is_lost(session_maker, pool, monkeypatch):
+    queue = FakeQueue(heartbeat_result=False)
+    monkeypatch.setattr(job_worker, "PRESENTATION_JOB_QUEUE", queue)
+    generation = {"cancelled": False}
+
+    async def generate(*args):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            generation["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(pool, "_generate", generate)
+
+    _run_job(session_maker, pool, _new_job(attempts=1))
+
+    assert generation["cancelled"]
+    # The job is left to the worker which leased it since
+    assert queue.calls == []
+
+
+def test_a_failed_generation_is_retried_with_backoff(session_maker, pool, monkeypatch):
+    queue = FakeQueue()
+    monkeypatch.setattr(job_worker, "PRESENTATION_JOB_QUEUE", queue)
+
+    async def generate(job, async_status, sql_session, is_last_attempt):
+        assert not is_last_attempt
+        async_status.status = "error"
+
+    monkeypatch.setattr(pool, "_generate", generate)
+
+    status = _run_job(session_maker, pool, _new_job(attempts=2))
+
+    assert queue.calls == [("retry", 20)]
+    assert status.status == "pending"
+
+
+def test_the_last_failed_attempt_fails_the_job(session_maker, pool, monkeypatch):
+    queue = FakeQueue()
+    monkeypatch.setattr(job_worker, "PRESENTATION_JOB_QUEUE", queue)
+
+    async def generate(job, async_status, sql_session, is_last_attempt):
+        assert is_last_attempt
+        async_status.status = "error"
+
+    monkeypatch.setattr(pool, "_generate", generate)
+
+    _run_job(session_maker, pool, _new_job(attempts=3))
+
+    assert queue.calls == ["fail"]
@@ -0,0 +1,140 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import uuid
+
+import pytest
+
+from api.v1.ppt.endpoints import presentation
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationAndPath
+from models.presentation_structure_model import PresentationStructureModel
+from utils.get_layout_by_name import get_layout_by_name
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    def add_all(self, instances):
+        self.added.extend(instances)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def generation(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    state = SimpleNamespace(
+        content_started=asyncio.Event(),
+        started_before_outlines_ended=None,
+        structure_calls=[],
+        contents=[],
+    )
+
+    async def generate_ppt_outline(content, n_slides, *args):
+        yield '{"slides": ['
+        for i in range(n_slides):
+            yield json.dumps({"content": f"Outline {i}"}) + ","
+            await asyncio.sleep(0)
+        try:
+            await asyncio.wait_for(state.content_started.wait(), 1)
+            state.started_before_outlines_ended = True
+        except asyncio.TimeoutError:
+            state.started_before_outlines_ended = False
+        yield "]}"
+
+    async def generate_presentation_structure(outlines, *args):
+        state.structure_calls.append(len(outlines.slides))
+        return PresentationStructureModel(slides=[1] * len(outlines.slides))
+
+    async def get_slide_content(slide_layout, slide_outline, *args):
+        state.content_started.set()
+        state.contents.append(slide_outline.content)
+        return {"title": slide_outline.content}
+
+    async def process_slide_and_fetch_assets(*args):
+        return []
+
+    async def export_presentation(presentation_id, title, export_as):
+        return PresentationAndPath(
+            presentation_id=presentation_id, path=str(tmp_path / "deck.pptx")
+        )
+
+    monkeypatch.setattr(presentation, "get_layout_by_name", get_layout_by_name)
+    monkeypatch.setattr(presentation, "generate_ppt_outline", generate_ppt_outline)
+    monkeypatch.setattr(
+        presentation, "generate_presentation_structure", generate_presentation_structure
+    )
+    monkeypatch.setattr(
+        presentation, "get_slide_content_from_type_and_outline", get_slide_content
+    )
+    monkeypatch.setattr(
+        presentation, "process_slide_and_fetch_assets", process_slide_and_fetch_assets
+    )
+    monkeypatch.setattr(presentation, "export_presentation", export_presentation)
+    monkeypatch.setattr(
+        presentation,
+        "CONCURRENT_SERVICE",
+        SimpleNamespace(run_task=lambda *args: None),
+    )
+    return state
+
+
+def generate(request: GeneratePresentationRequest) -> FakeSession:
+    session = FakeSession()
+    asyncio.run(
+        presentation.generate_presentation_handler(
+            request, uuid.uuid4(), None, session
+        )
+    )
+    return session
+
+
+def get_slides(session: FakeSession):
+    return sorted(
+        (
+            instance
+            for instance in session.added
+            if isinstance(instance, presentation.SlideModel)
+        ),
+        key=lambda slide: slide.index,
+    )
+
+
+def test_slides_of_unordered_layouts_start_before_outlines_end(generation):
+    session = generate(
+        GeneratePresentationRequest(content="Solar energy", n_slides=7)
+    )
+
+    assert generation.started_before_outlines_ended
+    # Layouts are selected for every three streamed outlines
+    assert generation.structure_calls == [3, 3, 1]
+    slides = get_slides(session)
+    assert [slide.content["title"] for slide in slides] == [
+        f"Outline {i}" for i in range(7)
+    ]
+    assert len(generation.contents) == 7
+
+
+def test_pipelined_slides_leave_room_for_the_table_of_contents(generation):
+    session = generate(
+        GeneratePresentationRequest(
+            content="Solar energy",
+            n_slides=5,
+            include_table_of_contents=True,
+            include_title_slide=True,
+        )
+    )
+
+    assert generation.started_before_outlines_ended
+    slides = get_slides(session)
+    titles = [slide.content["title"] for slide in slides]
+    assert titles[0] == "Outline 0"
+    assert titles[1].startswith("Table of Contents")
+    assert titles[2:] == ["Outline 1", "Outline 2", "Outline 3"]
+    assert len(generation.contents) == 5
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import uuid
+
+from api.v1.ppt.endpoints import presentation
+from constants.template_layouts import BUILTIN_TEMPLATE_LAYOUTS
+from models.sql.presentation import PresentationModel
+from utils.datetime_utils import get_current_utc_datetime
+
+
+class FakeSession:
+    def __init__(self, presentation_model: PresentationModel):
+        self.presentation_model = presentation_model
+
+    async def get(self, model, id):
+        return self.presentation_model
+
+    async def execute(self, statement):
+        pass
+
+    def add(self, instance):
+        pass
+
+    def add_all(self, instances):
+        pass
+
+    async def commit(self):
+        pass
+
+
+def test_slides_are_sent_once_as_they_are_ready(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+
+    async def get_slide_content(slide_layout, slide_outline, *args):
+        # The first slides take the longest
+        await asyncio.sleep(0.01 * (3 - int(slide_outline.content[-1])))
+        return {"title": slide_outline.content}
+
+    async def process_slide_and_fetch_assets(*args):
+        return []
+
+    monkeypatch.setattr(
+        presentation, "get_slide_content_from_type_and_outline", get_slide_content
+    )
+    monkeypatch.setattr(
+        presentation, "process_slide_and_fetch_assets", process_slide_and_fetch_assets
+    )
+    presentation_model = PresentationModel(
+        id=uuid.uuid4(),
+        content="Solar energy",
+        n_slides=3,
+        language="English",
+        outlines={"slides": [{"content": f"Outline {i}"} for i in range(3)]},
+        layout=BUILTIN_TEMPLATE_LAYOUTS["general"],
+        structure={"slides": [0, 1, 2]},
+        created_at=get_current_utc_datetime(),
+        updated_at=get_current_utc_datetime(),
+    )
+
+    async def run():
+        response = await presentation.stream_presentation(
+            presentation_model.id, FakeSession(presentation_model)
+        )
+        return [event async for event in response.body_iterator]
+
+    events = [
+        json.loads(event.split("data: ", 1)[1])
+        for event in asyncio.run(run())
+    ]
+
+    assert [event["type"] for event in events] == [
+        "slide_ready",
+        "slide_ready",
+        "slide_ready",
+        "complete",
+    ]
+    assert [event["index"] for event in events[:3]] == [2, 1, 0]
+    assert [event["slide"]["content"]["title"] for event in events[:3]] == [
+        "Outline 2",
+        "Outline 1",
+        "Outline 0",
+    ]
+    assert len(events[3]["presentation"]["slides"]) == 3
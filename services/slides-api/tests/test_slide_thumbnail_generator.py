@@ -0,0 +1,45 @@
+import asyncio
+import os
+
+from PIL import Image
+from pptx import Presentation
+
+from services.slide_thumbnail_generator import THUMBNAIL_SIZES, SlideThumbnailGenerator
+
+
+def _save_presentation(path, slide_count: int):
+    prs = Presentation()
+    for index in range(slide_count):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {index}"
+    prs.save(path)
+
+
+def test_generates_webp_thumbnails_in_every_size(tmp_path):
+    pptx_path = str(tmp_path / "template.pptx")
+    _save_presentation(pptx_path, 2)
+    generator = SlideThumbnailGenerator(str(tmp_path / "thumbnails"))
+
+    asyncio.run(generator.generate_thumbnails(pptx_path, "template"))
+
+    assert generator.get_thumbnail_count("template") == 2
+    for size, width in THUMBNAIL_SIZES.items():
+        with Image.open(generator.get_thumbnail_path("template", 1, size)) as image:
+            assert image.format == "WEBP"
+            assert image.width == width
+    assert os.listdir(tmp_path / "thumbnails") == ["template"]
+
+
+def test_runs_a_single_background_generation_per_template(tmp_path):
+    pptx_path = str(tmp_path / "template.pptx")
+    _save_presentation(pptx_path, 1)
+    generator = SlideThumbnailGenerator(str(tmp_path / "thumbnails"))
+
+    async def run_test():
+        task = generator.schedule(pptx_path, "template")
+        assert generator.schedule(pptx_path, "template") is task
+        await generator.ensure_thumbnails(pptx_path, "template")
+        assert not generator.is_generating("template")
+
+    asyncio.run(run_test())
+    assert generator.get_thumbnail_path("template", 0, "list")
@@ -0,0 +1,24 @@
+import asyncio
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.ppt.endpoints.stats import STATS_ROUTER
+from services.process_runner import PROCESS_RUNNER
+
+
+def test_stats_report_the_timings_of_every_tool():
+    asyncio.run(PROCESS_RUNNER.run([sys.executable, "-c", "pass"], timeout=30))
+    app = FastAPI()
+    app.include_router(STATS_ROUTER)
+
+    response = TestClient(app).get("/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    tool_stats = data["processes"][PROCESS_RUNNER._get_tool([sys.executable])]
+    assert tool_stats["runs"] >= 1
+    assert tool_stats["total_time"] > 0
+    assert "workers" in data["exports"]
+    assert "enabled" in data["llm_response_cache"]
@@ -0,0 +1,44 @@
+import os
+import re
+
+import dirtyjson
+import pytest
+
+from constants.template_layouts import BUILTIN_TEMPLATE_LAYOUTS
+from utils.pptx_model_utils import TEMPLATE_COLOR_SCHEMES
+
+NEXTJS_API_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "src", "app", "api"
+)
+
+
+def load_ts_object_literal(route: str, name: str):
+    path = os.path.join(NEXTJS_API_DIRECTORY, route, "route.ts")
+    if not os.path.exists(path):
+        pytest.skip(f"Next.js sources not available at {path}")
+    with open(path, "r") as f:
+        source = f.read()
+    start = source.index("= {", source.index(f"const {name}")) + 2
+    end = source.index("\n};", start) + 2
+    return dirtyjson.loads(source[start:end])
+
+
+def to_snake_case(key: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()
+
+
+def test_builtin_template_layouts_match_the_template_route():
+    ts_layouts = load_ts_object_literal("template", "TEMPLATE_LAYOUTS")
+
+    assert ts_layouts == BUILTIN_TEMPLATE_LAYOUTS
+
+
+def test_template_color_schemes_match_the_pptx_model_route():
+    ts_schemes = load_ts_object_literal(
+        "presentation_to_pptx_model", "TEMPLATE_SCHEMES"
+    )
+
+    assert {
+        group: {to_snake_case(key): value for key, value in scheme.items()}
+        for group, scheme in ts_schemes.items()
+    } == TEMPLATE_COLOR_SCHEMES
@@ -1,57 +1,36 @@
 import asyncio
 import os
-import mimetypes
-from typing import List, Optional
-from urllib.parse import urlparse
-
-import aiohttp
+import shutil
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
 
 import uuid
 
+from services.image_cache import IMAGE_CACHE
+from utils.get_env import get_app_data_directory_env, get_nextjs_url_env
+
+
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8
+LOCAL_HOSTNAMES = ("localhost", "127.0.0.1")
+
 
 async def download_file(
     url: str, save_directory: str, headers: Optional[dict] = None
 ) -> Optional[str]:
     try:
-        os.makedirs(save_directory, exist_ok=True)
-
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
+        # Served from the disk cache when it was downloaded before
+        cached_path = await IMAGE_CACHE.get(url, headers)
+        if not cached_path:
+            return None
 
+        os.makedirs(save_directory, exist_ok=True)
+        filename = os.path.basename(urlparse(url).path)
         if not filename or "." not in filename:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.head(url, headers=headers) as response:
-                    if response.status == 200:
-                        content_disposition = response.headers.get(
-                            "Content-Disposition", ""
-                        )
-                        if "filename=" in content_disposition:
-                            filename = content_disposition.split("filename=")[1].strip(
-                                "\"'"
-                            )
-                        else:
-                            content_type = response.headers.get("Content-Type", "")
-                            if content_type:
-                                extension = mimetypes.guess_extension(
-                                    content_type.split(";")[0]
-                                )
-                                if extension:
-                                    filename = f"{uuid.uuid4()}{extension}"
-
-        filename = filename or str(uuid.uuid4())
+            filename = f"{uuid.uuid4()}{os.path.splitext(cached_path)[1]}"
         save_path = os.path.join(save_directory, filename)
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            file.write(chunk)
-                    print(f"File downloaded successfully: {save_path}")
-                    return save_path
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return None
+        await asyncio.to_thread(shutil.copyfile, cached_path, save_path)
+        return save_path
 
     except Exception as e:
         print(f"Error downloading file from {url}: {e}")
@@ -78,3 +57,79 @@ async def download_files(
     )
 
     return final_results
+
+
+def is_own_hostname(hostname: Optional[str]) -> bool:
+    nextjs_hostname = urlparse(get_nextjs_url_env() or "").hostname
+    return hostname is not None and (
+        hostname in LOCAL_HOSTNAMES or hostname == nextjs_hostname
+    )
+
+
+def get_local_image_path(url: str) -> Optional[str]:
+    """
+    Resolves /app_data and /static URLs, relative or served by this app,
+    to the file on disk. Returns None for other URLs or missing files.
+    """
+    if url.startswith("http"):
+        parsed_url = urlparse(url)
+        if not is_own_hostname(parsed_url.hostname):
+            return None
+        path = parsed_url.path
+    else:
+        path = url
+    if "/app_data/" in path:
+        root = get_app_data_directory_env() or "/app_data"
+        relative_path = path.split("/app_data/", 1)[1]
+    elif path.startswith("/static/"):
+        root = "static"
+        relative_path = path[len("/static/") :]
+    else:
+        return None
+
+    root = os.path.abspath(root)
+    local_path = os.path.abspath(os.path.join(root, unquote(relative_path)))
+    if not local_path.startswith(root + os.sep) or not os.path.isfile(local_path):
+        return None
+    return local_path
+
+
+def read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+async def download_images(
+    urls: List[str], max_concurrency: int = MAX_CONCURRENT_IMAGE_DOWNLOADS
+) -> Dict[str, bytes]:
+    """
+    Fetches images into memory, once per distinct URL. Images of this app
+    are read from disk, the others are fetched concurrently through the
+    image cache. Returns the bytes by URL, failed downloads are left out.
+    """
+    urls = list(dict.fromkeys(url for url in urls if url))
+    images: Dict[str, bytes] = {}
+
+    remote_urls = []
+    for url in urls:
+        local_path = get_local_image_path(url)
+        if local_path:
+            images[url] = await asyncio.to_thread(read_file_bytes, local_path)
+        elif url.startswith("http"):
+            remote_urls.append(url)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def download(url: str) -> Optional[bytes]:
+        async with semaphore:
+            cached_path = await IMAGE_CACHE.get(url)
+        try:
+            return await asyncio.to_thread(read_file_bytes, cached_path)
+        except (OSError, TypeError):
+            # Failed download, or evicted in between
+            return None
+
+    downloaded = await asyncio.gather(*[download(url) for url in remote_urls])
+    images.update({url: image for url, image in zip(remote_urls, downloaded) if image})
+
+    return images
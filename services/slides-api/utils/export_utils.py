@@ -7,7 +7,6 @@ from fastapi import HTTPException
 from pathvalidate import sanitize_filename
 from sqlmodel import Session, select
 
-from models.pptx_models import PptxPresentationModel
 from models.presentation_and_path import PresentationAndPath
 from models.sql.template import PptxTemplateModel, TemplateModel
 from models.sql.presentation import PresentationModel
@@ -15,6 +14,8 @@ from services.pptx_presentation_creator import PptxPresentationCreator
 from services.pptx_template_service import PPTX_TEMPLATE_SERVICE
 from services.temp_file_service import TEMP_FILE_SERVICE
 from utils.asset_directory_utils import get_exports_directory
+from utils.pptx_model_utils import presentation_to_pptx_model
+from utils.presentation_utils import get_presentation_with_slides
 from services.database import engine
 
 # Get the Next.js app URL from environment variable or default to localhost:4000
@@ -35,17 +36,7 @@ async def export_presentation(
     Otherwise, uses the default PPTX generation with template-specific styling.
     """
     if export_as == "pptx":
-        # Check if we should use template-based export (custom uploaded templates)
-        if template_id:
-            return await export_with_template(presentation_id, title, template_id)
-
-        # Try to find a matching custom template automatically
-        auto_template = await find_matching_template(presentation_id)
-        if auto_template:
-            return await export_with_template(presentation_id, title, str(auto_template.id))
-
-        # Use default PPTX generation (now with template-specific colors)
-        return await export_basic_pptx(presentation_id, title)
+        return await export_pptx(presentation_id, title, template_id)
 
     else:
         # PDF export
@@ -65,10 +56,45 @@ async def export_presentation(
         )
 
 
+async def export_pptx(
+    presentation_id: uuid.UUID,
+    title: str,
+    template_id: Optional[str] = None,
+    output_path: Optional[str] = None,
+) -> PresentationAndPath:
+    """
+    Export a presentation to PPTX, into output_path if given or else into
+    the exports directory.
+    """
+    # Check if we should use template-based export (custom uploaded templates)
+    if template_id:
+        return await export_with_template(
+            presentation_id, title, template_id, output_path
+        )
+
+    # Try to find a matching custom template automatically
+    auto_template = await find_matching_template(presentation_id)
+    if auto_template:
+        return await export_with_template(
+            presentation_id, title, str(auto_template.id), output_path
+        )
+
+    # Use default PPTX generation (now with template-specific colors)
+    return await export_basic_pptx(presentation_id, title, output_path)
+
+
+def get_pptx_export_path(title: str) -> str:
+    return os.path.join(
+        get_exports_directory(),
+        f"{sanitize_filename(title or str(uuid.uuid4()))}.pptx",
+    )
+
+
 async def export_with_template(
     presentation_id: uuid.UUID,
     title: str,
-    template_id: str
+    template_id: str,
+    output_path: Optional[str] = None,
 ) -> PresentationAndPath:
     """
     Export using a custom uploaded PPTX template.
@@ -94,7 +120,8 @@ async def export_with_template(
         template_path=template_path,
         slides_content=slides_content,
         output_filename=output_filename,
-        options={}
+        options={},
+        output_path=output_path,
     )
 
     return PresentationAndPath(
@@ -105,41 +132,24 @@ async def export_with_template(
 
 async def export_basic_pptx(
     presentation_id: uuid.UUID,
-    title: str
+    title: str,
+    output_path: Optional[str] = None,
 ) -> PresentationAndPath:
     """
     PPTX export using the built-in templates (General, Modern, Standard, Swift).
 
-    The template-specific colors are now applied in the Next.js API
-    (presentation_to_pptx_model) based on the layout_group of each slide.
+    The template-specific colors are applied based on the layout_group of
+    each slide while converting the presentation to a PPTX model.
     """
-    # Get the converted PPTX model from the Next.js service
-    # This now includes template-specific colors based on layout_group
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{NEXTJS_URL}/api/presentation_to_pptx_model?id={presentation_id}"
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                print(f"Failed to get PPTX model: {error_text}")
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to convert presentation to PPTX model",
-                )
-            pptx_model_data = await response.json()
+    presentation = await get_presentation_with_slides(presentation_id)
 
     # Create PPTX file using the converted model
-    pptx_model = PptxPresentationModel(**pptx_model_data)
+    pptx_model = presentation_to_pptx_model(presentation)
     temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
     pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
-    await pptx_creator.create_ppt()
 
-    export_directory = get_exports_directory()
-    pptx_path = os.path.join(
-        export_directory,
-        f"{sanitize_filename(title or str(uuid.uuid4()))}.pptx",
-    )
-    pptx_creator.save(pptx_path)
+    pptx_path = output_path or get_pptx_export_path(title)
+    await pptx_creator.create_and_save(pptx_path)
 
     return PresentationAndPath(
         presentation_id=presentation_id,
@@ -151,25 +161,18 @@ async def get_presentation_content(presentation_id: uuid.UUID) -> list:
     """
     Get presentation content formatted for template replacement.
     """
-    async with aiohttp.ClientSession() as session:
-        # Get presentation data from FastAPI backend
-        async with session.get(
-            f"http://localhost:8000/api/v1/ppt/presentation/{presentation_id}"
-        ) as response:
-            if response.status != 200:
-                raise HTTPException(status_code=500, detail="Failed to get presentation")
-            presentation = await response.json()
+    presentation = await get_presentation_with_slides(presentation_id)
 
     slides_content = []
-    for slide in presentation.get("slides", []):
-        content = slide.get("content", {})
+    for slide in presentation.slides:
+        content = slide.content or {}
 
         # Extract content fields
         slide_data = {
             "title": content.get("title", ""),
             "subtitle": content.get("subtitle", ""),
             "body": content.get("description", content.get("body", "")),
-            "speaker_notes": slide.get("speaker_note", content.get("__speaker_note__", ""))
+            "speaker_notes": slide.speaker_note or content.get("__speaker_note__", "")
         }
 
         # Handle bullets
@@ -42,3 +42,33 @@ def set_file_ext(file_path: str, ext: str) -> str:
     if get_file_ext_or_none(file_path):
         return f"{os.path.splitext(file_path)[0]}{ext}"
     return f"{file_path}{ext}"
+
+
+def get_directory_size(directory: str) -> int:
+    return sum(
+        each.stat().st_size for each in os.scandir(directory) if each.is_file()
+    )
+
+
+def prune_directory_lru(directory: str, max_size: int, size: int) -> int:
+    """
+    Removes the least recently modified files of a cache directory of the
+    given total size until it is back under 90% of max_size.
+    Returns the new size.
+    """
+    if size <= max_size:
+        return size
+    files = sorted(
+        (each for each in os.scandir(directory) if each.is_file()),
+        key=lambda each: each.stat().st_mtime,
+    )
+    for each in files:
+        if size <= max_size * 0.9:
+            break
+        try:
+            file_size = each.stat().st_size
+            os.remove(each.path)
+            size -= file_size
+        except OSError:
+            pass
+    return size
@@ -117,3 +117,126 @@ def get_dall_e_3_quality_env():
 # Gpt Image 1.5 Quality
 def get_gpt_image_1_5_quality_env():
     return os.getenv("GPT_IMAGE_1_5_QUALITY")
+
+
+# LLM Rate Limiting
+def get_llm_max_concurrency_env():
+    return os.getenv("LLM_MAX_CONCURRENCY")
+
+
+def get_llm_tokens_per_minute_env():
+    return os.getenv("LLM_TOKENS_PER_MINUTE")
+
+
+def get_llm_max_retries_env():
+    return os.getenv("LLM_MAX_RETRIES")
+
+
+# LLM Response Cache
+def get_llm_response_cache_env():
+    return os.getenv("LLM_RESPONSE_CACHE")
+
+
+def get_llm_response_cache_ttl_env():
+    return os.getenv("LLM_RESPONSE_CACHE_TTL")
+
+
+def get_llm_response_cache_max_entries_env():
+    return os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES")
+
+
+def get_llm_response_cache_max_disk_entries_env():
+    return os.getenv("LLM_RESPONSE_CACHE_MAX_DISK_ENTRIES")
+
+
+# Presentation Generation Jobs
+def get_presentation_job_queue_env():
+    return os.getenv("PRESENTATION_JOB_QUEUE")
+
+
+def get_redis_url_env():
+    return os.getenv("REDIS_URL")
+
+
+def get_presentation_job_workers_env():
+    return os.getenv("PRESENTATION_JOB_WORKERS")
+
+
+def get_presentation_job_lease_seconds_env():
+    return os.getenv("PRESENTATION_JOB_LEASE_SECONDS")
+
+
+def get_presentation_job_max_attempts_env():
+    return os.getenv("PRESENTATION_JOB_MAX_ATTEMPTS")
+
+
+# Icons
+def get_icon_index_backend_env():
+    return os.getenv("ICON_INDEX_BACKEND")
+
+
+# Export Executor
+def get_export_workers_env():
+    return os.getenv("EXPORT_WORKERS")
+
+
+def get_export_queue_size_env():
+    return os.getenv("EXPORT_QUEUE_SIZE")
+
+
+def get_export_timeout_env():
+    return os.getenv("EXPORT_TIMEOUT")
+
+
+def get_pptx_template_cache_size_mb_env():
+    return os.getenv("PPTX_TEMPLATE_CACHE_SIZE_MB")
+
+
+# Remote Image Cache
+def get_image_cache_size_mb_env():
+    return os.getenv("IMAGE_CACHE_SIZE_MB")
+
+
+def get_image_cache_max_age_env():
+    return os.getenv("IMAGE_CACHE_MAX_AGE")
+
+
+# Image Transform Cache
+def get_image_transform_cache_size_mb_env():
+    return os.getenv("IMAGE_TRANSFORM_CACHE_SIZE_MB")
+
+
+def get_pptx_photo_format_env():
+    return os.getenv("PPTX_PHOTO_FORMAT")
+
+
+def get_pptx_jpeg_quality_env():
+    return os.getenv("PPTX_JPEG_QUALITY")
+
+
+def get_pptx_slide_cache_size_mb_env():
+    return os.getenv("PPTX_SLIDE_CACHE_SIZE_MB")
+
+
+def get_libreoffice_workers_env():
+    return os.getenv("LIBREOFFICE_WORKERS")
+
+
+def get_libreoffice_max_conversions_env():
+    return os.getenv("LIBREOFFICE_MAX_CONVERSIONS")
+
+
+def get_libreoffice_timeout_env():
+    return os.getenv("LIBREOFFICE_TIMEOUT")
+
+
+def get_process_concurrency_env():
+    return os.getenv("PROCESS_CONCURRENCY")
+
+
+def get_rasterizer_workers_env():
+    return os.getenv("RASTERIZER_WORKERS")
+
+
+def get_nextjs_url_env():
+    return os.getenv("NEXTJS_URL")
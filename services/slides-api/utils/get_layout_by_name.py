@@ -1,6 +1,7 @@
 import os
 import aiohttp
 from fastapi import HTTPException
+from constants.template_layouts import BUILTIN_TEMPLATE_LAYOUTS
 from models.presentation_layout import PresentationLayoutModel
 from typing import List
 
@@ -8,6 +9,11 @@ from typing import List
 NEXTJS_URL = os.getenv("NEXTJS_URL", "http://localhost:4000")
 
 async def get_layout_by_name(layout_name: str) -> PresentationLayoutModel:
+    # Built-in layouts are resolved in process, the others come from Next.js
+    builtin_layout = BUILTIN_TEMPLATE_LAYOUTS.get((layout_name or "general").lower())
+    if builtin_layout:
+        return PresentationLayoutModel(**builtin_layout)
+
     url = f"{NEXTJS_URL}/api/template?group={layout_name}"
     async with aiohttp.ClientSession() as session:
         async with session.get(url) as response:
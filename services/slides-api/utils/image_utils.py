@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
@@ -46,6 +47,28 @@ def clip_image(
     return clipped_image
 
 
+def downscale_to_cover(image: Image.Image, width: int, height: int) -> Image.Image:
+    """
+    Downscales the image to the smallest size still covering a width x height
+    box. Fitting or clipping the result to the box gives the same image as
+    the original, at a fraction of the cost for large images.
+    """
+    img_width, img_height = image.size
+    scale = max(width / img_width, height / img_height)
+    if scale >= 1:
+        return image
+    new_size = (max(1, round(img_width * scale)), max(1, round(img_height * scale)))
+    return image.resize(new_size, Image.LANCZOS)
+
+
+def _corner_mask(radius: int) -> np.ndarray:
+    # Pixels of a radius x radius top-left corner inside its quarter circle
+    centers = np.arange(radius, dtype=np.float32) + 0.5
+    dx = radius - centers[np.newaxis, :]
+    dy = radius - centers[:, np.newaxis]
+    return dx * dx + dy * dy <= radius * radius
+
+
 def round_image_corners(image: Image.Image, radii: List[int]) -> Image.Image:
     if len(radii) != 4:
         raise ValueError(
@@ -58,84 +81,36 @@ def round_image_corners(image: Image.Image, radii: List[int]) -> Image.Image:
     max_radius = min(w // 2, h // 2)
     clamped_radii = [min(radius, max_radius) for radius in radii]
 
-    # Ensure the image has an alpha channel (RGBA)
-    if image.mode != "RGBA":
-        image = image.convert("RGBA")
-
-    # Create a mask for the rounded corners (start with fully transparent)
-    rounded_mask = Image.new("L", image.size, 0)
+    pixels = np.array(image.convert("RGBA"))
+    alpha = pixels[..., 3]
 
-    # Create a rectangular mask (fully opaque)
-    rectangular_mask = Image.new("L", image.size, 255)
-
-    # Process each corner
+    # Clear the alpha outside the quarter circle of each corner, through views
+    # of the corner regions: top-left, top-right, bottom-right, bottom-left
     for i, radius in enumerate(clamped_radii):
-        if radius > 0:  # Only process if radius is positive
-            # Create a circle for this radius
-            circle = Image.new("L", (radius * 2, radius * 2), 0)
-            draw = ImageDraw.Draw(circle)
-            draw.ellipse((0, 0, radius * 2 - 1, radius * 2 - 1), fill=255)
-
-            # Calculate position based on corner index
-            if i == 0:  # top-left
-                rounded_mask.paste(circle.crop((0, 0, radius, radius)), (0, 0))
-                rectangular_mask.paste(0, (0, 0, radius, radius))
-            elif i == 1:  # top-right
-                rounded_mask.paste(
-                    circle.crop((radius, 0, radius * 2, radius)), (w - radius, 0)
-                )
-                rectangular_mask.paste(0, (w - radius, 0, w, radius))
-            elif i == 2:  # bottom-right
-                rounded_mask.paste(
-                    circle.crop((radius, radius, radius * 2, radius * 2)),
-                    (w - radius, h - radius),
-                )
-                rectangular_mask.paste(0, (w - radius, h - radius, w, h))
-            else:  # bottom-left
-                rounded_mask.paste(
-                    circle.crop((0, radius, radius, radius * 2)), (0, h - radius)
-                )
-                rectangular_mask.paste(0, (0, h - radius, radius, h))
-
-    # Get the original alpha channel
-    original_alpha = image.getchannel("A")
-
-    # Combine the rectangular mask with the rounded corners
-    corner_mask = Image.composite(rounded_mask, rectangular_mask, rounded_mask)
-
-    # Combine the corner mask with the original alpha channel
-    final_alpha = Image.composite(
-        original_alpha, Image.new("L", image.size, 0), corner_mask
-    )
-
-    # Create a new image with the modified alpha channel
-    result = Image.new("RGBA", image.size)
-    result.paste(image.convert("RGB"), (0, 0))
-    result.putalpha(final_alpha)
+        if radius <= 0:
+            continue
+        outside = ~_corner_mask(radius)
+        if i == 0:
+            alpha[:radius, :radius][outside] = 0
+        elif i == 1:
+            alpha[:radius, w - radius :][outside[:, ::-1]] = 0
+        elif i == 2:
+            alpha[h - radius :, w - radius :][outside[::-1, ::-1]] = 0
+        else:
+            alpha[h - radius :, :radius][outside[::-1, :]] = 0
 
-    return result
+    return Image.fromarray(pixels, "RGBA")
 
 
 def invert_image(img: Image.Image) -> Image.Image:
-    # Get image data
-    data = img.getdata()
-
-    # Process each pixel
-    new_data = []
-    for item in data:
-        # Get current pixel values
-        r, g, b, a = item
-
-        # Invert RGB values while preserving transparency
-        if a != 0:  # Skip fully transparent pixels
-            new_data.append((255 - r, 255 - g, 255 - b, a))
-        else:
-            new_data.append((0, 0, 0, 0))
+    pixels = np.array(img.convert("RGBA"))
+
+    # Invert RGB values while preserving transparency
+    pixels[..., :3] = 255 - pixels[..., :3]
+    # Fully transparent pixels become transparent black
+    pixels[pixels[..., 3] == 0] = 0
 
-    # Create new image with modified data
-    new_img = Image.new("RGBA", img.size)
-    new_img.putdata(new_data)
-    return new_img
+    return Image.fromarray(pixels, "RGBA")
 
 
 def create_circle_image(
@@ -176,21 +151,11 @@ def set_image_opacity(image: Image.Image, opacity: float) -> Image.Image:
     # Clamp opacity to valid range
     opacity = max(0.0, min(1.0, opacity))
 
-    # Convert to RGBA if not already
-    if image.mode != "RGBA":
-        image = image.convert("RGBA")
-
-    # Get the original alpha channel
-    original_alpha = image.getchannel("A")
-
-    # Create new alpha channel with adjusted opacity
-    new_alpha = original_alpha.point(lambda x: int(x * opacity))
-
-    # Create new image with modified alpha channel
-    result = Image.new("RGBA", image.size)
-    result.paste(image.convert("RGB"), (0, 0))
-    result.putalpha(new_alpha)
+    # Lookup table of the 256 alpha values, applied to the alpha band only
+    opacity_table = (np.arange(256) * opacity).astype(np.uint8)
 
+    result = image.convert("RGBA")
+    result.putalpha(result.getchannel("A").point(opacity_table.tolist()))
     return result
 
 
@@ -0,0 +1,65 @@
+from typing import List
+
+import dirtyjson
+
+from models.presentation_outline_model import SlideOutlineModel
+
+
+class SlideOutlineStreamParser:
+    """
+    Incrementally parses streamed presentation outlines JSON.
+
+    Chunks of `{"slides": [{...}, {...}]}` are fed as they arrive and every
+    slide outline is returned as soon as its closing brace is received, so
+    slides can be processed while the rest of the outline is still streaming.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._slide_start = None
+
+    def feed(self, chunk: str) -> List[SlideOutlineModel]:
+        self.text += chunk
+        completed: List[SlideOutlineModel] = []
+
+        while self._position < len(self.text):
+            char = self.text[self._position]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+
+            elif char == '"':
+                self._in_string = True
+
+            elif char in "{[":
+                # Slide outlines are objects inside the root object's array
+                if char == "{" and self._stack == ["{", "["]:
+                    self._slide_start = self._position
+                self._stack.append(char)
+
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if (
+                    char == "}"
+                    and self._stack == ["{", "["]
+                    and self._slide_start is not None
+                ):
+                    slide_text = self.text[self._slide_start : self._position + 1]
+                    self._slide_start = None
+                    completed.append(
+                        SlideOutlineModel(**dict(dirtyjson.loads(slide_text)))
+                    )
+
+            self._position += 1
+
+        return completed
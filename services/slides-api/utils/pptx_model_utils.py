@@ -0,0 +1,317 @@
+from typing import List, Optional
+
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.enum.text import PP_ALIGN
+
+from models.pptx_models import (
+    PptxAutoShapeBoxModel,
+    PptxFillModel,
+    PptxFontModel,
+    PptxObjectFitEnum,
+    PptxObjectFitModel,
+    PptxParagraphModel,
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+    PptxTextBoxModel,
+)
+from models.presentation_with_slides import PresentationWithSlides
+
+
+SLIDE_WIDTH = 1280
+SLIDE_HEIGHT = 720
+
+# Colors and fonts of the built-in templates, matching the React templates and
+# src/app/api/presentation_to_pptx_model/route.ts (see tests/test_template_parity.py)
+TEMPLATE_COLOR_SCHEMES = {
+    "general": {
+        "primary": "9333EA",
+        "title_color": "111827",
+        "body_color": "4B5563",
+        "muted_color": "6B7280",
+        "background_color": "FFFFFF",
+        "font_family": "Inter",
+    },
+    "modern": {
+        "primary": "1E4CD9",
+        "title_color": "1E4CD9",
+        "body_color": "374151",
+        "muted_color": "6B7280",
+        "background_color": "FFFFFF",
+        "font_family": "Montserrat",
+    },
+    "standard": {
+        "primary": "1B8C2D",
+        "title_color": "111827",
+        "body_color": "4B5563",
+        "muted_color": "6B7280",
+        "background_color": "FFFFFF",
+        "font_family": "Playfair Display",
+    },
+    "swift": {
+        "primary": "0EA5E9",
+        "title_color": "111827",
+        "body_color": "4B5563",
+        "muted_color": "6B7280",
+        "background_color": "FFFFFF",
+        "font_family": "Inter",
+    },
+}
+
+
+def get_template_color_scheme(layout_group: Optional[str]) -> dict:
+    return TEMPLATE_COLOR_SCHEMES.get(
+        (layout_group or "general").lower(), TEMPLATE_COLOR_SCHEMES["general"]
+    )
+
+
+def _rectangle(
+    left: int,
+    top: int,
+    width: int,
+    height: int,
+    color: str,
+    type: MSO_AUTO_SHAPE_TYPE = MSO_AUTO_SHAPE_TYPE.RECTANGLE,
+) -> PptxAutoShapeBoxModel:
+    return PptxAutoShapeBoxModel(
+        type=type,
+        position=PptxPositionModel(left=left, top=top, width=width, height=height),
+        text_wrap=False,
+        fill=PptxFillModel(color=color, opacity=1.0),
+    )
+
+
+def _text_box(
+    text: str,
+    left: int,
+    top: int,
+    width: int,
+    height: int,
+    font: PptxFontModel,
+    alignment: PP_ALIGN = PP_ALIGN.LEFT,
+    text_wrap: bool = True,
+) -> PptxTextBoxModel:
+    return PptxTextBoxModel(
+        position=PptxPositionModel(left=left, top=top, width=width, height=height),
+        text_wrap=text_wrap,
+        paragraphs=[PptxParagraphModel(text=text, alignment=alignment, font=font)],
+    )
+
+
+def slide_content_to_pptx_shapes(content: dict, layout_group: Optional[str]) -> List:
+    """
+    Lays out the common fields of a slide content (title, description, image,
+    bullets and presenter) with the colors of its built-in template.
+    """
+    colors = get_template_color_scheme(layout_group)
+
+    def font(**kwargs) -> PptxFontModel:
+        return PptxFontModel(
+            **{
+                "name": colors["font_family"],
+                "size": 24,
+                "font_weight": 400,
+                "italic": False,
+                "color": colors["body_color"],
+                **kwargs,
+            }
+        )
+
+    shapes = [
+        # Background and accent bar
+        _rectangle(0, 0, SLIDE_WIDTH, SLIDE_HEIGHT, colors["background_color"]),
+        _rectangle(0, 0, SLIDE_WIDTH, 8, colors["primary"]),
+    ]
+
+    title = content.get("title")
+    description = content.get("description")
+    presenter_name = content.get("presenterName")
+    presentation_date = content.get("presentationDate")
+    image = content.get("image")
+    bullets = content.get("bullets")
+
+    current_y = 60
+
+    if title:
+        shapes.append(
+            _text_box(
+                title,
+                80,
+                current_y,
+                SLIDE_WIDTH - 160,
+                80,
+                font(size=48, font_weight=700, color=colors["title_color"]),
+            )
+        )
+        current_y += 90
+        shapes.append(_rectangle(80, current_y, 100, 4, colors["primary"]))
+        current_y += 20
+
+    if description:
+        shapes.append(
+            _text_box(
+                description,
+                80,
+                current_y,
+                SLIDE_WIDTH // 2 - 100,
+                120,
+                font(size=18),
+            )
+        )
+        current_y += 140
+
+    if isinstance(image, dict) and image.get("__image_url__"):
+        image_url = image["__image_url__"]
+        shapes.append(
+            PptxPictureBoxModel(
+                position=PptxPositionModel(
+                    left=SLIDE_WIDTH // 2 + 40,
+                    top=120,
+                    width=SLIDE_WIDTH // 2 - 120,
+                    height=400,
+                ),
+                clip=True,
+                object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.COVER),
+                picture=PptxPictureModel(
+                    is_network=image_url.startswith("http"), path=image_url
+                ),
+            )
+        )
+
+    if isinstance(bullets, list):
+        bullet_width = SLIDE_WIDTH // 2 - 100
+        for index, bullet in enumerate(bullets):
+            bullet_y = current_y + index * 70
+            shapes.append(
+                _rectangle(
+                    80,
+                    bullet_y + 2,
+                    28,
+                    28,
+                    colors["primary"],
+                    type=MSO_AUTO_SHAPE_TYPE.OVAL,
+                )
+            )
+            shapes.append(
+                _text_box(
+                    str(index + 1),
+                    80,
+                    bullet_y + 4,
+                    28,
+                    24,
+                    font(size=14, font_weight=700, color="FFFFFF"),
+                    alignment=PP_ALIGN.CENTER,
+                    text_wrap=False,
+                )
+            )
+            if not isinstance(bullet, dict):
+                continue
+            if bullet.get("title"):
+                shapes.append(
+                    _text_box(
+                        bullet["title"],
+                        120,
+                        bullet_y,
+                        bullet_width,
+                        30,
+                        font(size=20, font_weight=600, color=colors["title_color"]),
+                    )
+                )
+            if bullet.get("description"):
+                shapes.append(
+                    _text_box(
+                        bullet["description"],
+                        120,
+                        bullet_y + 30,
+                        bullet_width - 20,
+                        35,
+                        font(size=14, color=colors["muted_color"]),
+                    )
+                )
+
+    if presenter_name or presentation_date:
+        shapes.append(
+            _rectangle(
+                80,
+                SLIDE_HEIGHT - 100,
+                300,
+                70,
+                "F3F4F6",
+                type=MSO_AUTO_SHAPE_TYPE.ROUNDED_RECTANGLE,
+            )
+        )
+        shapes.append(
+            _rectangle(
+                95,
+                SLIDE_HEIGHT - 85,
+                40,
+                40,
+                colors["primary"],
+                type=MSO_AUTO_SHAPE_TYPE.OVAL,
+            )
+        )
+        initials = (
+            "".join(name[0] for name in presenter_name.split(" ") if name).upper()[:2]
+            if presenter_name
+            else "PR"
+        )
+        shapes.append(
+            _text_box(
+                initials,
+                95,
+                SLIDE_HEIGHT - 82,
+                40,
+                34,
+                font(size=14, font_weight=700, color="FFFFFF"),
+                alignment=PP_ALIGN.CENTER,
+                text_wrap=False,
+            )
+        )
+        if presenter_name:
+            shapes.append(
+                _text_box(
+                    presenter_name,
+                    145,
+                    SLIDE_HEIGHT - 88,
+                    220,
+                    25,
+                    font(size=16, font_weight=600, color=colors["title_color"]),
+                )
+            )
+        if presentation_date:
+            shapes.append(
+                _text_box(
+                    presentation_date,
+                    145,
+                    SLIDE_HEIGHT - 65,
+                    220,
+                    25,
+                    font(size=13, color=colors["muted_color"]),
+                )
+            )
+
+    return shapes
+
+
+def presentation_to_pptx_model(
+    presentation: PresentationWithSlides,
+) -> PptxPresentationModel:
+    """
+    Converts a presentation to the PPTX model used by PptxPresentationCreator.
+    Same conversion as the /api/presentation_to_pptx_model route of Next.js.
+    """
+    return PptxPresentationModel(
+        name=presentation.title or "Presentation",
+        slides=[
+            PptxSlideModel(
+                shapes=slide_content_to_pptx_shapes(
+                    slide.content or {}, slide.layout_group
+                ),
+                note=slide.speaker_note,
+                background=PptxFillModel(color="FFFFFF", opacity=1.0),
+            )
+            for slide in presentation.slides
+        ],
+    )
@@ -0,0 +1,32 @@
+from typing import Optional
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from models.presentation_with_slides import PresentationWithSlides
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+from services.database import async_session_maker
+
+
+async def get_presentation_with_slides(
+    presentation_id: uuid.UUID, sql_session: Optional[AsyncSession] = None
+) -> PresentationWithSlides:
+    if sql_session is None:
+        async with async_session_maker() as sql_session:
+            return await get_presentation_with_slides(presentation_id, sql_session)
+
+    presentation = await sql_session.get(PresentationModel, presentation_id)
+    if not presentation:
+        raise HTTPException(404, "Presentation not found")
+    slides = await sql_session.scalars(
+        select(SlideModel)
+        .where(SlideModel.presentation == presentation_id)
+        .order_by(SlideModel.index)
+    )
+    return PresentationWithSlides(
+        **presentation.model_dump(),
+        slides=slides,
+    )
@@ -1,5 +1,7 @@
 import asyncio
-from typing import List, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+import uuid
+from constants.presentation import MAX_CONCURRENT_ASSET_FETCHES
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
 from models.sql.slide import SlideModel
@@ -9,33 +11,96 @@ from utils.asset_directory_utils import get_images_directory
 from utils.dict_utils import get_dict_at_path, get_dict_paths_with_key, set_dict_at_path
 
 
+class PresentationAssetPlanner:
+    """
+    Fetches the images and icons referenced by the slides of a presentation.
+
+    Identical image prompts and icon queries across slides are fetched once
+    and the result is fanned out to every slide referencing them. Fetches run
+    through a bounded pool shared by the whole presentation.
+    """
+
+    def __init__(
+        self,
+        image_generation_service: ImageGenerationService,
+        max_concurrency: int = MAX_CONCURRENT_ASSET_FETCHES,
+    ):
+        self.image_generation_service = image_generation_service
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._image_tasks: Dict[str, asyncio.Task] = {}
+        self._icon_tasks: Dict[str, asyncio.Task] = {}
+        self._claimed_asset_ids: Set[uuid.UUID] = set()
+
+    async def _run_bounded(self, fetch: Callable[[], Awaitable]):
+        async with self._semaphore:
+            return await fetch()
+
+    def _get_task(
+        self, tasks: Dict[str, asyncio.Task], key: str, fetch: Callable[[], Awaitable]
+    ) -> asyncio.Task:
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_bounded(fetch))
+            tasks[key] = task
+        return task
+
+    def fetch_image(self, prompt: str) -> asyncio.Task:
+        return self._get_task(
+            self._image_tasks,
+            prompt,
+            lambda: self.image_generation_service.generate_image(
+                ImagePrompt(prompt=prompt)
+            ),
+        )
+
+    def fetch_icon(self, query: str) -> asyncio.Task:
+        return self._get_task(
+            self._icon_tasks,
+            query,
+            lambda: ICON_FINDER_SERVICE.search_icons(query),
+        )
+
+    def claim_asset(self, asset: ImageAsset) -> bool:
+        # An image shared by several slides must only be saved once
+        if asset.id in self._claimed_asset_ids:
+            return False
+        self._claimed_asset_ids.add(asset.id)
+        return True
+
+    def cancel(self):
+        for task in [*self._image_tasks.values(), *self._icon_tasks.values()]:
+            task.cancel()
+
+
 async def process_slide_and_fetch_assets(
     image_generation_service: ImageGenerationService,
     slide: SlideModel,
+    asset_planner: Optional[PresentationAssetPlanner] = None,
 ) -> List[ImageAsset]:
 
-    async_tasks = []
+    if asset_planner is None:
+        asset_planner = PresentationAssetPlanner(image_generation_service)
 
     image_paths = get_dict_paths_with_key(slide.content, "__image_prompt__")
     icon_paths = get_dict_paths_with_key(slide.content, "__icon_query__")
 
-    for image_path in image_paths:
-        __image_prompt__parent = get_dict_at_path(slide.content, image_path)
-        async_tasks.append(
-            image_generation_service.generate_image(
-                ImagePrompt(
-                    prompt=__image_prompt__parent["__image_prompt__"],
-                )
-            )
+    image_tasks = [
+        asset_planner.fetch_image(
+            get_dict_at_path(slide.content, image_path)["__image_prompt__"]
         )
-
-    for icon_path in icon_paths:
-        __icon_query__parent = get_dict_at_path(slide.content, icon_path)
-        async_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(__icon_query__parent["__icon_query__"])
+        for image_path in image_paths
+    ]
+    icon_tasks = [
+        asset_planner.fetch_icon(
+            get_dict_at_path(slide.content, icon_path)["__icon_query__"]
         )
+        for icon_path in icon_paths
+    ]
 
-    results = await asyncio.gather(*async_tasks)
+    # Shielded as other slides may be waiting for the same fetches
+    results = await asyncio.gather(
+        *[asyncio.shield(task) for task in [*image_tasks, *icon_tasks]]
+    )
     results.reverse()
 
     return_assets = []
@@ -43,7 +108,8 @@ async def process_slide_and_fetch_assets(
         image_dict = get_dict_at_path(slide.content, image_path)
         result = results.pop()
         if isinstance(result, ImageAsset):
-            return_assets.append(result)
+            if asset_planner.claim_asset(result):
+                return_assets.append(result)
             image_dict["__image_url__"] = result.path
         else:
             image_dict["__image_url__"] = result
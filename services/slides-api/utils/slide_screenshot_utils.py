@@ -0,0 +1,31 @@
+import os
+import shutil
+import uuid
+
+from utils.asset_directory_utils import get_images_directory
+
+
+PLACEHOLDER_SCREENSHOT_URL = "/static/images/placeholder.jpg"
+
+
+def save_slide_screenshot(
+    screenshot_path: str, presentation_id: uuid.UUID, slide_number: int
+) -> str:
+    """
+    Copies a rendered slide screenshot to the images directory and returns
+    its URL, or the placeholder URL if the screenshot is missing or empty.
+    """
+    if not os.path.exists(screenshot_path) or os.path.getsize(screenshot_path) == 0:
+        return PLACEHOLDER_SCREENSHOT_URL
+
+    presentation_images_dir = os.path.join(
+        get_images_directory(), str(presentation_id)
+    )
+    os.makedirs(presentation_images_dir, exist_ok=True)
+
+    screenshot_filename = f"slide_{slide_number}.png"
+    # Use shutil.copy2 instead of os.rename to handle cross-device moves
+    shutil.copy2(
+        screenshot_path, os.path.join(presentation_images_dir, screenshot_filename)
+    )
+    return f"/app_data/images/{presentation_id}/{screenshot_filename}"
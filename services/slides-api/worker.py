@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import os
+from typing import Optional
+
+from services.database import create_db_and_tables
+from services.presentation_job_worker import PresentationJobWorkerPool
+from utils.get_env import get_app_data_directory_env
+
+
+async def run_workers(n_workers: Optional[int]):
+    os.makedirs(get_app_data_directory_env(), exist_ok=True)
+    await create_db_and_tables()
+
+    pool = PresentationJobWorkerPool(n_workers)
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run presentation generation workers"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of concurrent workers"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_workers(args.workers))
@@ -1,11 +1,12 @@
-import { useEffect, useRef } from "react";
+import { useEffect } from "react";
 import { useDispatch } from "react-redux";
 import {
   clearPresentationData,
+  PresentationData,
   setPresentationData,
   setStreaming,
 } from "@/store/slides-store/slices/presentationGeneration";
-import { jsonrepair } from "jsonrepair";
+import { Slide } from "@/app/(super-admin)/admin/slides/types/slide";
 import { toast } from "sonner";
 import { MixpanelEvent, trackEvent } from "@/utils/slides/mixpanel";
 
@@ -17,11 +18,11 @@ export const usePresentationStreaming = (
   fetchUserSlides: () => void
 ) => {
   const dispatch = useDispatch();
-  const previousSlidesLength = useRef(0);
 
   useEffect(() => {
     let eventSource: EventSource;
-    let accumulatedChunks = "";
+    // Slides are generated concurrently and arrive out of order
+    const readySlides = new Map<number, Slide>();
 
     const initializeStream = async () => {
       dispatch(setStreaming(true));
@@ -37,30 +38,16 @@ export const usePresentationStreaming = (
         const data = JSON.parse(event.data);
 
         switch (data.type) {
-          case "chunk":
-            accumulatedChunks += data.chunk;
-            try {
-              const repairedJson = jsonrepair(accumulatedChunks);
-              const partialData = JSON.parse(repairedJson);
-
-              if (partialData.slides) {
-                if (
-                  partialData.slides.length !== previousSlidesLength.current &&
-                  partialData.slides.length > 0
-                ) {
-                  dispatch(
-                    setPresentationData({
-                      ...partialData,
-                      slides: partialData.slides,
-                    })
-                  );
-                  previousSlidesLength.current = partialData.slides.length;
-                  setLoading(false);
-                }
-              }
-            } catch (error) {
-              // JSON isn't complete yet, continue accumulating
-            }
+          case "slide_ready":
+            readySlides.set(data.index, data.slide);
+            dispatch(
+              setPresentationData({
+                slides: Array.from(readySlides.entries())
+                  .sort(([a], [b]) => a - b)
+                  .map(([, slide]) => slide),
+              } as PresentationData)
+            );
+            setLoading(false);
             break;
 
           case "complete":
@@ -76,9 +63,9 @@ export const usePresentationStreaming = (
               window.history.replaceState({}, "", newUrl.toString());
             } catch (error) {
               eventSource.close();
-              console.error("Error parsing accumulated chunks:", error);
+              console.error("Error loading streamed presentation:", error);
             }
-            accumulatedChunks = "";
+            readySlides.clear();
             break;
 
           case "closing":
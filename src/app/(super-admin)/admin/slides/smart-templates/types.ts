@@ -6,6 +6,7 @@ export interface SmartTemplate {
   slide_count: number;
   fonts?: string[];
   thumbnail_url?: string;
+  thumbnail_etag?: string;
   created_at: string;
 }
 
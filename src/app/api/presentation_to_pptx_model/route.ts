@@ -19,6 +19,8 @@ const SLIDE_WIDTH = 1280;
 const SLIDE_HEIGHT = 720;
 
 // Template color schemes - matching the React templates
+// Copied in services/slides-api/utils/pptx_model_utils.py, kept in sync by
+// services/slides-api/tests/test_template_parity.py
 interface TemplateColors {
   primary: string;        // Primary accent color
   titleColor: string;     // Title text color
@@ -407,6 +409,7 @@ function convertSlideContentToPptxShapes(
 }
 
 // Convert presentation to PPTX model
+// Mirrored by presentation_to_pptx_model in services/slides-api/utils/pptx_model_utils.py
 function convertPresentationToPptxModel(presentation: PresentationWithSlides): PptxPresentationModel {
   const slides: PptxSlideModel[] = presentation.slides.map((slide) => {
     const shapes = convertSlideContentToPptxShapes(
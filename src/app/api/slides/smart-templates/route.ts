@@ -4,6 +4,7 @@
  */
 
 import { NextResponse } from "next/server";
+import { proxyTemplateListThumbnails } from "@/lib/slides/smart-template-thumbnails";
 
 const BACKEND_URL = process.env.SLIDES_API_URL || "http://localhost:8000";
 
@@ -33,7 +34,7 @@ async function proxyToBackend(
 export async function GET() {
   try {
     const response = await proxyToBackend("/api/v1/ppt/smart-templates/templates");
-    const data = await response.json();
+    const data = proxyTemplateListThumbnails(await response.json());
     return NextResponse.json(data, { status: response.status });
   } catch (error) {
     console.error("Error listing smart templates:", error);
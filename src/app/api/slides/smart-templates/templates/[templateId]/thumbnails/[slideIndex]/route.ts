@@ -0,0 +1,41 @@
+/**
+ * Smart Templates - Get Slide Thumbnail Route
+ */
+
+import { NextResponse } from "next/server";
+
+const BACKEND_URL = process.env.SLIDES_API_URL || "http://localhost:8000";
+
+// GET /api/slides/smart-templates/templates/[templateId]/thumbnails/[slideIndex] - Get a slide thumbnail
+export async function GET(
+  request: Request,
+  { params }: { params: Promise<{ templateId: string; slideIndex: string }> }
+) {
+  const { templateId, slideIndex } = await params;
+  const { search } = new URL(request.url);
+
+  try {
+    const ifNoneMatch = request.headers.get("if-none-match");
+    const response = await fetch(
+      `${BACKEND_URL}/api/v1/ppt/smart-templates/templates/${templateId}/thumbnails/${slideIndex}${search}`,
+      {
+        method: "GET",
+        headers: ifNoneMatch ? { "If-None-Match": ifNoneMatch } : {},
+      }
+    );
+
+    // Keeps the validators so browsers cache the thumbnails
+    const headers = new Headers();
+    for (const name of ["content-type", "etag", "cache-control"]) {
+      const value = response.headers.get(name);
+      if (value) headers.set(name, value);
+    }
+    return new NextResponse(response.body, { status: response.status, headers });
+  } catch (error) {
+    console.error("Error fetching thumbnail:", error);
+    return NextResponse.json(
+      { error: "Failed to fetch thumbnail" },
+      { status: 500 }
+    );
+  }
+}
@@ -3,6 +3,7 @@
  */
 
 import { NextResponse } from "next/server";
+import { proxyTemplateListThumbnails } from "@/lib/slides/smart-template-thumbnails";
 
 const BACKEND_URL = process.env.SLIDES_API_URL || "http://localhost:8000";
 
@@ -16,7 +17,7 @@ export async function GET() {
       },
     });
 
-    const data = await response.json();
+    const data = proxyTemplateListThumbnails(await response.json());
     return NextResponse.json(data, { status: response.status });
   } catch (error) {
     console.error("Error listing templates:", error);
@@ -6,6 +6,8 @@
 import { NextRequest, NextResponse } from "next/server";
 
 // Schema des layouts pour chaque groupe de templates
+// Copied in services/slides-api/constants/template_layouts.py, kept in sync by
+// services/slides-api/tests/test_template_parity.py
 const TEMPLATE_LAYOUTS: Record<string, {
   name: string;
   ordered: boolean;
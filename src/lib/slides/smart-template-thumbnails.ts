@@ -0,0 +1,58 @@
+/**
+ * Smart template thumbnail URLs point at the FastAPI backend, browsers load
+ * them through the /api/slides/smart-templates proxy routes instead
+ */
+
+const BACKEND_PREFIX = "/api/v1/ppt/smart-templates/";
+const PROXY_PREFIX = "/api/slides/smart-templates/";
+
+interface ThumbnailInfo {
+  url: string;
+  etag: string;
+}
+
+interface TemplateThumbnail {
+  index: number;
+  image: string;
+  etag: string;
+  sizes: Record<string, ThumbnailInfo | null>;
+}
+
+function toProxyUrl(url: string | null): string | null {
+  if (typeof url !== "string" || !url.startsWith(BACKEND_PREFIX)) {
+    return url;
+  }
+  return PROXY_PREFIX + url.slice(BACKEND_PREFIX.length);
+}
+
+// Response of GET /api/v1/ppt/smart-templates/templates
+export function proxyTemplateListThumbnails(data: unknown): unknown {
+  if (!Array.isArray(data)) {
+    return data;
+  }
+  return data.map((template: { thumbnail_url: string | null }) => ({
+    ...template,
+    thumbnail_url: toProxyUrl(template.thumbnail_url),
+  }));
+}
+
+// Response of GET /api/v1/ppt/smart-templates/templates/{id}/thumbnails
+export function proxyTemplateThumbnails(data: unknown): unknown {
+  const thumbnails = (data as { thumbnails?: TemplateThumbnail[] })?.thumbnails;
+  if (!Array.isArray(thumbnails)) {
+    return data;
+  }
+  return {
+    ...(data as object),
+    thumbnails: thumbnails.map((thumbnail) => ({
+      ...thumbnail,
+      image: toProxyUrl(thumbnail.image),
+      sizes: Object.fromEntries(
+        Object.entries(thumbnail.sizes ?? {}).map(([size, info]) => [
+          size,
+          info && { ...info, url: toProxyUrl(info.url) },
+        ])
+      ),
+    })),
+  };
+}